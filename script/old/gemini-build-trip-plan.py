@@ -1,7 +1,11 @@
 import os
 import re
+import sys
+import time
+import argparse
 from pathlib import Path
 import mistune
+from mistune.core import BlockState
 from bs4 import BeautifulSoup
 from datetime import datetime
 import html # For escaping/unescaping HTML entities
@@ -12,9 +16,6 @@ CONTENT_DIR = SCRIPT_DIR.parent / "content"
 BUILD_DIR = SCRIPT_DIR.parent / "build"
 TEMPLATE_FILE = SCRIPT_DIR / "assets/gemini-template-skeleton.html"
 
-# Ensure build directory exists
-BUILD_DIR.mkdir(parents=True, exist_ok=True)
-
 def read_file(filepath):
     """Reads file content and returns as string."""
     try:
@@ -83,6 +84,16 @@ class RobustMarkdownParser(mistune.Markdown):
 # Initialize mistune with the custom renderer globally
 markdown_parser = RobustMarkdownParser(renderer=MultiLangRenderer())
 
+
+def render_inline(markdown_parser_instance, text):
+    """
+    Renders a single line of inline Markdown to an HTML fragment.
+    (mistune 2.x/3.x's `Markdown.inline` is the inline *parser* and needs a state/env,
+    so calling it with just the text raises TypeError.)
+    """
+    tokens = markdown_parser_instance.inline(text, {})
+    return markdown_parser_instance.renderer(tokens, BlockState())
+
 # Placeholder for custom box data
 TEMP_BOX_PLACEHOLDER_TAG = "div"
 TEMP_BOX_CLASS = "custom-box-placeholder"
@@ -130,7 +141,7 @@ def finalize_custom_boxes_from_placeholders(soup, markdown_parser_instance):
         box_content_html = placeholder.decode_contents().strip()
 
         # Parse the title markdown (which might contain lang spans) to an HTML fragment
-        title_html_fragment = markdown_parser_instance.inline(title_md_raw)
+        title_html_fragment = render_inline(markdown_parser_instance, title_md_raw)
         title_soup_frag = BeautifulSoup(title_html_fragment, 'html.parser')
         
         th_title_text = title_soup_frag.find('span', class_='th').decode_contents().strip() if title_soup_frag.find('span', class_='th') else title_soup_frag.get_text(strip=True)
@@ -231,6 +242,131 @@ def markdown_to_html_with_structure(markdown_text_input, markdown_parser_instanc
     return str(soup)
 
 
+# --- Fast structure backend: renderer hooks instead of a BeautifulSoup round-trip ---
+
+BOX_PLACEHOLDER_PATTERN = re.compile(
+    rf'<{TEMP_BOX_PLACEHOLDER_TAG} class="{TEMP_BOX_CLASS}" data-box-type="(?P<type>[^"]*)" '
+    r'data-title-md="(?P<title>[^"]*)">\n(?P<content>.*)\n'
+    rf'</{TEMP_BOX_PLACEHOLDER_TAG}>(?P<tail>\n?)',
+    re.DOTALL
+)
+HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+# Raw HTML the hooks cannot restructure without a DOM (the soup pass would touch these)
+DOM_ONLY_HTML_PATTERN = re.compile(r'<(?:ul|table)\b', re.IGNORECASE)
+# Markup inside box content: soup re-nests it inside the final box, so leave those sections to soup
+RAW_TAG_PATTERN = re.compile(r'<[A-Za-z/!?]')
+
+
+def fragment_text(html_fragment):
+    """Equivalent of BeautifulSoup(html_fragment).get_text(strip=True) for tag-only markup."""
+    pieces = (html.unescape(piece).strip() for piece in HTML_TAG_PATTERN.split(html_fragment))
+    return ''.join(piece for piece in pieces if piece)
+
+
+class StructureHooksRenderer(MultiLangRenderer):
+    """
+    MultiLangRenderer that applies the structural post-processing while mistune renders:
+    - custom box placeholders become the final info/note box HTML (block_html hook)
+    - <ul> gets class="timeline" when most of its <li> start with <strong> and contain ':'
+      (list_item records a score per item, list() decides)
+
+    Anything the soup pass would change but these hooks cannot (raw HTML blocks with
+    <ul>/<table>, spans in box titles) sets needs_dom_pass so the caller can fall back.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.markdown_parser_instance = None
+        self.reset()
+
+    def reset(self):
+        self.needs_dom_pass = False
+        self._list_scores = []
+
+    def render_token(self, token, state):
+        if token['type'] == 'list':
+            # one frame per list; nested lists push/pop their own frame before the outer item finishes
+            self._list_scores.append([])
+        return super().render_token(token, state)
+
+    def list_item(self, text):
+        # soup: first child of the <li> is <strong> and ':' in li.get_text()
+        is_candidate = text.startswith('<strong>') and ':' in html.unescape(HTML_TAG_PATTERN.sub('', text))
+        self._list_scores[-1].append(is_candidate)
+        return super().list_item(text)
+
+    def list(self, text, ordered, **attrs):
+        scores = self._list_scores.pop()
+        if not ordered and scores and (sum(scores) / len(scores)) > 0.5:
+            return '<ul class="timeline">\n' + text + '</ul>\n'
+        return super().list(text, ordered, **attrs)
+
+    def block_html(self, html_block):
+        match = BOX_PLACEHOLDER_PATTERN.fullmatch(html_block)
+        if match and not RAW_TAG_PATTERN.search(match.group('content')):
+            box_html = self._render_box(match)
+            if box_html is not None:
+                # the newline after the placeholder stays in the document, as with replace_with()
+                return box_html + match.group('tail')
+        if DOM_ONLY_HTML_PATTERN.search(html_block) or TEMP_BOX_CLASS in html_block:
+            self.needs_dom_pass = True
+        return super().block_html(html_block)
+
+    def _render_box(self, match):
+        """Same markup as finalize_custom_boxes_from_placeholders builds for one placeholder."""
+        box_type = match.group('type')
+        # attribute value is unescaped once by the HTML parser and once more by the soup path
+        title_md_raw = html.unescape(html.unescape(match.group('title')))
+        title_html_fragment = render_inline(self.markdown_parser_instance, title_md_raw)
+        if '<span' in title_html_fragment:
+            return None
+        th_title_text = en_title_text = jp_title_text = fragment_text(title_html_fragment)
+        box_content_html = match.group('content').strip()
+
+        toggle_html = f'''
+            <div class="{box_type}-toggle">
+                <span class="th">{th_title_text}</span>
+                <span class="en">{en_title_text}</span>
+                <span class="jp">{jp_title_text}</span>
+            </div>
+        '''
+
+        return f'''
+            <div class="{box_type}-box">
+                {toggle_html}
+                <div class="{box_type}-detail">
+                    {box_content_html}
+                </div>
+            </div>
+        '''
+
+
+hooks_renderer = StructureHooksRenderer()
+hooks_markdown_parser = RobustMarkdownParser(renderer=hooks_renderer)
+hooks_renderer.markdown_parser_instance = hooks_markdown_parser
+
+
+def markdown_to_html_with_hooks(markdown_text_input, markdown_parser_instance=None):
+    """
+    Fast path of markdown_to_html_with_structure: one mistune render with StructureHooksRenderer,
+    no BeautifulSoup parse. Sections the hooks cannot handle fall back to the soup path.
+    Parsed with html.parser (as build_full_html_plan does), the result is the same document
+    as the soup path's output.
+    """
+    md_with_placeholders = convert_custom_boxes_to_placeholders(markdown_text_input)
+    hooks_renderer.reset()
+    html_output = hooks_markdown_parser(md_with_placeholders)
+    if hooks_renderer.needs_dom_pass:
+        return markdown_to_html_with_structure(markdown_text_input, markdown_parser)
+    return html_output
+
+
+STRUCTURE_BACKENDS = {
+    'soup': markdown_to_html_with_structure,
+    'hooks': markdown_to_html_with_hooks,
+}
+
+
 def create_day_overview_cards(markdown_contents_map):
     """
     Creates day overview cards for the main overview section.
@@ -274,7 +410,7 @@ def create_day_overview_cards(markdown_contents_map):
                 break
         
         if temp_md_for_desc:
-            processed_desc_html = markdown_parser.inline(temp_md_for_desc)
+            processed_desc_html = render_inline(markdown_parser, temp_md_for_desc)
             desc_soup = BeautifulSoup(processed_desc_html, 'html.parser')
             
             th_span = desc_soup.find('span', class_='th')
@@ -318,7 +454,7 @@ def create_day_overview_cards(markdown_contents_map):
         for line in budget_content_lines:
             stripped_line = line.strip()
             if stripped_line and not stripped_line.startswith(('#', '|', '-', '*')) and not stripped_line.startswith(('💰')):
-                processed_line_html = markdown_parser.inline(stripped_line)
+                processed_line_html = render_inline(markdown_parser, stripped_line)
                 line_soup = BeautifulSoup(processed_line_html, 'html.parser')
 
                 th_span = line_soup.find('span', class_='th')
@@ -470,11 +606,16 @@ def generate_accommodation_overview(markdown_contents_map):
     return overview_html
 
 
-def build_full_html_plan():
+def build_full_html_plan(structure_backend='soup'):
     """
     Builds the complete HTML trip plan by combining template, markdown content,
     and inlining CSS/JS.
+    structure_backend: 'soup' (BeautifulSoup post-processing) or 'hooks' (renderer hooks, faster)
     """
+    markdown_to_html = STRUCTURE_BACKENDS[structure_backend]
+    # Ensure build directory exists
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+
     # 1. Read the refactored template HTML
     template_html_content = read_file(TEMPLATE_FILE)
     template_soup = BeautifulSoup(template_html_content, 'html.parser')
@@ -709,7 +850,7 @@ def build_full_html_plan():
             body_markdown_match = re.search(r'#+\s+[^\n]+\n(.*)', markdown_text, re.DOTALL)
             body_markdown_content = body_markdown_match.group(1).strip() if body_markdown_match else markdown_text.strip()
 
-            processed_body_html = markdown_to_html_with_structure(body_markdown_content, markdown_parser)
+            processed_body_html = markdown_to_html(body_markdown_content, markdown_parser)
             
             div_tag.clear()
             if title_html_tag:
@@ -774,5 +915,60 @@ def extract_multilang_title_from_line(title_line):
     return th_title, en_title
 
 
+def benchmark_structure_backends(content_dir=None, repeat=5):
+    """
+    Times the soup and hooks backends on every content Markdown file (body after the title line)
+    and checks that both give the same document once parsed.
+    """
+    content_dir = Path(content_dir) if content_dir else SCRIPT_DIR.parent.parent / "content"
+    bodies = {}
+    for md_file_path in sorted(content_dir.rglob('*.md')):
+        markdown_text = read_file(md_file_path)
+        body_markdown_match = re.search(r'#+\s+[^\n]+\n(.*)', markdown_text, re.DOTALL)
+        bodies[md_file_path] = body_markdown_match.group(1).strip() if body_markdown_match else markdown_text.strip()
+    if not bodies:
+        print(f"Error: No Markdown files found in {content_dir}")
+        return False
+
+    # build_full_html_plan parses each section's HTML into the template, so compare parsed documents
+    mismatches = [
+        path for path, body in bodies.items()
+        if str(BeautifulSoup(markdown_to_html_with_hooks(body), 'html.parser'))
+        != str(BeautifulSoup(markdown_to_html_with_structure(body, markdown_parser), 'html.parser'))
+    ]
+
+    timings = {}
+    for name, markdown_to_html in STRUCTURE_BACKENDS.items():
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for body in bodies.values():
+                markdown_to_html(body, markdown_parser)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+
+    total_kb = sum(len(body.encode('utf-8')) for body in bodies.values()) / 1024
+    print(f"Structure backends: {len(bodies)} files ({total_kb:.1f} KB), best of {repeat}")
+    for name, seconds in timings.items():
+        print(f"   - {name:<5}: {seconds * 1000:8.1f} ms")
+    print(f"   - speedup: {timings['soup'] / timings['hooks']:.2f}x")
+    if mismatches:
+        print(f"❌ Output differs for {len(mismatches)} files: {', '.join(p.name for p in mismatches)}")
+        return False
+    print("✅ Same document from both backends")
+    return True
+
+
 # Run the build process
-build_full_html_plan()
\ No newline at end of file
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Build the Gemini-style trip plan HTML")
+    arg_parser.add_argument('--structure', choices=list(STRUCTURE_BACKENDS), default='soup',
+                            help="post-processing backend: soup (BeautifulSoup) or hooks (renderer hooks, no re-parse)")
+    arg_parser.add_argument('--benchmark', action='store_true',
+                            help="compare the soup and hooks backends on content/**/*.md instead of building")
+    arg_parser.add_argument('--content-dir', help="content directory for --benchmark")
+    args = arg_parser.parse_args()
+    if args.benchmark:
+        sys.exit(0 if benchmark_structure_backends(args.content_dir) else 1)
+    build_full_html_plan(args.structure)
\ No newline at end of file
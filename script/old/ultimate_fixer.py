@@ -11,18 +11,22 @@ Version: Ultimate Fixer
 For: Arilek & Pojai's Tokyo Trip 2026
 """
 
-import os
-import re
+import sys
 import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tokyo_trip.rewrite import ReplaceContent, SetAttributes, rewrite_file, latest_build
+
 
 class UltimateFixer:
     """แก้ไข expand/collapse ให้ทำงานได้"""
     
     def __init__(self):
         self.script_dir = Path(__file__).parent
-        self.build_dir = self.script_dir.parent / "build"
+        # script/old/ -> <project>/build
+        self.build_dir = self.script_dir.parent.parent / "build"
     
     def get_fixed_css(self) -> str:
         """CSS ที่ทำงานได้จริง"""
@@ -553,61 +557,42 @@ class UltimateFixer:
         """
 
     def find_latest_html(self) -> Path:
-        """หาไฟล์ HTML ล่าสุด"""
-        html_files = list(self.build_dir.glob("Tokyo-Trip-March-2026-*.html"))
-        
-        if not html_files:
+        """หาไฟล์ HTML ล่าสุด (จาก timestamp ในชื่อไฟล์)"""
+        try:
+            latest = latest_build(self.build_dir, "Tokyo-Trip-March-2026-")
+        except FileNotFoundError:
             raise FileNotFoundError("❌ No HTML files found to fix!")
         
-        latest = max(html_files, key=lambda f: f.stat().st_mtime)
         print(f"📖 Found latest file: {latest.name}")
         return latest
 
-    def fix_html_file(self, html_path: Path) -> str:
-        """แก้ไขไฟล์ HTML ให้ทำงานได้"""
+    def get_rules(self) -> list:
+        """Rewrite rules: CSS, JavaScript, ปุ่มเปลี่ยนภาษา (ใช้ใน pass เดียว)"""
+        return [
+            ReplaceContent('style', self.get_fixed_css(), bare=True),
+            ReplaceContent('script', self.get_fixed_js(), bare=True),
+            SetAttributes('button', {'data-lang': 'th', 'class': 'active'}, match={'data-lang': 'th'}, replace=True),
+            SetAttributes('button', {'data-lang': 'en'}, match={'data-lang': 'en'}, replace=True),
+        ]
+
+    def fix_html_file(self, html_path: Path, output_path: Path) -> Path:
+        """แก้ไขไฟล์ HTML ให้ทำงานได้ (streaming - ไม่โหลดทั้งไฟล์)"""
         print(f"🔧 Fixing {html_path.name}...")
         
-        with open(html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Replace CSS
-        css_pattern = r'<style>(.*?)</style>'
-        new_css = f"<style>{self.get_fixed_css()}</style>"
-        content = re.sub(css_pattern, new_css, content, flags=re.DOTALL)
-        print("✅ Fixed CSS")
-        
-        # Replace JavaScript  
-        js_pattern = r'<script>(.*?)</script>'
-        new_js = f"<script>{self.get_fixed_js()}</script>"
-        content = re.sub(js_pattern, new_js, content, flags=re.DOTALL)
-        print("✅ Fixed JavaScript")
-        
-        # Fix language switcher buttons
-        content = re.sub(
-            r'<button[^>]*data-lang="th"[^>]*>',
-            '<button data-lang="th" class="active">',
-            content
-        )
-        content = re.sub(
-            r'<button[^>]*data-lang="en"[^>]*>',
-            '<button data-lang="en">',
-            content
-        )
-        print("✅ Fixed language switcher")
+        css_rule, js_rule, th_rule, en_rule = rules = self.get_rules()
+        rewrite_file(html_path, output_path, rules)
+        print(f"✅ Fixed CSS ({css_rule.applied} <style>)")
+        print(f"✅ Fixed JavaScript ({js_rule.applied} <script>)")
+        print(f"✅ Fixed language switcher ({th_rule.applied + en_rule.applied} buttons)")
         
-        return content
+        print(f"💾 Saved fixed file: {output_path}")
+        return output_path
 
-    def save_fixed_file(self, content: str) -> Path:
-        """บันทึกไฟล์ที่แก้ไขแล้ว"""
+    def get_output_path(self) -> Path:
+        """ชื่อไฟล์ที่แก้ไขแล้ว"""
         timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M")
         filename = f"Tokyo-Trip-March-2026-FIXED-{timestamp}.html"
-        output_path = self.build_dir / filename
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"💾 Saved fixed file: {output_path}")
-        return output_path
+        return self.build_dir / filename
 
     def run(self):
         """รันการแก้ไข"""
@@ -620,16 +605,13 @@ class UltimateFixer:
             # หาไฟล์ล่าสุด
             latest_html = self.find_latest_html()
             
-            # แก้ไข
-            fixed_content = self.fix_html_file(latest_html)
-            
-            # บันทึก
-            output_path = self.save_fixed_file(fixed_content)
+            # แก้ไข + บันทึก
+            output_path = self.fix_html_file(latest_html, self.get_output_path())
             
             print()
             print("🎉 MISSION ACCOMPLISHED!")
             print(f"📄 Fixed file: {output_path}")
-            print(f"📊 Size: {len(fixed_content):,} characters")
+            print(f"📊 Size: {output_path.stat().st_size:,} bytes")
             print()
             print("✅ What's fixed:")
             print("   🔧 Expand/collapse info boxes (NOW WORKING)")
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Tokyo Trip generators package
+=============================
+รวม generator ทั้งหมดของทริปโตเกียวให้ import ได้โดยไม่มี side effect:
+- TokyoTripGeneratorV3   (trip_generator) - แผนเต็มจาก skeleton template
+- DayToDayTokyoGenerator (day_to_day)     - day-to-day planner
+- TokyoGuidebookGenerator (guidebook)     - guidebook แยกหมวดหมู่
+
+Generator modules ถูก import แบบ lazy (ตอนเข้าถึง attribute ครั้งแรก)
+เพื่อให้ `import tokyo_trip` ไม่ทำงานใดๆ และเร็วที่สุด
+
+CLI: python -m tokyo_trip --help
+"""
+
+__version__ = "4.1.0"
+
+# attribute name -> (module, class name)
+_GENERATORS = {
+    'TokyoTripGeneratorV3': ('trip_generator', 'TokyoTripGeneratorV3'),
+    'DayToDayTokyoGenerator': ('day_to_day', 'DayToDayTokyoGenerator'),
+    'TokyoGuidebookGenerator': ('guidebook', 'TokyoGuidebookGenerator'),
+}
+
+__all__ = list(_GENERATORS) + ['__version__']
+
+
+def __getattr__(name):
+    """Lazy import ของ generator classes"""
+    if name in _GENERATORS:
+        import importlib
+        module_name, class_name = _GENERATORS[name]
+        module = importlib.import_module(f'{__name__}.{module_name}')
+        return getattr(module, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""python -m tokyo_trip"""
+
+from tokyo_trip.cli import main
+
+if __name__ == "__main__":
+    main()
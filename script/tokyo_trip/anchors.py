@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Anchor / ID Integrity Check
+===========================
+ตรวจไฟล์ HTML ที่ build แล้วว่า id ทุกตัวไม่ซ้ำ และทุก reference ชี้ไปยัง id ที่มีอยู่จริง
+
+- nav card / guidebook nav: href="#{section_id}"
+- timeline toggle: onclick="toggleTimelineDetail('th-itinerary-timeline-time-1a2b3c4d')" (id ต่อภาษา + section)
+- guidebook section: onclick="toggleSection('{section_key}')", day-to-day: onclick="toggleDay(3)" -> day3, day-content-3
+
+อ่านไฟล์รอบเดียวทีละ chunk แล้ว scan tag ด้วย regex (ไม่ parse DOM) - ไฟล์ 1.1 MB ใช้เวลาหลักสิบ ms
+เนื้อหาใน <script>/<style> และ comment ไม่ถูกนับ (เช่น HTML ที่ JS ประกอบเป็น string)
+
+ใช้งาน:
+    python -m tokyo_trip check-anchors                 # build ล่าสุดของทุก generator
+    python -m tokyo_trip check-anchors build/x.html    # exit code 1 = มี id ซ้ำ / reference ค้าง
+
+    check = check_anchors(output_path)
+    if not check.ok:
+        print_anchor_report(check)
+"""
+
+import re
+import time
+from pathlib import Path
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+# comment / <script> / <style> (ทั้ง element) / start tag ที่มี id, href หรือ onclick
+# tag ที่ไม่มี attribute เหล่านี้ไม่ match เลย - ไม่ต้องวน Python ทุก tag (ไฟล์ trip มี ~17,000 tags)
+TAG_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style)\b([^>]*)>.*?</\1\s*>'
+    r'|<[a-zA-Z][\w-]*(\s(?:[^>]*?\s)?(?:id|href|onclick)\s*=[^>]*)>',
+    re.DOTALL | re.IGNORECASE
+)
+# element ที่ยังไม่จบใน chunk นี้ (ต้องรอ chunk ถัดไป)
+OPEN_BLOCK_PATTERN = re.compile(r'<(?:script|style)\b|<!--', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'''\s(id|href|onclick)\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+CALL_PATTERN = re.compile(r"(\w+)\(\s*(?:'([^']*)'|(\d+))\s*\)")
+
+# onclick function -> id ที่ argument อ้างถึง ('{}' = argument เอง)
+ONCLICK_TARGETS = {
+    'toggleTimelineDetail': ('{}',),
+    'toggleSection': ('{}',),
+    'toggleDay': ('day{}', 'day-content-{}'),
+}
+
+
+class AnchorCheck:
+    """ผลตรวจหนึ่งไฟล์: id -> บรรทัดที่ประกาศ, reference -> บรรทัดที่อ้างถึง"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.ids = {}
+        self.references = {}
+        self.reference_count = 0
+        self.seconds = 0.0
+
+    def add_id(self, value, line):
+        self.ids.setdefault(value, []).append(line)
+
+    def add_reference(self, target, line, via):
+        self.references.setdefault(target, []).append((line, via))
+        self.reference_count += 1
+
+    @property
+    def duplicates(self):
+        """{id: [บรรทัด, ...]} ของ id ที่ประกาศมากกว่าหนึ่งครั้ง"""
+        return {value: lines for value, lines in self.ids.items() if len(lines) > 1}
+
+    @property
+    def dangling(self):
+        """{target: [(บรรทัด, attribute), ...]} ของ reference ที่ไม่มี id ปลายทาง"""
+        return {target: refs for target, refs in self.references.items() if target not in self.ids}
+
+    @property
+    def ok(self):
+        return not self.duplicates and not self.dangling
+
+    def summary(self):
+        return (f"{len(self.ids)} ids, {self.reference_count} references, "
+                f"{len(self.duplicates)} duplicate, {len(self.dangling)} dangling "
+                f"({self.seconds * 1000:.1f} ms)")
+
+
+def _scan_attributes(check, attrs, line):
+    for match in ATTR_PATTERN.finditer(attrs):
+        name = match.group(1).lower()
+        value = match.group(2) if match.group(2) is not None else match.group(3)
+        if name == 'id':
+            check.add_id(value, line)
+        elif name == 'href':
+            if value.startswith('#') and len(value) > 1:
+                check.add_reference(value[1:], line, 'href')
+        else:
+            for call in CALL_PATTERN.finditer(value):
+                argument = call.group(2) if call.group(2) is not None else call.group(3)
+                for template in ONCLICK_TARGETS.get(call.group(1), ()):
+                    check.add_reference(template.format(argument), line, call.group(1))
+
+
+def check_stream(source, path='<stream>', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Scan text stream ทีละ chunk -> AnchorCheck (tag ที่ถูกตัดกลาง chunk ถูกยกไป chunk ถัดไป)"""
+    check = AnchorCheck(path)
+    start = time.perf_counter()
+    buffer = ''
+    line = 1
+    while True:
+        chunk = source.read(chunk_size)
+        buffer += chunk
+        pos = 0
+        for match in TAG_PATTERN.finditer(buffer):
+            line += buffer.count('\n', pos, match.start())
+            pos = match.start()
+            attrs = match.group(2) if match.group(1) else match.group(3)
+            if attrs:
+                _scan_attributes(check, attrs, line)
+            line += buffer.count('\n', pos, match.end())
+            pos = match.end()
+        if not chunk:
+            break
+
+        # ยกส่วนท้ายที่อาจเป็น tag/script/comment ที่ยังไม่จบไป chunk ถัดไป
+        rest_start = pos
+        block = OPEN_BLOCK_PATTERN.search(buffer, pos)
+        if block:
+            rest_start = block.start()
+        else:
+            last_open = buffer.rfind('<', pos)
+            if last_open != -1 and buffer.find('>', last_open) == -1:
+                rest_start = last_open
+        line += buffer.count('\n', pos, rest_start)
+        buffer = buffer[rest_start:]
+    check.seconds = time.perf_counter() - start
+    return check
+
+
+def check_anchors(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ตรวจไฟล์ HTML หนึ่งไฟล์ -> AnchorCheck"""
+    with open(path, 'r', encoding='utf-8') as source:
+        return check_stream(source, path, chunk_size)
+
+
+def print_anchor_report(check, limit=10):
+    """แสดงผลตรวจ + id ซ้ำ / reference ค้างไม่เกิน limit รายการต่อประเภท"""
+    status = "✅" if check.ok else "❌"
+    print(f"{status} {check.path.name}: {check.summary()}")
+    duplicates = check.duplicates
+    for value, lines in list(duplicates.items())[:limit]:
+        print(f"   - duplicate id '{value}' x{len(lines)} (lines {', '.join(str(n) for n in lines[:5])})")
+    if len(duplicates) > limit:
+        print(f"   ... {len(duplicates) - limit} more duplicate ids")
+    dangling = check.dangling
+    for target, refs in list(dangling.items())[:limit]:
+        line, via = refs[0]
+        print(f"   - dangling reference '{target}' ({via}, line {line}"
+              f"{f', +{len(refs) - 1} more' if len(refs) > 1 else ''})")
+    if len(dangling) > limit:
+        print(f"   ... {len(dangling) - limit} more dangling references")
+
+
+# prefix ของไฟล์ build ของแต่ละ generator (ค่าเริ่มต้นของ check-anchors)
+BUILD_PREFIXES = (
+    'Tokyo-Trip-March-2026-v3.1-',
+    'Tokyo-Trip-Day-to-Day-v4.0-',
+    'Tokyo-Trip-Guidebook-v1.0-',
+)
+
+
+def run_anchor_check(paths=None, build_dir=None):
+    """ตรวจไฟล์ที่ระบุ (ค่าเริ่มต้น = build ล่าสุดของแต่ละ generator) -> exit code"""
+    from tokyo_trip.rewrite import latest_build
+
+    if not paths:
+        build_dir = Path(build_dir) if build_dir else Path(__file__).resolve().parent.parent.parent / "build"
+        paths = []
+        for prefix in BUILD_PREFIXES:
+            try:
+                paths.append(latest_build(build_dir, prefix))
+            except FileNotFoundError:
+                continue
+        if not paths:
+            print(f"❌ No builds found in {build_dir}")
+            return 1
+
+    failed = 0
+    for path in paths:
+        check = check_anchors(path)
+        print_anchor_report(check)
+        failed += not check.ok
+    return 1 if failed else 0
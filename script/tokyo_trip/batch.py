@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Trip Builds
+=================
+Build แผนเต็ม (trip generator v3.1) ของหลายทริปจาก template เดียวกันใน process เดียว
+
+trip root = directory ที่มี th/ (และ en/ ถ้ามี) เช่น content/osaka-2026
+ส่ง directory ที่รวมหลายทริปไว้ได้ด้วย (เช่น content/) - จะใช้ทุก subdirectory ที่มี th/
+
+- อ่าน skeleton template (CSS/JS ทั้งหมด) ครั้งเดียวใน process หลัก แล้วส่งให้ worker ครั้งเดียวตอนเริ่ม
+- regex ของ markdown pipeline compile ระดับ module - แต่ละ worker compile ครั้งเดียวแล้วใช้กับทุกทริป
+  (inline cache ก็ใช้ร่วมกันทุกทริปที่ worker เดียวกัน build)
+- ทริปรันบน process pool (markdown pipeline เป็นงาน CPU ล้วน - thread ติด GIL)
+- output ของแต่ละทริป: <build>/<ชื่อ trip root>-v3.1-<timestamp>.html
+- log ของ generator แต่ละทริปถูกเก็บไว้ แสดงเฉพาะทริปที่ fail + ตารางสรุปเวลา/ขนาดต่อทริป
+
+ใช้งาน:
+    python -m tokyo_trip batch content/osaka-2026 content/kyoto-2026
+    python -m tokyo_trip batch content/ --workers 4
+"""
+
+import io
+import os
+import time
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from tokyo_trip.log import configure_logging
+
+# template ของ worker process (ตั้งใน _init_worker)
+_TEMPLATE_HTML = None
+
+
+def find_trip_roots(paths):
+    """
+    ขยาย path ที่ได้รับเป็นรายการ trip root (เรียงตามที่ส่งมา ไม่ซ้ำ)
+    path ที่มี th/ = trip root เอง, ไม่มี = ใช้ subdirectory ที่มี th/
+    """
+    roots = []
+    for path in paths:
+        path = Path(path).resolve()
+        if (path / "th").is_dir():
+            candidates = [path]
+        elif path.is_dir():
+            candidates = sorted(child for child in path.iterdir() if (child / "th").is_dir())
+            if not candidates:
+                print(f"⚠️ No trip roots (directories with th/) under: {path}")
+        else:
+            print(f"⚠️ Trip root not found: {path}")
+            candidates = []
+        for candidate in candidates:
+            if candidate not in roots:
+                roots.append(candidate)
+    return roots
+
+
+def _init_worker(template_html, verbosity, log_json):
+    global _TEMPLATE_HTML
+    _TEMPLATE_HTML = template_html
+    configure_logging(verbosity, log_json)
+
+
+def build_trip(trip_root, build_dir=None, source_maps=False):
+    """
+    Build หนึ่งทริป (รันใน worker) -> dict ผลลัพธ์ (picklable)
+    stdout ของ generator ถูกเก็บไว้ใน 'output' แทนการพิมพ์ปนกันระหว่าง worker
+    """
+    from tokyo_trip.trip_generator import TokyoTripGeneratorV3
+
+    trip_root = Path(trip_root)
+    result = {'trip': trip_root.name, 'root': str(trip_root), 'path': None,
+              'size': 0, 'seconds': 0.0, 'error': None, 'output': ''}
+    captured = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(captured):
+            generator = TokyoTripGeneratorV3(trip_root, build_dir, output_prefix=f"{trip_root.name}-v3.1")
+            generator.template_html = _TEMPLATE_HTML
+            generator.source_maps = source_maps
+            output_path = generator.generate()
+        if output_path is None:
+            result['error'] = "build aborted"
+        else:
+            result['path'] = str(output_path)
+            result['size'] = output_path.stat().st_size
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    result['output'] = captured.getvalue()
+    return result
+
+
+def print_summary(results, elapsed):
+    """ตารางสรุปเวลา build และขนาด output ต่อทริป"""
+    width = max([len('Trip')] + [len(result['trip']) for result in results])
+    print(f"\n📊 Batch summary ({len(results)} trips, {elapsed:.2f} s wall)")
+    print(f"   {'Trip':<{width}}  {'Time':>9}  {'Size':>10}  Output")
+    print(f"   {'-' * width}  {'-' * 9}  {'-' * 10}  {'-' * 6}")
+    for result in results:
+        time_text = f"{result['seconds'] * 1000:.0f} ms"
+        if result['error']:
+            print(f"   {result['trip']:<{width}}  {time_text:>9}  {'-':>10}  ❌ {result['error']}")
+        else:
+            size_text = f"{result['size'] / 1024:.1f} KB"
+            print(f"   {result['trip']:<{width}}  {time_text:>9}  {size_text:>10}  {Path(result['path']).name}")
+    total = sum(result['seconds'] for result in results)
+    print(f"   {'Total':<{width}}  {total * 1000:>6.0f} ms  "
+          f"{sum(result['size'] for result in results) / 1024:>7.1f} KB")
+
+
+def run_batch(paths, build_dir=None, workers=None, verbosity=0, log_json=False, source_maps=False):
+    """
+    Build ทุกทริปใน paths บน process pool แล้วพิมพ์ตารางสรุป
+    Returns: list ของผลลัพธ์ต่อทริป (เรียงตาม trip root)
+    """
+    from tokyo_trip.trip_generator import TokyoTripGeneratorV3
+
+    configure_logging(verbosity, log_json)
+    roots = find_trip_roots(paths)
+    if not roots:
+        print("❌ No trips to build.")
+        return []
+
+    # ชื่อ output มาจากชื่อ directory - ชื่อซ้ำจะเขียนทับกันใน build dir เดียว
+    names = {}
+    for root in roots:
+        names.setdefault(root.name, []).append(root)
+    duplicates = {name: dirs for name, dirs in names.items() if len(dirs) > 1}
+    if duplicates:
+        for name, dirs in duplicates.items():
+            print(f"❌ Duplicate trip name '{name}': {', '.join(str(d) for d in dirs)}")
+        return []
+
+    template_path = TokyoTripGeneratorV3().template_path
+    print(f"📄 Reading skeleton template from: {template_path}")
+    template_html = template_path.read_text(encoding='utf-8')
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(roots)))
+    print(f"🚚 Building {len(roots)} trips with {workers} worker(s)...")
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(template_html, verbosity, log_json)
+        results = [build_trip(root, build_dir, source_maps) for root in roots]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(template_html, verbosity, log_json)) as pool:
+            futures = [pool.submit(build_trip, root, build_dir, source_maps) for root in roots]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result['error']:
+            print(f"\n❌ {result['trip']} failed - generator output:")
+            print(result['output'].rstrip() or "   (no output)")
+    print_summary(results, elapsed)
+    return results
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Tokyo Trip CLI
+==============
+CLI บางๆ สำหรับ generator ทั้งหมด - import generator เฉพาะตัวที่ถูกเรียกใช้
+
+Usage:
+    python -m tokyo_trip trip           # แผนเต็ม v3.1 (skeleton template)
+    python -m tokyo_trip day-to-day     # day-to-day planner v4.0
+    python -m tokyo_trip guidebook      # guidebook v1.0
+    python -m tokyo_trip all            # build ทั้งหมด
+    python -m tokyo_trip all --profile  # + build/report-<generator>.json (เวลา/หน่วยความจำต่อขั้นตอน)
+    python -m tokyo_trip trip --source-maps  # debug build: data-src="th/009-day7.md:42-58" + .srcmap.json
+    python -m tokyo_trip trip -vv       # + debug log ของ markdown pipeline (--log-json = JSON lines)
+    python -m tokyo_trip bench-import   # วัด python -X importtime ของ package
+    python -m tokyo_trip watch          # build trip ใหม่ทุกครั้งที่ content เปลี่ยน (block cache)
+    python -m tokyo_trip regex-check    # fuzz regex ของ markdown pipeline หา backtracking แบบ superlinear
+    python -m tokyo_trip batch content/osaka content/kyoto --workers 4   # แผนเต็มหลายทริปใน process เดียว
+    python -m tokyo_trip rewrite --style fixed.css --script fixed.js     # แทน CSS/JS ของ build ล่าสุด (streaming)
+    python -m tokyo_trip repair-syntax old/ --diff   # ซ่อม syntax error ของไฟล์ .py ทั้ง directory (--write = เขียนทับ)
+    python -m tokyo_trip check-anchors  # id ซ้ำ / href, onclick ที่ชี้ไปยัง id ที่ไม่มี ใน build ล่าสุด (exit 1 = พบปัญหา)
+    python -m tokyo_trip routes A B     # กราฟเส้นทาง/ค่าโดยสาร + ตรวจยอดรวม (+ เส้นทางถูก/เร็วที่สุดจาก A ไป B)
+    python -m tokyo_trip ical           # timeline ทุกวันเป็น .ics (หนึ่ง VEVENT ต่อ entry, เวลา JST)
+"""
+
+import sys
+import argparse
+
+# command -> (module, main function) - import ตอนเรียกใช้เท่านั้น
+COMMANDS = {
+    'trip': ('tokyo_trip.trip_generator', 'main'),
+    'day-to-day': ('tokyo_trip.day_to_day', 'main'),
+    'guidebook': ('tokyo_trip.guidebook', 'main'),
+}
+
+
+# generators ที่รองรับ --source-maps (data-src + .srcmap.json)
+SOURCE_MAP_COMMANDS = {'trip'}
+
+
+def run_command(command, profile=False, trace_memory=True, verbosity=0, log_json=False, source_maps=False):
+    """Import generator module แบบ lazy แล้วเรียก main()"""
+    import importlib
+    module_name, func_name = COMMANDS[command]
+    options = {'profile': profile, 'trace_memory': trace_memory, 'verbosity': verbosity, 'log_json': log_json}
+    if source_maps and command in SOURCE_MAP_COMMANDS:
+        options['source_maps'] = True
+    getattr(importlib.import_module(module_name), func_name)(**options)
+
+
+def build_all(profile=False, trace_memory=True, verbosity=0, log_json=False, source_maps=False):
+    """Build ทุก generator ใน process เดียว"""
+    for command in COMMANDS:
+        run_command(command, profile, trace_memory, verbosity, log_json, source_maps)
+
+
+def bench_import(module='tokyo_trip', record_path=None):
+    """
+    วัดเวลา import ด้วย `python -X importtime` (subprocess ใหม่ ไม่มี cache)
+    Returns: total cumulative microseconds ของ modules ใน package
+    """
+    import json
+    import datetime
+    import subprocess
+    from pathlib import Path
+
+    script_dir = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=script_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"❌ Import failed: {result.stderr.strip().splitlines()[-1:]}")
+        return None
+
+    # import time: self [us] | cumulative | imported package
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = [part.strip() for part in line[len('import time:'):].split('|')]
+        if len(parts) == 3 and parts[0].isdigit():
+            timings[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+
+    package_name = module.split('.')[0]
+    top_level = timings.get(module, (0, 0))[1]
+    package_self = sum(self_us for name, (self_us, _) in timings.items() if name.split('.')[0] == package_name)
+
+    print(f"⏱️ Import time for {module}:")
+    print(f"   - Cumulative: {top_level} us")
+    print(f"   - Package self time: {package_self} us")
+    print(f"   - Modules loaded: {len(timings)}")
+
+    if record_path:
+        record_path = Path(record_path)
+        history = []
+        if record_path.exists():
+            try:
+                history = json.loads(record_path.read_text(encoding='utf-8'))
+            except ValueError:
+                history = []
+        history.append({
+            'benchmark': 'importtime',
+            'module': module,
+            'cumulative_us': top_level,
+            'package_self_us': package_self,
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        })
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        record_path.write_text(json.dumps(history, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"   - Recorded to: {record_path}")
+
+    return top_level
+
+
+def rewrite_build(html_path=None, output_path=None, style_path=None, script_path=None):
+    """Post-build rewrite: แทน CSS/JS ของไฟล์ HTML (ค่าเริ่มต้น = build ล่าสุด) -> exit code"""
+    import time
+    from pathlib import Path
+    from tokyo_trip.rewrite import ReplaceContent, rewrite_file, latest_build
+
+    rules = []
+    if style_path:
+        rules.append(ReplaceContent('style', Path(style_path).read_text(encoding='utf-8'), bare=True))
+    if script_path:
+        rules.append(ReplaceContent('script', Path(script_path).read_text(encoding='utf-8'), bare=True))
+    if not rules:
+        print("❌ Nothing to rewrite (use --style and/or --script)")
+        return 1
+
+    if html_path is None:
+        html_path = latest_build(Path(__file__).resolve().parent.parent.parent / "build")
+    html_path = Path(html_path)
+    output_path = Path(output_path) if output_path else html_path.with_name(f"{html_path.stem}-rewritten.html")
+
+    print(f"🔧 Rewriting {html_path.name}...")
+    start = time.perf_counter()
+    applied = rewrite_file(html_path, output_path, rules)
+    for rule, count in applied.items():
+        print(f"   - <{rule.tag}> content replaced: {count}")
+    print(f"💾 Saved: {output_path} ({output_path.stat().st_size / 1024:.1f} KB, "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+    return 0 if all(applied.values()) else 1
+
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(prog='tokyo_trip', description='Tokyo Trip HTML generators')
+    parser.add_argument('command', choices=list(COMMANDS) + ['all', 'watch', 'bench-import', 'regex-check', 'batch', 'rewrite', 'repair-syntax', 'ical', 'check-anchors', 'routes'])
+    parser.add_argument('paths', nargs='*', metavar='PATH',
+                        help='batch: trip root ที่มี th/ (หรือ directory ที่รวมหลาย trip root); '
+                             'rewrite: ไฟล์ HTML (ค่าเริ่มต้น = build ล่าสุด); repair-syntax: ไฟล์/directory .py; '
+                             'check-anchors: ไฟล์ HTML (ค่าเริ่มต้น = build ล่าสุดของแต่ละ generator); '
+                             'routes: สถานีต้นทาง ปลายทาง')
+    parser.add_argument('--workers', type=int, help='batch / repair-syntax: จำนวน worker process (ค่าเริ่มต้น = จำนวน CPU)')
+    parser.add_argument('--build-dir', metavar='PATH', help='batch: directory ของ output (ค่าเริ่มต้น build/)')
+    parser.add_argument('--style', metavar='CSS_FILE', help='rewrite: แทนเนื้อหาของทุก <style> ที่ไม่มี attribute ด้วยไฟล์นี้')
+    parser.add_argument('--script', metavar='JS_FILE', help='rewrite: แทนเนื้อหาของทุก <script> ที่ไม่มี attribute ด้วยไฟล์นี้ (data island JSON ไม่ถูกแตะ)')
+    parser.add_argument('--write', action='store_true', help='repair-syntax: เขียนไฟล์ที่ซ่อมแล้วทับ (สำรอง .backup)')
+    parser.add_argument('--diff', action='store_true', help='repair-syntax: แสดง unified diff ของแต่ละไฟล์')
+    parser.add_argument('-o', '--output', metavar='PATH', help='rewrite: ไฟล์ผลลัพธ์ (ค่าเริ่มต้น <ชื่อเดิม>-rewritten.html); '
+                             'ical: ไฟล์ .ics (ค่าเริ่มต้น build/Tokyo-Trip-March-2026-<timestamp>.ics)')
+    parser.add_argument('--module', default='tokyo_trip', help='module ที่จะวัด (bench-import)')
+    parser.add_argument('--record', metavar='PATH', help='บันทึกผล bench-import ต่อท้ายไฟล์ JSON')
+    parser.add_argument('--profile', action='store_true', help='วัดเวลา/CPU/หน่วยความจำต่อขั้นตอน -> build/report-<generator>.json (หนึ่งไฟล์ต่อ generator)')
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help='ไม่วัด peak memory (tracemalloc ทำให้ regex ช้าลงมาก เวลาที่วัดจะใกล้ความจริงกว่า)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='log level: -v = info, -vv = debug (ค่าเริ่มต้นแสดงเฉพาะ warning)')
+    parser.add_argument('--log-json', action='store_true', help='แสดง log เป็น JSON หนึ่งบรรทัดต่อ event')
+    parser.add_argument('--source-maps', action='store_true',
+                        help='debug build: ใส่ data-src (ไฟล์:บรรทัด markdown) ให้ทุก block + sidecar .srcmap.json (trip)')
+    args = parser.parse_args(argv)
+    if args.paths and args.command not in ('batch', 'rewrite', 'repair-syntax', 'check-anchors', 'routes'):
+        parser.error(f"unexpected arguments for '{args.command}': {' '.join(args.paths)}")
+    if args.command in ('batch', 'repair-syntax') and not args.paths:
+        parser.error(f"{args.command} requires at least one path")
+    if args.command == 'rewrite' and len(args.paths) > 1:
+        parser.error("rewrite takes a single HTML file")
+    if args.command == 'routes' and len(args.paths) not in (0, 2):
+        parser.error("routes takes an origin and a destination")
+
+    trace_memory = not args.no_tracemalloc
+    if args.command == 'all':
+        build_all(args.profile, trace_memory, args.verbose, args.log_json, args.source_maps)
+    elif args.command == 'bench-import':
+        bench_import(args.module, args.record)
+    elif args.command == 'watch':
+        from tokyo_trip.trip_generator import watch
+        watch(verbosity=args.verbose, log_json=args.log_json, source_maps=args.source_maps)
+    elif args.command == 'batch':
+        from tokyo_trip.batch import run_batch
+        results = run_batch(args.paths, args.build_dir, args.workers, args.verbose, args.log_json, args.source_maps)
+        sys.exit(0 if results and not any(result['error'] for result in results) else 1)
+    elif args.command == 'rewrite':
+        sys.exit(rewrite_build(args.paths[0] if args.paths else None, args.output, args.style, args.script))
+    elif args.command == 'repair-syntax':
+        from tokyo_trip.syntax_repair import run_repair
+        sys.exit(run_repair(args.paths, args.write, args.diff, args.workers))
+    elif args.command == 'check-anchors':
+        from tokyo_trip.anchors import run_anchor_check
+        sys.exit(run_anchor_check(args.paths))
+    elif args.command == 'routes':
+        from tokyo_trip.routes import run_routes
+        sys.exit(run_routes(*args.paths))
+    elif args.command == 'ical':
+        from tokyo_trip.ical import export_ical
+        sys.exit(0 if export_ical(args.output, args.verbose, args.log_json) else 1)
+    elif args.command == 'regex-check':
+        from tokyo_trip.regex_guard import run_regex_check
+        sys.exit(run_regex_check())
+    else:
+        run_command(args.command, args.profile, trace_memory, args.verbose, args.log_json, args.source_maps)
+
+
+if __name__ == "__main__":
+    main()
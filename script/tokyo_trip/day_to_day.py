@@ -0,0 +1,1628 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Day-to-Day Tokyo Trip Generator - v4.0 (Time-Based Day Planner)
+================================================================
+สร้าง HTML ไฟล์สำหรับทริปโตเกียวแบบ day-to-day timeline ที่รวม:
+- ที่พัก (Accommodation)
+- การเดินทาง (Transportation)
+- กิจกรรม (Activities)
+- อาหาร (Food)
+ในแต่ละวันเป็นแผนงานแบบ timeline พร้อม expand/collapse รายละเอียด
+
+✨ Version 4.0 Features:
+- Day-to-day timeline structure
+- Integrated accommodation, transport, activities per day
+- Collapsible overview/details sections
+- SPA functionality with printer-friendly mode
+- Responsive design for mobile/desktop
+- Clean, modern UI focused on daily planning
+
+Author: Claude AI Assistant (Day-to-Day Redesign)
+Date: 23 August 2025
+Version: 4.0.0-day-to-day-timeline
+"""
+
+import os
+import re
+import json
+import datetime
+from pathlib import Path
+
+from tokyo_trip.instrument import BuildProfiler, profiled
+from tokyo_trip.log import configure_logging
+from tokyo_trip.fragments import Fragments
+from tokyo_trip.inline import format_inline
+from tokyo_trip.loader import ContentLoader
+from tokyo_trip.timeline_check import analyze_timelines, print_timeline_report, timeline_badges_html
+from tokyo_trip.anchors import check_anchors
+from tokyo_trip.weather import build_clothing_index
+
+# เดือนภาษาไทย (ชื่อเต็มและตัวย่อ) -> เลขเดือน
+THAI_MONTHS = {
+    'มกราคม': 1, 'ม.ค.': 1,
+    'กุมภาพันธ์': 2, 'ก.พ.': 2,
+    'มีนาคม': 3, 'มี.ค.': 3,
+    'เมษายน': 4, 'เม.ย.': 4,
+    'พฤษภาคม': 5, 'พ.ค.': 5,
+    'มิถุนายน': 6, 'มิ.ย.': 6,
+    'กรกฎาคม': 7, 'ก.ค.': 7,
+    'สิงหาคม': 8, 'ส.ค.': 8,
+    'กันยายน': 9, 'ก.ย.': 9,
+    'ตุลาคม': 10, 'ต.ค.': 10,
+    'พฤศจิกายน': 11, 'พ.ย.': 11,
+    'ธันวาคม': 12, 'ธ.ค.': 12,
+}
+
+# "6 มีนาคม 2026", "8 มี.ค.", "8-10 มี.ค."
+THAI_DATE_PATTERN = re.compile(
+    r'(\d{1,2})(?:\s*-\s*(\d{1,2}))?\s*('
+    + '|'.join(re.escape(m) for m in sorted(THAI_MONTHS, key=len, reverse=True))
+    + r')(?:\s*(\d{4}))?'
+)
+
+# timeline entry: "- **HH:MM**: ..." หรือ "- **HH:MM-HH:MM**: ..."
+TIMELINE_ENTRY_PATTERN = re.compile(r'^- \*\*(\d{1,2}):(\d{2})(?:\s*-\s*(\d{1,2}):(\d{2}))?\*\*:\s*(.*)$', re.MULTILINE)
+
+# เขตเวลาของ timeline entry (นาทีจาก UTC) - วันเดินทางไป/กลับมี entry ฝั่งไทย
+TIMEZONE_TOKYO = 'Asia/Tokyo'
+TIMEZONE_BANGKOK = 'Asia/Bangkok'
+UTC_OFFSET_MINUTES = {TIMEZONE_TOKYO: 9 * 60, TIMEZONE_BANGKOK: 7 * 60}
+THAI_TIME_MARKER = 'เวลาไทย'
+FLIGHT_DEPARTURE_PATTERN = re.compile(r'🛫|✈️.*(?:เที่ยวบิน|ขึ้นเครื่อง)')
+FLIGHT_ARRIVAL_MARKER = '🛬'
+THAI_AIRPORT_PATTERN = re.compile(r'ดอนเมือง|สุวรรณภูมิ|\b(?:DMK|BKK)\b')
+
+
+def to_jst_minutes(minutes, timezone):
+    """นาทีเวลาท้องถิ่นของ timezone -> นาทีเวลาญี่ปุ่น (เช่น 06:15 Bangkok -> 08:15 JST)"""
+    return minutes + UTC_OFFSET_MINUTES[TIMEZONE_TOKYO] - UTC_OFFSET_MINUTES[timezone]
+
+
+# เซลล์เวลาในตารางเดินรถ: "09:10"
+DEPARTURE_TIME_PATTERN = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+class DayToDayTokyoGenerator:
+    """
+    Day-to-Day timeline generator จัดโครงสร้างแบบวันต่อวัน
+    """
+    def __init__(self):
+        # Setup paths
+        self.package_dir = Path(__file__).parent
+        self.script_dir = self.package_dir.parent
+        self.project_dir = self.script_dir.parent
+        self.content_dir = self.project_dir / "content"
+        self.th_dir = self.content_dir / "th"
+        self.en_dir = self.content_dir / "en"
+        self.build_dir = self.project_dir / "build"
+        self.loader = ContentLoader(self.content_dir)
+
+        # Per-stage timing/memory instrumentation (disabled = no-op)
+        self.profiler = BuildProfiler()
+
+    def _prepare_build(self):
+        """สร้าง build directory และแสดง banner (เรียกตอน generate เท่านั้น ไม่ทำตอน import/สร้าง object)"""
+        self.build_dir.mkdir(exist_ok=True)
+
+        print("🚀 Day-to-Day Tokyo Trip Generator v4.0")
+        print(f"   - Project Dir: {self.project_dir}")
+        print(f"   - Content Dir: {self.content_dir}")
+        print(f"   - Build Dir:   {self.build_dir}")
+
+    @profiled('get_content_data')
+    def get_content_data(self):
+        """อ่านไฟล์ content ทั้งหมดและจัดโครงสร้างข้อมูล"""
+        print("📂 Reading content files...")
+        if not self.th_dir.exists():
+            print(f"❌ Thai content directory not found: {self.th_dir}")
+            return {}
+
+        # อ่านภาษาไทย (หลัก) + ภาษาอังกฤษ (ถ้ามี) พร้อมกัน
+        content_data = self.loader.load_content('th', 'en')
+        self.loader.print_summary()
+
+        print(f"   - Found {len(content_data)} content entries.")
+        return content_data
+
+    @profiled('extract_day_info')
+    def extract_day_info(self, content_data, date_index=None, clothing_index=None):
+        """แยกข้อมูลแต่ละวันออกจาก content files - ใช้เนื้อหาต้นฉบับที่สมบูรณ์"""
+        print("📅 Extracting day-by-day information...")
+        
+        days_data = {}
+        date_index = date_index or {}
+        
+        # หา day files (003-day1, 004-day2, etc.)
+        day_keys = sorted([k for k in content_data if re.match(r'^\d+-day\d+', k)])
+        
+        for key in day_keys:
+            day_num = re.search(r'day(\d+)', key).group(1)
+            content = content_data[key]
+            th_md = content.get('th', '')
+            
+            title = self._extract_title(th_md)
+            trip_date = self._extract_trip_date(title)
+
+            # ใช้เนื้อหาต้นฉบับทั้งหมด แค่แยกหัวข้อหลัก
+            day_data = {
+                'day_number': int(day_num),
+                'title': title,
+                'date': self._extract_date(th_md),
+                'trip_date': trip_date,
+                'date_fragments': date_index.get(trip_date, {}),
+                'clothing': clothing_index.lookup(int(day_num)) if clothing_index else None,
+                'full_content': th_md,  # เก็บเนื้อหาเต็ม
+                'timeline_section': self._extract_timeline_section(th_md),
+                'additional_sections': self._extract_additional_sections(th_md)
+            }
+            
+            days_data[int(day_num)] = day_data
+            print(f"   ✅ Day {day_num}: {day_data['title']}")
+        
+        return days_data
+
+    def _extract_title(self, md_content):
+        """Extract day title"""
+        match = re.search(r'^# (.*)', md_content, re.MULTILINE)
+        return match.group(1).strip() if match else "วันที่ N/A"
+
+    def _extract_date(self, md_content):
+        """Extract date information"""
+        match = re.search(r'\*\*วันที่:\*\*\s*([^\n]+)', md_content)
+        if match:
+            return match.group(1).strip()
+        
+        # Fallback: look for date in title
+        date_match = re.search(r'(\d+ มี\.?ค\.? \d{4})', md_content)
+        return date_match.group(1) if date_match else ""
+
+    def _extract_trip_date(self, text, default_year=None):
+        """แปลงวันที่ภาษาไทยตัวแรกใน text เป็น datetime.date"""
+        dates = self._parse_thai_dates(text, default_year)
+        return dates[0] if dates else None
+
+    def _parse_thai_dates(self, text, default_year=None):
+        """
+        แปลงวันที่ภาษาไทยเป็น list ของ datetime.date
+        - "6 มีนาคม 2026" -> [2026-03-06]
+        - "8-10 มี.ค."    -> [2026-03-08, 2026-03-09, 2026-03-10]
+        """
+        match = THAI_DATE_PATTERN.search(text or '')
+        if not match:
+            return []
+
+        first_day, last_day, month_name, year = match.groups()
+        year = int(year) if year else (default_year or datetime.date.today().year)
+        month = THAI_MONTHS[month_name]
+        last_day = last_day or first_day
+
+        try:
+            start = datetime.date(year, month, int(first_day))
+            end = datetime.date(year, month, int(last_day))
+        except ValueError:
+            return []
+
+        return [start + datetime.timedelta(days=n) for n in range((end - start).days + 1)]
+
+    def resolve_day_date(self, md_content):
+        """วันที่ของไฟล์วัน: field **วันที่:** ก่อน แล้วค่อยใช้วันที่ในหัวข้อ # -> datetime.date หรือ None"""
+        trip_date = self._extract_trip_date(self._extract_title(md_content))
+        match = re.search(r'\*\*วันที่:\*\*\s*([^\n]+)', md_content)
+        if match:
+            field_date = self._extract_trip_date(match.group(1), trip_date.year if trip_date else None)
+            if field_date:
+                return field_date
+        return trip_date
+
+    def _split_h3_sections(self, md_content):
+        """แยก ### sections -> list ของ (heading, body) โดยหยุดที่ heading ระดับ ## หรือ ###"""
+        sections = []
+        headings = list(re.finditer(r'^(#{1,3}) (.*)$', md_content, re.MULTILINE))
+
+        for i, heading in enumerate(headings):
+            if len(heading.group(1)) != 3:
+                continue
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(md_content)
+            sections.append((heading.group(2).strip(), md_content[heading.end():end].strip()))
+
+        return sections
+
+    def _extract_departure_tables(self, md_content, trip_year=None):
+        """
+        ดึงตารางเดินรถ (คอลัมน์ 'เวลาออก') ใต้หัวข้อ #### ที่มีวันที่ เช่น "#### วันเสาร์ (8 มี.ค.)"
+        -> list ของตาราง {'date', 'label', 'departures': [{'dep', 'arr', 'info'}, ...]}
+        (dep/arr = นาทีนับจากเที่ยงคืน, เรียงตามเวลาออก) - ขาไป/ขากลับเป็นคนละตาราง
+        label = บริการจากหัวข้อ ## (ตัด "ไป" ออก) + ขาไป/ขากลับ จากหัวข้อ #### เช่น
+        "🚌 รถบัส Kawaguchiko · ขากลับ" (ไม่ใช่ "รถบัสไป Kawaguchiko" ซึ่งอ่านเป็นขาไป)
+        """
+        tables = []
+        service = ''
+        table = None
+        header = None
+
+        for line in md_content.split('\n'):
+            stripped = line.strip()
+            heading = re.match(r'^(#{2,4}) (.*)$', stripped)
+            if heading:
+                level, title = len(heading.group(1)), heading.group(2).strip()
+                if level == 2:
+                    # "🚌 รถบัสไป Kawaguchiko" -> "🚌 รถบัส Kawaguchiko"
+                    service = re.sub(r'(\()?ไป\s+', lambda match: match.group(1) or ' ', title)
+                dates = self._parse_thai_dates(title, trip_year)[:1] if level == 4 else []
+                table = {
+                    'date': dates[0],
+                    'label': f"{service} · {'ขากลับ' if 'กลับ' in title else 'ขาไป'}",
+                    'departures': [],
+                } if dates else None
+                header = None
+                continue
+            if not stripped.startswith('|'):
+                header = None
+                continue
+            if re.match(r'^[-:\s|]+$', stripped):
+                continue
+
+            cells = [cell.strip() for cell in stripped.strip('|').split('|')]
+            if header is None:
+                header = cells if table is not None and 'เวลาออก' in cells else []
+                if header:
+                    tables.append(table)
+                continue
+            if not header:
+                continue
+
+            row = dict(zip(header, cells))
+            dep = DEPARTURE_TIME_PATTERN.match(row.get('เวลาออก', ''))
+            if not dep:
+                continue
+            arr = DEPARTURE_TIME_PATTERN.match(row.get('เวลาถึง', ''))
+            table['departures'].append({
+                'dep': int(dep.group(1)) * 60 + int(dep.group(2)),
+                'arr': int(arr.group(1)) * 60 + int(arr.group(2)) if arr else None,
+                'info': ' · '.join(self._clean_markdown_formatting(value) for key, value in row.items()
+                                   if key not in ('เวลาออก', 'เวลาถึง') and value),
+            })
+
+        for table in tables:
+            table['departures'].sort(key=lambda departure: departure['dep'])
+        return [table for table in tables if table['departures']]
+
+    def _extract_date_table_rows(self, md_content):
+        """ดึงแถวข้อมูลจากตาราง markdown ที่คอลัมน์แรกคือ 'วันที่'"""
+        rows = []
+        in_date_table = False
+
+        for line in md_content.split('\n'):
+            stripped = line.strip()
+            if not stripped.startswith('|'):
+                in_date_table = False
+                continue
+
+            cells = [cell.strip() for cell in stripped.strip('|').split('|')]
+            if re.match(r'^[-:\s|]+$', stripped):
+                continue
+            if cells and cells[0] == 'วันที่':
+                in_date_table = True
+                header = cells
+                continue
+            if in_date_table:
+                rows.append(dict(zip(header, cells)))
+
+        return rows
+
+    @profiled('build_date_index')
+    def build_date_index(self, content_data, trip_year=None):
+        """
+        สร้าง index วันที่ -> ข้อมูลอ้างอิงประจำวัน (ทำครั้งเดียวตอนโหลด content)
+        {date: {'weather': (heading, md), 'transfers': [row, ...], 'hotel': row, 'timetables': [table, ...]}}
+        """
+        print("🗂️ Building date index (weather, transport, lodging)...")
+
+        # ปีของทริปจากหัวข้อไฟล์วันแรก
+        if trip_year is None:
+            for key in sorted(content_data):
+                if re.match(r'^\d+-day\d+', key):
+                    first_date = self._extract_trip_date(self._extract_title(content_data[key]['th']))
+                    if first_date:
+                        trip_year = first_date.year
+                        break
+
+        date_index = {}
+
+        def entry(date):
+            return date_index.setdefault(date, {'weather': None, 'transfers': [], 'hotel': None, 'timetables': []})
+
+        # 012-weather: ### วันที่ 4 (9 มี.ค.) - ...
+        weather_md = content_data.get('012-weather', {}).get('th', '')
+        for heading, body in self._split_h3_sections(weather_md):
+            day_match = re.match(r'วันที่ \d+ \(([^)]+)\)', heading)
+            if day_match:
+                for date in self._parse_thai_dates(day_match.group(1), trip_year):
+                    entry(date)['weather'] = (heading, body)
+
+        # 011-transportation: | วันที่ | เส้นทาง | วิธีการ | ค่าใช้จ่าย |
+        transport_md = content_data.get('011-transportation', {}).get('th', '')
+        for row in self._extract_date_table_rows(transport_md):
+            for date in self._parse_thai_dates(row.get('วันที่', ''), trip_year)[:1]:
+                entry(date)['transfers'].append(row)
+
+        # 011-transportation: #### วันเสาร์ (8 มี.ค.) + | เวลาออก | เวลาถึง | ... | (หนึ่งรายการต่อตาราง/ทิศทาง)
+        for table in self._extract_departure_tables(transport_md, trip_year):
+            entry(table['date'])['timetables'].append(table)
+
+        # 013-budget: | วันที่ | โรงแรม | ราคา | สถานะ | (8-10 มี.ค. = คืนวันที่ 8 และ 9)
+        budget_md = content_data.get('013-budget', {}).get('th', '')
+        for row in self._extract_date_table_rows(budget_md):
+            if 'โรงแรม' not in row:
+                continue
+            nights = self._parse_thai_dates(row.get('วันที่', ''), trip_year)
+            for date in (nights[:-1] if len(nights) > 1 else nights):
+                entry(date)['hotel'] = row
+
+        print(f"   - Indexed {len(date_index)} dates.")
+        return date_index
+
+    def build_clothing_index(self, content_data):
+        """Interval index ของหัวข้อการแต่งตัวตามช่วงวันใน 012-weather ("### 📅 วันที่ 3-5: ...")"""
+        weather_md = content_data.get('012-weather', {}).get('th', '')
+        clothing_index = build_clothing_index(self._split_h3_sections(weather_md))
+        if clothing_index.days:
+            print(f"   - Clothing ranges: {len(clothing_index)} (Day {clothing_index.days[0]}-{clothing_index.days[1]})")
+        return clothing_index
+
+    def _extract_timeline_section(self, md_content):
+        """Extract timeline section from markdown"""
+        # หา section ที่เริ่มด้วย ## ⏰ Timeline รายละเอียด
+        timeline_match = re.search(r'## ⏰ Timeline รายละเอียด\s*\n(.*?)(?=\n## |$)', md_content, re.DOTALL)
+        if timeline_match:
+            return timeline_match.group(1).strip()
+        return ""
+
+    def parse_timeline_entries(self, timeline_md):
+        """
+        แยก timeline entries พร้อมรายละเอียด -> list ของ dict เรียงตามเวลาเริ่ม
+        {'start': นาที, 'end': นาที, 'label': ..., 'details': [บรรทัดย่อย, ...],
+         'order': ลำดับในไฟล์, 'explicit_end': end มาจาก HH:MM-HH:MM หรือไม่,
+         'timezone': เขตเวลาของ start, 'end_timezone': เขตเวลาของ end,
+         'jst_start', 'jst_end': start/end แปลงเป็น JST (ใช้เทียบ/ลบกันข้ามเที่ยวบินได้)}
+        - **HH:MM**: ...        -> end = เวลาเริ่มของ entry ถัดไป
+        - **HH:MM-HH:MM**: ...  -> end ตามที่ระบุ
+        details = bullet ย่อยที่เยื้องใต้ entry (หยุดที่บรรทัดแรกที่ไม่เยื้อง เช่น ### หรือย่อหน้าใหม่)
+        เวลาเป็นเวลาท้องถิ่นตามที่เขียนในไฟล์ - ดู _assign_timezones
+        """
+        timeline_md = timeline_md or ''
+        matches = list(TIMELINE_ENTRY_PATTERN.finditer(timeline_md))
+
+        entries = []
+        for i, match in enumerate(matches):
+            start = int(match.group(1)) * 60 + int(match.group(2))
+            end = int(match.group(3)) * 60 + int(match.group(4)) if match.group(3) else None
+            if end is not None and end < start:
+                end += 24 * 60  # ข้ามเที่ยงคืน
+
+            body_end = matches[i + 1].start() if i + 1 < len(matches) else len(timeline_md)
+            details = []
+            for line in timeline_md[match.end():body_end].split('\n')[1:]:
+                if not line.strip():
+                    continue
+                if not line.startswith(' '):
+                    break
+                depth = (len(line) - len(line.lstrip(' '))) // 2 - 1
+                text = self._clean_markdown_formatting(re.sub(r'^-\s+', '', line.strip()))
+                if text:
+                    details.append('  ' * max(depth, 0) + text)
+
+            entries.append({
+                'start': start,
+                'end': end,
+                'label': self._clean_markdown_formatting(match.group(5)),
+                'details': details,
+                'order': i,
+                'explicit_end': end is not None,
+            })
+
+        entries.sort(key=lambda item: item['start'])
+
+        self._assign_timezones(entries)
+
+        # entry แบบเวลาเดียว: สิ้นสุดเมื่อ entry ถัดไปเริ่ม (entry สุดท้าย = 60 นาที)
+        for i, item in enumerate(entries):
+            item['end_timezone'] = item['timezone']
+            if item['end'] is None:
+                if i + 1 < len(entries):
+                    item['end'] = entries[i + 1]['start']
+                    item['end_timezone'] = entries[i + 1]['timezone']
+                else:
+                    item['end'] = item['start'] + 60
+            item['jst_start'] = to_jst_minutes(item['start'], item['timezone'])
+            item['jst_end'] = to_jst_minutes(item['end'], item['end_timezone'])
+
+        return entries
+
+    def _assign_timezones(self, entries):
+        """
+        ใส่ 'timezone' ให้ entry ที่เรียงตามเวลาแล้ว
+        - วันที่มีเที่ยวบิน (🛫 / ✈️ เที่ยวบิน... ตามด้วย 🛬): entry ตั้งแต่ขาลงอยู่ฝั่งปลายทาง
+          (ถึงดอนเมือง/สุวรรณภูมิ = ไทย ไม่งั้น = ญี่ปุ่น) entry ก่อนหน้าขาลงอยู่อีกฝั่งของเที่ยวบิน
+          (เช่น Day 1: ออกจากบ้าน 02:00 - บิน 06:15 = เวลาไทย)
+        - 🛬 ที่ไม่มีเที่ยวบินนำหน้า (เช่น ถึงสนามบินด้วยรถไฟ) ไม่นับเป็นขาลง
+        - entry ที่ระบุ "(เวลาไทย)" = เวลาไทยเสมอ
+        """
+        arrival = None
+        departed = False
+        for i, item in enumerate(entries):
+            if departed and FLIGHT_ARRIVAL_MARKER in item['label']:
+                arrival = i
+                break
+            departed = departed or bool(FLIGHT_DEPARTURE_PATTERN.search(item['label']))
+        arrives_in_thailand = arrival is not None and bool(
+            THAI_AIRPORT_PATTERN.search(entries[arrival]['label']) or THAI_TIME_MARKER in entries[arrival]['label'])
+
+        for i, item in enumerate(entries):
+            in_thailand = THAI_TIME_MARKER in item['label']
+            if arrival is not None:
+                in_thailand = in_thailand or (arrives_in_thailand if i >= arrival else not arrives_in_thailand)
+            item['timezone'] = TIMEZONE_BANGKOK if in_thailand else TIMEZONE_TOKYO
+
+    def _extract_timeline_times(self, timeline_md):
+        """
+        แปลง timeline entries เป็น array เวลาแบบกะทัดรัด [[start_min, end_min, label], ...]
+        เวลาแปลงเป็น JST ทั้งหมด (entry เวลาไทย +2 ชม.) ให้เทียบกับเวลาปัจจุบัน JST ได้ตรง
+        """
+        times = [[item['jst_start'], item['jst_end'], item['label']] for item in self.parse_timeline_entries(timeline_md)]
+        times.sort(key=lambda item: item[0])
+        return times
+
+    def check_timelines(self, days_data):
+        """ตรวจ timeline ทุกวันในรอบเดียว แล้วเก็บผลไว้ใน day_data['timeline_issues']"""
+        results = analyze_timelines({
+            day_num: self.parse_timeline_entries(day_data['timeline_section'])
+            for day_num, day_data in days_data.items()
+        })
+        for day_num, day_data in days_data.items():
+            day_data['timeline_issues'] = results.get(day_num, [])
+        print_timeline_report(results)
+        return results
+
+    def build_now_next_index(self, days_data):
+        """สร้างข้อมูล "now/next" ต่อวัน: {"2026-03-06": [[start, end, label], ...]}"""
+        now_next_index = {}
+        for day_num in sorted(days_data):
+            day_data = days_data[day_num]
+            if day_data.get('trip_date'):
+                now_next_index[day_data['trip_date'].isoformat()] = self._extract_timeline_times(day_data['timeline_section'])
+        return now_next_index
+
+    def build_departure_index(self, days_data):
+        """
+        สร้างข้อมูลตารางเดินรถต่อวัน แยกตามตาราง (ขาไป/ขากลับไม่ปนกัน), แต่ละตารางเรียงตามเวลาออก:
+        {"2026-03-11": [{"label": "...", "items": [[dep, arr, info], ...]}, ...]}
+        """
+        departure_index = {}
+        for day_num in sorted(days_data):
+            day_data = days_data[day_num]
+            timetables = day_data['date_fragments'].get('timetables')
+            if day_data.get('trip_date') and timetables:
+                departure_index[day_data['trip_date'].isoformat()] = [
+                    {
+                        'label': table['label'],
+                        'items': [[departure['dep'], departure['arr'], departure['info']]
+                                  for departure in table['departures']],
+                    }
+                    for table in timetables
+                ]
+        return departure_index
+
+    def _extract_additional_sections(self, md_content):
+        """Extract additional sections after timeline"""
+        # หา sections หลัก ## ที่ไม่ใช่ timeline
+        sections = {}
+        
+        # Split เนื้อหาด้วย ## headings
+        section_pattern = r'## ([^\n]+)\s*\n(.*?)(?=\n## |$)'
+        section_matches = re.findall(section_pattern, md_content, re.DOTALL)
+        
+        for title, content in section_matches:
+            if 'Timeline รายละเอียด' not in title:  # Skip timeline section
+                sections[title.strip()] = content.strip()
+        
+        return sections
+
+    def markdown_to_html_simple(self, md_text):
+        """Convert markdown to HTML แบบง่าย สำหรับ content sections"""
+        if not md_text:
+            return ""
+        
+        html = md_text
+        
+        # Headers
+        html = re.sub(r'^### (.*)', r'<h3>\1</h3>', html, flags=re.MULTILINE)
+        html = re.sub(r'^## (.*)', r'<h2>\1</h2>', html, flags=re.MULTILINE)
+        html = re.sub(r'^# (.*)', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+        
+        # Bold, italic, code, links
+        html = format_inline(html)
+        
+        # Lists
+        html = self._convert_lists_simple(html)
+        
+        # Tables
+        html = self._convert_tables_simple(html)
+        
+        # Paragraphs
+        html = self._convert_paragraphs_simple(html)
+        
+        return html
+
+    def _convert_lists_simple(self, text):
+        """Convert markdown lists to HTML"""
+        lines = text.split('\n')
+        result = []
+        in_list = False
+        
+        for line in lines:
+            if line.strip().startswith('- '):
+                if not in_list:
+                    result.append('<ul>')
+                    in_list = True
+                item_content = line.strip()[2:]
+                result.append(f'  <li>{item_content}</li>')
+            else:
+                if in_list:
+                    result.append('</ul>')
+                    in_list = False
+                result.append(line)
+        
+        if in_list:
+            result.append('</ul>')
+        
+        return '\n'.join(result)
+
+    def _convert_tables_simple(self, text):
+        """Convert markdown tables to HTML"""
+        lines = text.split('\n')
+        result = []
+        in_table = False
+        
+        for i, line in enumerate(lines):
+            if '|' in line and line.count('|') >= 2:
+                if not in_table:
+                    result.append('<div class="table-container"><table class="table">')
+                    in_table = True
+                    # Check if next line is separator
+                    if i + 1 < len(lines) and '---' in lines[i + 1]:
+                        # This is header row
+                        cells = [cell.strip() for cell in line.split('|')[1:-1]]
+                        result.append('<thead><tr>' + ''.join(f'<th>{cell}</th>' for cell in cells) + '</tr></thead><tbody>')
+                        continue
+                
+                # Regular row
+                cells = [cell.strip() for cell in line.split('|')[1:-1]]
+                result.append('<tr>' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>')
+            elif '---' in line and in_table:
+                # Skip separator line
+                continue
+            else:
+                if in_table:
+                    result.append('</tbody></table></div>')
+                    in_table = False
+                result.append(line)
+        
+        if in_table:
+            result.append('</tbody></table></div>')
+        
+        return '\n'.join(result)
+
+    def _convert_paragraphs_simple(self, text):
+        """Convert text to paragraphs"""
+        paragraphs = text.split('\n\n')
+        result = []
+        
+        for para in paragraphs:
+            para = para.strip()
+            if not para:
+                continue
+            
+            # Skip if already HTML or header
+            if para.startswith(('<', '#')):
+                result.append(para)
+            else:
+                # Split by single newlines and wrap each non-empty line
+                lines = para.split('\n')
+                processed = []
+                for line in lines:
+                    line = line.strip()
+                    if line and not line.startswith('<'):
+                        processed.append(f'<p>{line}</p>')
+                    elif line:
+                        processed.append(line)
+                result.append('\n'.join(processed))
+        
+        return '\n\n'.join(result)
+
+
+    def _clean_markdown_formatting(self, text):
+        """Clean markdown formatting from text"""
+        if not text:
+            return ""
+        
+        # Remove markdown formatting
+        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+        text = re.sub(r'\*(.*?)\*', r'\1', text)
+        text = re.sub(r'`(.*?)`', r'\1', text)
+        
+        return text.strip()
+
+    def _build_departures_html(self, timetables, trip_date):
+        """
+        ตารางเดินรถของวัน หนึ่งตารางต่อทิศทาง - data-table = ลำดับใน departure index ของวันนั้น
+        data-dep (นาที) ให้ JS ไฮไลต์เที่ยวที่ผ่านไปแล้วโดยไม่ต้อง render ใหม่
+        """
+        def hhmm(minutes):
+            return f"{minutes // 60:02d}:{minutes % 60:02d}" if minutes is not None else '-'
+
+        date_key = trip_date.isoformat()
+        tables_html = Fragments()
+        for index, table in enumerate(timetables):
+            rows_html = ''.join(
+                f'<tr data-dep="{departure["dep"]}"><td>{hhmm(departure["dep"])}</td><td>{hhmm(departure["arr"])}</td>'
+                f'<td>{format_inline(departure["info"])}</td></tr>'
+                for departure in table['departures']
+            )
+            tables_html.append(f'''
+                        <h4>{format_inline(table['label'])}</h4>
+                        <p class="next-departure" data-date="{date_key}" data-table="{index}" hidden></p>
+                        <div class="table-container"><table class="table departures-table" data-date="{date_key}" data-table="{index}">
+                            <thead><tr><th>เวลาออก</th><th>เวลาถึง</th><th>รายละเอียด</th></tr></thead>
+                            <tbody>{rows_html}</tbody>
+                        </table></div>''')
+        return f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">🚌 ตารางเดินรถ <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">{tables_html.build()}
+                    </div>
+                </div>'''
+
+    def _build_date_fragments_html(self, fragments, trip_date=None, clothing=None):
+        """สร้าง HTML ข้อมูลอ้างอิงประจำวัน (อากาศ, การแต่งตัว, การเดินทาง, ตารางเดินรถ, ที่พัก) จาก date/clothing index"""
+        fragments = fragments or {}
+        if not fragments and not clothing:
+            return ""
+
+        sections_html = Fragments()
+
+        weather = fragments.get('weather')
+        if weather:
+            heading, body = weather
+            sections_html.append(f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">🌤️ สภาพอากาศ: {heading} <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">
+                        {self.markdown_to_html_simple(body)}
+                    </div>
+                </div>''')
+
+        if clothing:
+            heading, body = clothing
+            sections_html.append(f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">👕 การแต่งตัว - {heading.replace('📅', '', 1).strip()} <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">
+                        {self.markdown_to_html_simple(body)}
+                    </div>
+                </div>''')
+
+        transfers = fragments.get('transfers')
+        if transfers:
+            rows_md = '\n'.join(
+                f"| {row.get('เส้นทาง', '')} | {row.get('วิธีการ', '')} | {row.get('ค่าใช้จ่าย', '')} |"
+                for row in transfers
+            )
+            table_md = f"| เส้นทาง | วิธีการ | ค่าใช้จ่าย |\n|---|---|---|\n{rows_md}"
+            sections_html.append(f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">🚄 การเดินทางระหว่างเมือง <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">
+                        {self.markdown_to_html_simple(table_md)}
+                    </div>
+                </div>''')
+
+        timetables = fragments.get('timetables')
+        if timetables and trip_date:
+            sections_html.append(self._build_departures_html(timetables, trip_date))
+
+        hotel = fragments.get('hotel')
+        if hotel:
+            hotel_md = '\n'.join([
+                f"- **วันที่:** {hotel.get('วันที่', '')}",
+                f"- **ราคา:** {hotel.get('ราคา', '')}",
+                f"- **สถานะ:** {hotel.get('สถานะ', '')}",
+            ])
+            sections_html.append(f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">🏨 ที่พักคืนนี้: {hotel.get('โรงแรม', '')} <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">
+                        {self.markdown_to_html_simple(hotel_md)}
+                    </div>
+                </div>''')
+
+        return sections_html.build()
+
+    def generate_day_html(self, day_data):
+        """Generate HTML for a single day - ใช้เนื้อหาต้นฉบับที่สมบูรณ์"""
+        day_num = day_data['day_number']
+        
+        # Determine if it's birthday day
+        is_birthday = day_num == 4
+        birthday_class = ' birthday-day' if is_birthday else ''
+        birthday_badge = '🎂' if is_birthday else ''
+        
+        # Build timeline section (main activities)
+        timeline_html = self.markdown_to_html_simple(day_data['timeline_section'])
+        
+        # Build additional sections
+        additional_sections_html = Fragments()
+        for section_title, section_content in day_data['additional_sections'].items():
+            if section_content.strip():
+                section_html = self.markdown_to_html_simple(section_content)
+                additional_sections_html.append(f'''
+                <div class="day-section collapsible">
+                    <h3 onclick="toggleSection(this)">📋 {section_title} <span class="toggle-icon">▼</span></h3>
+                    <div class="section-content">
+                        {section_html}
+                    </div>
+                </div>''')
+
+        # Reference sections from the date index (weather, transfers, hotel)
+        reference_sections_html = self._build_date_fragments_html(day_data.get('date_fragments'), day_data.get('trip_date'),
+                                                                  day_data.get('clothing'))
+        
+        return f'''
+        <div class="day-card{birthday_class}" id="day{day_num}">
+            <div class="day-header" onclick="toggleDay({day_num})">
+                <div class="day-number">{birthday_badge} Day {day_num}</div>
+                <div class="day-title">{day_data['title']}</div>
+                <div class="day-date">{day_data['date']}</div>
+                {timeline_badges_html(day_data.get('timeline_issues'))}
+                <div class="expand-indicator">▼</div>
+            </div>
+            
+            <div class="day-content" id="day-content-{day_num}">
+                <div class="day-sections">
+                    
+                    <!-- Main Timeline -->
+                    <div class="day-section timeline-section">
+                        <h3>⏰ กิจกรรมตามเวลา</h3>
+                        <div class="section-content">
+                            {timeline_html}
+                        </div>
+                    </div>
+                    
+                    <!-- Weather / Clothing / Transport / Lodging (date index + clothing index) -->
+                    {reference_sections_html}
+                    
+                    <!-- Additional Sections -->
+                    {additional_sections_html.build()}
+                    
+                </div>
+            </div>
+        </div>
+        '''
+
+
+    def generate_complete_html(self, days_data):
+        """Generate complete HTML document"""
+        print("🏗️ Building complete day-to-day HTML...")
+        
+        # Generate days HTML
+        days_html = Fragments()
+        for day_num in sorted(days_data.keys()):
+            with self.profiler.span('generate_day_html', file=f"day{day_num}"):
+                days_html.append(self.generate_day_html(days_data[day_num]))
+        
+        # Now/next data island (อ่านได้โดยไม่ต้อง render day cards)
+        now_next_json = json.dumps(self.build_now_next_index(days_data), ensure_ascii=False, separators=(',', ':'))
+        now_next_json = now_next_json.replace('</', '<\\/')
+        departures_json = json.dumps(self.build_departure_index(days_data), ensure_ascii=False, separators=(',', ':'))
+        departures_json = departures_json.replace('</', '<\\/')
+        
+        # Get CSS and JavaScript
+        css = self._get_day_to_day_css()
+        js = self._get_day_to_day_js()
+        
+        return f'''<!DOCTYPE html>
+<html lang="th">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ทริปโตเกียว มีนาคม 2026 - Day-to-Day Planner</title>
+    <style>{css}</style>
+</head>
+<body>
+    <div class="container">
+        <!-- Header -->
+        <div class="header">
+            <h1>🗼 ทริปโตเกียว มีนาคม 2026</h1>
+            <p class="subtitle">Day-to-Day Travel Planner | 8 วัน 7 คืน</p>
+            <div class="header-actions">
+                <button onclick="expandAll()">📖 ดูทั้งหมด</button>
+                <button onclick="collapseAll()">📑 ย่อทั้งหมด</button>
+                <button onclick="togglePrintMode()">🖨️ โหมดพิมพ์</button>
+            </div>
+        </div>
+        
+        <!-- Now / Next (JST) -->
+        <script type="application/json" id="now-next-data">{now_next_json}</script>
+        <script type="application/json" id="departures-data">{departures_json}</script>
+        <div class="now-next" id="now-next" hidden>
+            <div class="now-next-item"><span class="now-next-label">ตอนนี้</span> <span id="now-item">-</span></div>
+            <div class="now-next-item"><span class="now-next-label">ถัดไป</span> <span id="next-item">-</span></div>
+        </div>
+        
+        <!-- Trip Overview -->
+        <div class="trip-overview">
+            <div class="overview-stats">
+                <div class="stat">
+                    <span class="stat-number">{len(days_data)}</span>
+                    <span class="stat-label">วัน</span>
+                </div>
+                <div class="stat">
+                    <span class="stat-number">7</span>
+                    <span class="stat-label">คืน</span>
+                </div>
+                <div class="stat">
+                    <span class="stat-number">3</span>
+                    <span class="stat-label">เมือง</span>
+                </div>
+                <div class="stat special">
+                    <span class="stat-number">🎂</span>
+                    <span class="stat-label">Birthday</span>
+                </div>
+            </div>
+        </div>
+        
+        <!-- Days Container -->
+        <div class="days-container" id="days-container">
+            {days_html.build()}
+        </div>
+        
+        <!-- Footer -->
+        <div class="footer">
+            <p>Generated on {datetime.datetime.now().strftime("%d/%m/%Y %H:%M")}</p>
+            <p>🎉 Happy 11th Birthday น้องพอใจ! 🎂</p>
+        </div>
+    </div>
+    
+    <script>{js}</script>
+</body>
+</html>'''
+
+    def _get_day_to_day_css(self):
+        """Get CSS for day-to-day layout"""
+        return '''
+        :root {
+            --primary: #2E86AB;
+            --secondary: #A23B72;
+            --accent: #F18F01;
+            --success: #C73E1D;
+            --background: #F8FAFC;
+            --card-bg: #FFFFFF;
+            --text-primary: #2C3E50;
+            --text-secondary: #64748B;
+            --border: #E2E8F0;
+            --shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+            --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
+            --border-radius: 12px;
+            --transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        }
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, sans-serif;
+            line-height: 1.6;
+            color: var(--text-primary);
+            background: linear-gradient(135deg, var(--background) 0%, #E8F4FD 100%);
+            min-height: 100vh;
+        }
+
+        .container {
+            max-width: 1000px;
+            margin: 0 auto;
+            padding: 1rem;
+        }
+
+        .header {
+            text-align: center;
+            padding: 2rem;
+            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+            color: white;
+            border-radius: var(--border-radius);
+            box-shadow: var(--shadow);
+            margin-bottom: 2rem;
+        }
+
+        .header h1 {
+            font-size: 2.5rem;
+            margin-bottom: 0.5rem;
+            font-weight: 700;
+        }
+
+        .header .subtitle {
+            font-size: 1.2rem;
+            opacity: 0.9;
+            margin-bottom: 1.5rem;
+        }
+
+        .header-actions {
+            display: flex;
+            gap: 1rem;
+            justify-content: center;
+            flex-wrap: wrap;
+        }
+
+        .header-actions button {
+            padding: 0.75rem 1.5rem;
+            border: 2px solid rgba(255,255,255,0.3);
+            background: rgba(255,255,255,0.1);
+            color: white;
+            border-radius: 25px;
+            cursor: pointer;
+            font-weight: 600;
+            transition: var(--transition);
+            backdrop-filter: blur(10px);
+        }
+
+        .header-actions button:hover {
+            background: rgba(255,255,255,0.2);
+            transform: translateY(-2px);
+        }
+
+        .trip-overview {
+            background: var(--card-bg);
+            border-radius: var(--border-radius);
+            box-shadow: var(--shadow);
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+        }
+
+        .overview-stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 1rem;
+            text-align: center;
+        }
+
+        .stat {
+            padding: 1rem;
+            border-radius: var(--border-radius);
+            background: var(--background);
+        }
+
+        .stat.special {
+            background: linear-gradient(135deg, #FFE5CC 0%, #FFF8E7 100%);
+        }
+
+        .stat-number {
+            display: block;
+            font-size: 2rem;
+            font-weight: 700;
+            color: var(--primary);
+        }
+
+        .stat-label {
+            font-size: 0.9rem;
+            color: var(--text-secondary);
+        }
+
+        .days-container {
+            display: flex;
+            flex-direction: column;
+            gap: 1.5rem;
+        }
+
+        .day-card {
+            background: var(--card-bg);
+            border-radius: var(--border-radius);
+            box-shadow: var(--shadow);
+            overflow: hidden;
+            transition: var(--transition);
+        }
+
+        .day-card:hover {
+            box-shadow: var(--shadow-lg);
+            transform: translateY(-2px);
+        }
+
+        .day-card.birthday-day {
+            border: 3px solid var(--accent);
+            background: linear-gradient(135deg, var(--card-bg) 0%, #FFF8E7 100%);
+        }
+
+        .day-header {
+            padding: 1.5rem;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+            color: white;
+            transition: var(--transition);
+        }
+
+        .day-header:hover {
+            background: linear-gradient(135deg, var(--secondary) 0%, var(--primary) 100%);
+        }
+
+        .day-number {
+            font-size: 1.2rem;
+            font-weight: 700;
+            min-width: 80px;
+        }
+
+        .day-title {
+            flex: 1;
+            font-size: 1.3rem;
+            font-weight: 600;
+        }
+
+        .day-date {
+            font-size: 0.9rem;
+            opacity: 0.9;
+        }
+
+        .timeline-badges {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.35rem;
+        }
+
+        .timeline-badge {
+            font-size: 0.75rem;
+            font-weight: 600;
+            padding: 0.15rem 0.5rem;
+            border-radius: 999px;
+            background: rgba(255, 255, 255, 0.9);
+            color: var(--text-primary);
+            cursor: help;
+            white-space: nowrap;
+        }
+
+        .timeline-badge-overlap {
+            background: #FFE8E6;
+            color: #B42318;
+        }
+
+        .timeline-badge-midnight {
+            background: #E8EAFF;
+            color: #2E3A8C;
+        }
+
+        .print-mode .timeline-badges {
+            display: none;
+        }
+
+        .expand-indicator {
+            font-size: 1.2rem;
+            transition: transform 0.3s ease;
+        }
+
+        .day-card.expanded .expand-indicator {
+            transform: rotate(180deg);
+        }
+
+        .day-content {
+            display: none;
+            padding: 1.5rem;
+            border-top: 1px solid var(--border);
+        }
+
+        .day-content.expanded {
+            display: block;
+        }
+
+        .day-sections {
+            display: grid;
+            gap: 1.5rem;
+        }
+
+        .day-section {
+            background: var(--background);
+            border-radius: var(--border-radius);
+            padding: 1rem;
+        }
+
+        .day-section h3 {
+            color: var(--primary);
+            margin-bottom: 1rem;
+            display: flex;
+            align-items: center;
+            gap: 0.5rem;
+            font-size: 1.1rem;
+        }
+
+        .day-section.collapsible h3 {
+            cursor: pointer;
+            transition: var(--transition);
+        }
+
+        .day-section.collapsible h3:hover {
+            color: var(--secondary);
+        }
+
+        .day-section.collapsible .section-content {
+            max-height: 0;
+            overflow: hidden;
+            transition: max-height 0.3s ease;
+        }
+
+        .day-section.collapsible.expanded .section-content {
+            max-height: 1000px;
+        }
+
+        .toggle-icon {
+            margin-left: auto;
+            transition: transform 0.3s ease;
+        }
+
+        .day-section.collapsible.expanded .toggle-icon {
+            transform: rotate(180deg);
+        }
+
+        .activities-timeline {
+            display: grid;
+            gap: 0.75rem;
+        }
+
+        .activity-item {
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+            padding: 0.75rem;
+            background: var(--card-bg);
+            border-radius: 8px;
+            border-left: 4px solid var(--primary);
+        }
+
+        .activity-item.activity-highlight {
+            border-left-color: var(--accent);
+        }
+
+        .activity-time {
+            font-weight: 600;
+            color: var(--primary);
+            min-width: 80px;
+            font-size: 0.9rem;
+        }
+
+        .activity-content {
+            flex: 1;
+        }
+
+        .section-content ul {
+            list-style: none;
+            padding: 0;
+        }
+
+        .section-content li {
+            padding: 0.5rem 0;
+            border-bottom: 1px solid var(--border);
+        }
+
+        .section-content li:last-child {
+            border-bottom: none;
+        }
+
+        .now-next {
+            background: var(--card-bg);
+            border-radius: var(--border-radius);
+            box-shadow: var(--shadow);
+            border-left: 4px solid var(--accent);
+            padding: 1rem 1.5rem;
+            margin-bottom: 2rem;
+            display: grid;
+            gap: 0.5rem;
+        }
+
+        .now-next[hidden] {
+            display: none;
+        }
+
+        .now-next-label {
+            display: inline-block;
+            min-width: 60px;
+            font-weight: 700;
+            color: var(--accent);
+        }
+
+        .next-departure {
+            font-weight: 600;
+            color: var(--accent);
+            margin-bottom: 0.75rem;
+        }
+
+        .next-departure[hidden] {
+            display: none;
+        }
+
+        .departures-table tr.departed td {
+            color: var(--text-secondary);
+            text-decoration: line-through;
+            opacity: 0.6;
+        }
+
+        .departures-table tr.next-departure-row td {
+            background: #FFF4E0;
+            font-weight: 600;
+        }
+
+        .footer {
+            text-align: center;
+            padding: 2rem;
+            margin-top: 3rem;
+            color: var(--text-secondary);
+            border-top: 1px solid var(--border);
+        }
+
+        /* Print Mode Styles */
+        .print-mode {
+            background: white !important;
+        }
+
+        .print-mode .day-content {
+            display: block !important;
+        }
+
+        .print-mode .header-actions {
+            display: none;
+        }
+
+        .print-mode .expand-indicator {
+            display: none;
+        }
+
+        /* Responsive Design */
+        @media (max-width: 768px) {
+            .container {
+                padding: 0.5rem;
+            }
+            
+            .header h1 {
+                font-size: 2rem;
+            }
+            
+            .day-header {
+                padding: 1rem;
+                flex-direction: column;
+                align-items: flex-start;
+                gap: 0.5rem;
+            }
+            
+            .day-title {
+                font-size: 1.1rem;
+            }
+            
+            .activities-timeline {
+                gap: 0.5rem;
+            }
+            
+            .activity-item {
+                flex-direction: column;
+                align-items: flex-start;
+                gap: 0.5rem;
+            }
+            
+            .activity-time {
+                min-width: auto;
+            }
+            
+            .overview-stats {
+                grid-template-columns: repeat(2, 1fr);
+            }
+        }
+
+        @media print {
+            body {
+                background: white !important;
+            }
+            
+            .day-content {
+                display: block !important;
+            }
+            
+            .header-actions,
+            .expand-indicator {
+                display: none !important;
+            }
+            
+            .day-card {
+                break-inside: avoid;
+                margin-bottom: 1rem;
+            }
+        }
+        '''
+
+    def _get_day_to_day_js(self):
+        """Get JavaScript for day-to-day functionality"""
+        return '''
+        function toggleDay(dayNum) {
+            const dayCard = document.getElementById('day' + dayNum);
+            const dayContent = document.getElementById('day-content-' + dayNum);
+            
+            if (dayContent.style.display === 'none' || !dayContent.style.display) {
+                dayContent.style.display = 'block';
+                dayContent.classList.add('expanded');
+                dayCard.classList.add('expanded');
+            } else {
+                dayContent.style.display = 'none';
+                dayContent.classList.remove('expanded');
+                dayCard.classList.remove('expanded');
+            }
+        }
+
+        function toggleSection(headerElement) {
+            const section = headerElement.parentElement;
+            section.classList.toggle('expanded');
+        }
+
+        function expandAll() {
+            const dayContents = document.querySelectorAll('.day-content');
+            const dayCards = document.querySelectorAll('.day-card');
+            
+            dayContents.forEach(content => {
+                content.style.display = 'block';
+                content.classList.add('expanded');
+            });
+            
+            dayCards.forEach(card => {
+                card.classList.add('expanded');
+            });
+        }
+
+        function collapseAll() {
+            const dayContents = document.querySelectorAll('.day-content');
+            const dayCards = document.querySelectorAll('.day-card');
+            
+            dayContents.forEach(content => {
+                content.style.display = 'none';
+                content.classList.remove('expanded');
+            });
+            
+            dayCards.forEach(card => {
+                card.classList.remove('expanded');
+            });
+        }
+
+        function togglePrintMode() {
+            document.body.classList.toggle('print-mode');
+            
+            if (document.body.classList.contains('print-mode')) {
+                expandAll();
+            }
+        }
+
+        // Now / Next: binary search บน array เวลาของวันนี้ (JST)
+        function formatMinutes(minutes) {
+            const h = Math.floor(minutes / 60) % 24;
+            const m = minutes % 60;
+            return String(h).padStart(2, '0') + ':' + String(m).padStart(2, '0');
+        }
+
+        // ?now=2026-03-06T17:30 สำหรับทดสอบ, ปกติใช้เวลาปัจจุบัน JST (UTC+9)
+        function currentJst() {
+            const override = new URLSearchParams(window.location.search).get('now');
+            if (override && /^\\d{4}-\\d{2}-\\d{2}T\\d{2}:\\d{2}$/.test(override)) {
+                return {
+                    dateKey: override.slice(0, 10),
+                    minutes: parseInt(override.slice(11, 13), 10) * 60 + parseInt(override.slice(14, 16), 10)
+                };
+            }
+            const jst = new Date(Date.now() + 9 * 60 * 60 * 1000);
+            return {
+                dateKey: jst.toISOString().slice(0, 10),
+                minutes: jst.getUTCHours() * 60 + jst.getUTCMinutes()
+            };
+        }
+
+        function renderNowNext() {
+            const dataEl = document.getElementById('now-next-data');
+            const box = document.getElementById('now-next');
+            if (!dataEl || !box) return;
+
+            const data = JSON.parse(dataEl.textContent);
+            const { dateKey, minutes } = currentJst();
+
+            const items = data[dateKey];
+            if (!items || !items.length) {
+                box.hidden = true;
+                return;
+            }
+
+            // หา entry แรกที่เริ่มหลังเวลาปัจจุบัน
+            let lo = 0, hi = items.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (items[mid][0] <= minutes) lo = mid + 1; else hi = mid;
+            }
+
+            // entry ที่กำลังทำอยู่: entry ล่าสุดที่เริ่มแล้วและยังไม่จบ (entry ก่อนหน้าที่ระบุเวลาจบยาวอาจยังไม่จบ)
+            let current = null;
+            for (let i = lo - 1; i >= 0; i--) {
+                if (minutes < items[i][1]) {
+                    current = items[i];
+                    break;
+                }
+            }
+            const next = lo < items.length ? items[lo] : null;
+
+            document.getElementById('now-item').textContent = current
+                ? formatMinutes(current[0]) + '-' + formatMinutes(current[1]) + ' ' + current[2]
+                : '-';
+            document.getElementById('next-item').textContent = next
+                ? formatMinutes(next[0]) + ' ' + next[2]
+                : 'จบกิจกรรมวันนี้แล้ว';
+            box.hidden = false;
+        }
+
+        renderNowNext();
+        setInterval(renderNowNext, 60 * 1000);
+
+        // ตารางเดินรถ (แยกตามตาราง/ทิศทาง): index ของเที่ยวแรกที่ออกตั้งแต่เวลา minutes (binary search)
+        const departuresData = JSON.parse((document.getElementById('departures-data') || {}).textContent || '{}');
+
+        function nextDepartureIndex(items, minutes) {
+            let lo = 0, hi = items.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (items[mid][0] < minutes) lo = mid + 1; else hi = mid;
+            }
+            return lo;
+        }
+
+        // เช่น nextDeparture('2026-03-08', 0, 600) -> เที่ยวแรกหลัง 10:00 ของตารางแรกของวัน หรือ null
+        function nextDeparture(dateKey, tableIndex, minutes) {
+            const table = (departuresData[dateKey] || [])[tableIndex];
+            if (!table) return null;
+            const index = nextDepartureIndex(table.items, minutes);
+            return index < table.items.length ? table.items[index] : null;
+        }
+
+        // ไฮไลต์เที่ยวที่ผ่านไปแล้ว/เที่ยวถัดไปของแต่ละตารางของวันนี้ด้วย class (ไม่ render ตารางใหม่)
+        function renderDepartures() {
+            const { dateKey, minutes } = currentJst();
+            const tables = departuresData[dateKey];
+            if (!tables) return;
+
+            tables.forEach((_, tableIndex) => {
+                const next = nextDeparture(dateKey, tableIndex, minutes);
+                const selector = '[data-date="' + dateKey + '"][data-table="' + tableIndex + '"]';
+                document.querySelectorAll('.departures-table' + selector + ' tr[data-dep]').forEach(row => {
+                    const dep = parseInt(row.dataset.dep, 10);
+                    row.classList.toggle('departed', dep < minutes);
+                    row.classList.toggle('next-departure-row', next !== null && dep === next[0]);
+                });
+
+                document.querySelectorAll('.next-departure' + selector).forEach(note => {
+                    note.textContent = next
+                        ? '🚏 เที่ยวถัดไป: ' + formatMinutes(next[0]) + (next[1] !== null ? ' → ' + formatMinutes(next[1]) : '') + ' (' + next[2] + ')'
+                        : '🚏 หมดเที่ยวของวันนี้แล้ว';
+                    note.hidden = false;
+                });
+            });
+        }
+
+        renderDepartures();
+        setInterval(renderDepartures, 60 * 1000);
+
+        // Auto-open Day 1 on load
+        document.addEventListener('DOMContentLoaded', function() {
+            toggleDay(1);
+        });
+
+        // Keyboard shortcuts
+        document.addEventListener('keydown', function(e) {
+            if (e.ctrlKey || e.metaKey) {
+                switch(e.key) {
+                    case 'e':
+                        e.preventDefault();
+                        expandAll();
+                        break;
+                    case 'c':
+                        e.preventDefault(); 
+                        collapseAll();
+                        break;
+                    case 'p':
+                        e.preventDefault();
+                        togglePrintMode();
+                        break;
+                }
+            }
+        });
+        '''
+
+    def generate(self):
+        """Main generation process"""
+        self._prepare_build()
+        print("\n🚀 Starting Day-to-Day HTML generation...")
+        
+        # Get content data
+        content_data = self.get_content_data()
+        if not content_data:
+            print("❌ No content found. Aborting.")
+            return
+        
+        # Build date index once (weather, transfers, hotel per date)
+        date_index = self.build_date_index(content_data)
+        clothing_index = self.build_clothing_index(content_data)
+        
+        # Extract day-by-day info
+        days_data = self.extract_day_info(content_data, date_index, clothing_index)
+        if not days_data:
+            print("❌ No day data found. Aborting.")
+            return
+
+        # Overlap / gap / order / midnight check ของ timeline ทุกวัน (build log + badge บน day card)
+        with self.profiler.span('timeline_check'):
+            self.check_timelines(days_data)
+        
+        # Generate complete HTML
+        with self.profiler.span('template_assembly'):
+            html_content = self.generate_complete_html(days_data)
+        
+        # Generate output filename
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output_filename = f"Tokyo-Trip-Day-to-Day-v4.0-{timestamp}.html"
+        output_path = self.build_dir / output_filename
+        
+        # Write file
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            
+            file_size = output_path.stat().st_size
+            print("\n🎉 Day-to-Day HTML generation complete!")
+            print(f"   - File: {output_filename}")
+            print(f"   - Path: {output_path}")
+            print(f"   - Size: {file_size / 1024:.2f} KB")
+            anchors = check_anchors(output_path)
+            print(f"   - Anchors: {'✅' if anchors.ok else '❌'} {anchors.summary()}"
+                  f"{'' if anchors.ok else ' - python -m tokyo_trip check-anchors'}")
+            print("\n🔥 Version 4.0 Features:")
+            print("   ✅ Day-to-Day timeline structure")
+            print("   ✅ Integrated accommodation, transport, activities")
+            print("   ✅ Collapsible overview/details sections")  
+            print("   ✅ SPA functionality")
+            print("   ✅ Printer-friendly mode")
+            print("   ✅ Responsive mobile design")
+            print("   ✅ Keyboard shortcuts (Ctrl+E/C/P)")
+            print("   ✅ Auto-open Day 1 on load")
+            
+        except Exception as e:
+            print(f"❌ Error writing HTML file: {e}")
+
+        self.profiler.finish(self.build_dir / "report-day-to-day.json", generator="day-to-day")
+
+def main(profile=False, trace_memory=True, verbosity=0, log_json=False):
+    """Main function"""
+    configure_logging(verbosity, log_json)
+    print("🗼 Day-to-Day Tokyo Trip Generator v4.0")
+    print("=" * 60)
+    print("🆕 Features:")
+    print("   - Time-based day planner")
+    print("   - Integrated daily sections")
+    print("   - Expand/collapse functionality") 
+    print("   - SPA with printer mode")
+    print("   - Mobile-responsive design")
+    print("=" * 60)
+    
+    generator = DayToDayTokyoGenerator()
+    generator.profiler.enabled = profile
+    generator.profiler.trace_memory = trace_memory
+    generator.generate()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
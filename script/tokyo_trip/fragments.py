@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+HTML Fragments
+==============
+ต่อ HTML เป็น list ของชิ้นส่วนแล้ว join/stream ครั้งเดียว แทน `html += f'''...'''`
+
+`str +=` ใน loop อาจ copy string ที่สะสมไว้ทั้งหมดทุกรอบ (O(n^2) ตามจำนวน day/section)
+Fragments เก็บแค่ reference ของแต่ละชิ้น - join ครั้งเดียวตอน build() หรือเขียนลงไฟล์ทีละชิ้นด้วย write_to()
+
+ใช้งาน:
+    html = Fragments()
+    for day in days:
+        html.append(f'<div class="day-card">...</div>')
+    return html.build()
+
+    page = Fragments.from_template(template_html, {'{{CONTENT}}': content_html})
+    page.write_to(f)                        # ไม่ต้องสร้าง string ของทั้งหน้า
+"""
+
+import re
+
+
+class Fragments:
+    """List ของชิ้น HTML ที่ join ครั้งเดียว"""
+    __slots__ = ('_parts',)
+
+    def __init__(self, *parts):
+        self._parts = [part for part in parts if part]
+
+    @classmethod
+    def from_template(cls, template, replacements):
+        """
+        แบ่ง template ตาม placeholder แล้วใส่ค่าแทนที่เป็นชิ้น ๆ (เทียบเท่า str.replace ทุกตัว
+        แต่ไม่ copy template ทั้งก้อนต่อ placeholder และไม่แทนที่ placeholder ที่อยู่ในค่าที่ใส่เข้าไป)
+        """
+        fragments = cls()
+        if not replacements:
+            fragments.append(template)
+            return fragments
+
+        pattern = re.compile('|'.join(re.escape(key) for key in sorted(replacements, key=len, reverse=True)))
+        last_end = 0
+        for match in pattern.finditer(template):
+            fragments.append(template[last_end:match.start()])
+            fragments.append(replacements[match.group(0)])
+            last_end = match.end()
+        fragments.append(template[last_end:])
+        return fragments
+
+    def append(self, fragment):
+        """เพิ่มชิ้น HTML (str หรือ Fragments อีกตัว) - ชิ้นว่างถูกข้าม"""
+        if isinstance(fragment, Fragments):
+            self._parts.extend(fragment._parts)
+        elif fragment:
+            self._parts.append(fragment)
+        return self
+
+    def extend(self, fragments):
+        for fragment in fragments:
+            self.append(fragment)
+        return self
+
+    def __bool__(self):
+        return bool(self._parts)
+
+    def __len__(self):
+        """จำนวนตัวอักษรทั้งหมด (ไม่ต้อง join)"""
+        return sum(len(part) for part in self._parts)
+
+    def build(self, separator=''):
+        """Join ทุกชิ้นเป็น string เดียว"""
+        return separator.join(self._parts)
+
+    def write_to(self, stream):
+        """เขียนทีละชิ้นลง file object (stream) - คืนจำนวนตัวอักษรที่เขียน"""
+        stream.writelines(self._parts)
+        return len(self)
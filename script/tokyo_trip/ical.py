@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+iCalendar Export
+================
+Export ทุก timeline entry ของทุกวันเป็นไฟล์ .ics (RFC 5545) - หนึ่ง VEVENT ต่อ entry
+ใช้ในแอปปฏิทินได้ทันที (Google Calendar / Apple Calendar / Outlook)
+
+- วันที่ของแต่ละวัน: field **วันที่:** ถ้ามี ไม่มี = วันที่ในหัวข้อ # ของไฟล์วัน
+- เวลา: จาก timeline entry (HH:MM หรือ HH:MM-HH:MM) เป็นเวลาท้องถิ่นตาม entry['timezone']
+  (TZID=Asia/Tokyo ปกติ, Asia/Bangkok สำหรับช่วงฝั่งไทยของวันบิน/entry "(เวลาไทย)") + VTIMEZONE ทั้งสองเขต
+- DESCRIPTION: bullet ย่อยของ entry (ตัด markdown ออกแล้ว)
+- เขียนลง stream ทีละบรรทัด (fold ที่ 75 octets + CRLF) - ไม่ประกอบทั้งปฏิทินเป็น string ก้อนเดียว
+
+ใช้งาน:
+    python -m tokyo_trip ical                      # build/Tokyo-Trip-March-2026-<timestamp>.ics
+    python -m tokyo_trip ical -o trip.ics
+
+    with open(path, 'w', encoding='utf-8', newline='') as stream:
+        write_calendar(stream, iter_events(generator, days_data))
+"""
+
+import datetime
+
+TIMEZONE_ID = "Asia/Tokyo"
+PRODUCT_ID = "-//Tokyo Trip 2026//Day-to-Day Timeline//TH"
+UID_DOMAIN = "tokyo-trip-2026"
+
+# ความยาวบรรทัดสูงสุด (ไม่รวม CRLF) ตาม RFC 5545 3.1
+MAX_LINE_OCTETS = 75
+
+# TZID -> (offset, ชื่อย่อ) - ญี่ปุ่นและไทยไม่มี daylight saving, STANDARD เดียวพอ
+TIMEZONES = {
+    "Asia/Tokyo": ("+0900", "JST"),
+    "Asia/Bangkok": ("+0700", "ICT"),
+}
+
+
+def vtimezone_lines(tzid):
+    offset, name = TIMEZONES[tzid]
+    return (
+        "BEGIN:VTIMEZONE",
+        f"TZID:{tzid}",
+        "BEGIN:STANDARD",
+        "DTSTART:19700101T000000",
+        f"TZOFFSETFROM:{offset}",
+        f"TZOFFSETTO:{offset}",
+        f"TZNAME:{name}",
+        "END:STANDARD",
+        "END:VTIMEZONE",
+    )
+
+
+def escape_text(text):
+    """Escape ค่า TEXT (backslash, ; , และขึ้นบรรทัดใหม่)"""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def fold_line(line):
+    """
+    แบ่งบรรทัดยาวเป็นชิ้นละไม่เกิน 75 octets (UTF-8) โดยไม่ตัดกลางตัวอักษร
+    ชิ้นถัดไปขึ้นต้นด้วย space หนึ่งตัว (นับรวมใน 75)
+    """
+    if len(line) * 4 <= MAX_LINE_OCTETS or len(line.encode('utf-8')) <= MAX_LINE_OCTETS:
+        yield line
+        return
+
+    chunk_start = 0
+    octets = 0
+    limit = MAX_LINE_OCTETS
+    for i, char in enumerate(line):
+        size = len(char.encode('utf-8'))
+        if octets + size > limit:
+            yield line[chunk_start:i]
+            chunk_start = i
+            octets = 1  # space นำหน้าของบรรทัดต่อ
+        octets += size
+    yield line[chunk_start:]
+
+
+class CalendarWriter:
+    """เขียน content line ของ iCalendar ลง text stream ทันที (stream ควรเปิดด้วย newline='')"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.events = 0
+
+    def line(self, text):
+        for i, part in enumerate(fold_line(text)):
+            self.stream.write(f"{' ' if i else ''}{part}\r\n")
+
+    def begin(self):
+        self.line("BEGIN:VCALENDAR")
+        self.line("VERSION:2.0")
+        self.line(f"PRODID:{PRODUCT_ID}")
+        self.line("CALSCALE:GREGORIAN")
+        self.line("METHOD:PUBLISH")
+        self.line(f"X-WR-TIMEZONE:{TIMEZONE_ID}")
+        for tzid in TIMEZONES:
+            for text in vtimezone_lines(tzid):
+                self.line(text)
+
+    def event(self, uid, start, end, summary, description='', stamp=None,
+              timezone=TIMEZONE_ID, end_timezone=None):
+        """หนึ่ง VEVENT - start/end เป็น datetime แบบ naive (เวลาท้องถิ่นของ timezone / end_timezone)"""
+        stamp = stamp or datetime.datetime.now(datetime.timezone.utc)
+        self.line("BEGIN:VEVENT")
+        self.line(f"UID:{uid}")
+        self.line(f"DTSTAMP:{stamp.strftime('%Y%m%dT%H%M%SZ')}")
+        self.line(f"DTSTART;TZID={timezone}:{start.strftime('%Y%m%dT%H%M%S')}")
+        self.line(f"DTEND;TZID={end_timezone or timezone}:{end.strftime('%Y%m%dT%H%M%S')}")
+        self.line(f"SUMMARY:{escape_text(summary)}")
+        if description:
+            self.line(f"DESCRIPTION:{escape_text(description)}")
+        self.line("END:VEVENT")
+        self.events += 1
+
+    def end(self):
+        self.line("END:VCALENDAR")
+
+
+def iter_events(generator, days_data):
+    """
+    Generator ของ event ทีละ entry (วันต่อวัน) -> dict {uid, start, end, summary, description, timezone, end_timezone}
+    parse timeline ทีละวันตอนถูกดึง - ไม่สร้างรายการ event ทั้งทริปล่วงหน้า
+    """
+    for day_num in sorted(days_data):
+        day_data = days_data[day_num]
+        date = generator.resolve_day_date(day_data['full_content'])
+        if date is None:
+            print(f"⚠️ Day {day_num}: no date found - skipped")
+            continue
+        midnight = datetime.datetime.combine(date, datetime.time())
+        for index, entry in enumerate(generator.parse_timeline_entries(day_data['timeline_section']), 1):
+            start = midnight + datetime.timedelta(minutes=entry['start'])
+            yield {
+                'uid': f"{date:%Y%m%d}-{start:%H%M}-{index}@{UID_DOMAIN}",
+                'start': start,
+                'end': midnight + datetime.timedelta(minutes=entry['end']),
+                'summary': entry['label'],
+                'description': '\n'.join(entry['details']),
+                'timezone': entry['timezone'],
+                'end_timezone': entry['end_timezone'],
+            }
+
+
+def write_calendar(stream, events):
+    """เขียน VCALENDAR ทั้งไฟล์ลง stream ทีละ event -> จำนวน VEVENT"""
+    stamp = datetime.datetime.now(datetime.timezone.utc)
+    writer = CalendarWriter(stream)
+    writer.begin()
+    for event in events:
+        writer.event(stamp=stamp, **event)
+    writer.end()
+    return writer.events
+
+
+def export_ical(output_path=None, verbosity=0, log_json=False):
+    """Export timeline ของทุกวันเป็น .ics -> path ของไฟล์ (None = ไม่มีข้อมูล)"""
+    import time
+    from pathlib import Path
+    from tokyo_trip.day_to_day import DayToDayTokyoGenerator
+    from tokyo_trip.log import configure_logging
+
+    configure_logging(verbosity, log_json)
+    generator = DayToDayTokyoGenerator()
+    content_data = generator.get_content_data()
+    if not content_data:
+        print("❌ No content found. Aborting.")
+        return None
+    days_data = generator.extract_day_info(content_data)
+    if not days_data:
+        print("❌ No day data found. Aborting.")
+        return None
+
+    if output_path is None:
+        generator.build_dir.mkdir(exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output_path = generator.build_dir / f"Tokyo-Trip-March-2026-{timestamp}.ics"
+    output_path = Path(output_path)
+
+    print(f"📆 Writing iCalendar: {output_path.name}")
+    start = time.perf_counter()
+    with open(output_path, 'w', encoding='utf-8', newline='') as stream:
+        count = write_calendar(stream, iter_events(generator, days_data))
+    print(f"💾 Saved: {output_path} ({count} events, {output_path.stat().st_size / 1024:.1f} KB, "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+    return output_path
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Inline Formatting Engine
+========================
+แปลง inline markdown (`code`, [link](url), **strong**, *em*) ที่เดียวสำหรับทุก generator
+
+- scan เดียวสำหรับ code / link / strong (alternation - ตัวที่เริ่มก่อนชนะ) แล้วตามด้วย em
+  (em ต้องรันหลัง strong เสมอ เพื่อให้ได้ผลเหมือนเดิม เช่น *a **b** c* -> <em>a <strong>b</strong> c</em>)
+- ทำงานทีละบรรทัด (pattern ไม่ข้ามบรรทัดอยู่แล้ว) + LRU cache ตามข้อความของบรรทัด
+  บรรทัดซ้ำ ๆ เช่น "เดิน 3 นาที" หรือ boilerplate ที่ใช้ร่วมกัน ถูก format ครั้งเดียวทั้ง build
+- บรรทัดที่ไม่มี * ` [ ผ่านไปเลยโดยไม่เข้า regex / cache
+
+ใช้งาน:
+    from tokyo_trip.inline import format_inline
+    html = format_inline(text)                 # strong + em + code + link
+    html = format_inline(text, em=False)       # เฉพาะ strong/code/link (nav card descriptions)
+"""
+
+import re
+import functools
+
+# ลำดับใน alternation: code ก่อน (ข้างในไม่ถูก format), link, strong
+# `[^`\n]+` ต้องมีอย่างน้อยหนึ่งตัว - ``` (code fence) จึงไม่ถูกจับเป็น code ว่าง
+INLINE_PATTERNS = {
+    'inline.scan': re.compile(
+        r'`(?P<code>[^`\n]+)`'
+        r'|\[(?P<label>[^\]\n]+)\]\((?P<url>[^)\s]+)\)'
+        r'|\*\*(?P<strong>.*?)\*\*'
+    ),
+    'inline.em': re.compile(r'\*(.*?)\*'),
+}
+
+_SCAN_PATTERN = INLINE_PATTERNS['inline.scan']
+_EM_PATTERN = INLINE_PATTERNS['inline.em']
+_INLINE_MARKERS = ('*', '`', '[')
+
+
+def _scan_replace(match):
+    code = match.group('code')
+    if code is not None:
+        # * ใน code ถูก escape ไว้ ไม่ให้ em pass จับได้
+        return f'<code>{code.replace("*", "&#42;")}</code>'
+    label = match.group('label')
+    if label is not None:
+        return f'<a href="{match.group("url")}" target="_blank" rel="noopener">{label}</a>'
+    return f'<strong>{match.group("strong")}</strong>'
+
+
+class InlineFormatter:
+    """Inline formatter ที่มี LRU cache ต่อบรรทัด (แยกตามโหมด em)"""
+
+    def __init__(self, maxsize=4096):
+        self._format_line = functools.lru_cache(maxsize=maxsize)(self._render_line)
+
+    @staticmethod
+    def _render_line(line, em):
+        html = _SCAN_PATTERN.sub(_scan_replace, line)
+        if em:
+            html = _EM_PATTERN.sub(r'<em>\1</em>', html)
+        return html
+
+    def format_line(self, line, em=True):
+        if not any(marker in line for marker in _INLINE_MARKERS):
+            return line
+        return self._format_line(line, em)
+
+    def format(self, text, em=True):
+        """Format ทั้งข้อความ (หลายบรรทัด) - แต่ละบรรทัดผ่าน cache"""
+        if not text or not any(marker in text for marker in _INLINE_MARKERS):
+            return text
+        if '\n' not in text:
+            return self._format_line(text, em)
+        format_line = self.format_line
+        return '\n'.join([format_line(line, em) for line in text.split('\n')])
+
+    def cache_info(self):
+        return self._format_line.cache_info()
+
+    def cache_clear(self):
+        self._format_line.cache_clear()
+
+
+# ตัวกลางที่ทุก generator ใช้ร่วมกัน - `python -m tokyo_trip all` จึงใช้ cache เดียวทั้ง build
+default_formatter = InlineFormatter()
+
+
+def format_inline(text, em=True):
+    """Format inline markdown ด้วย formatter กลาง"""
+    return default_formatter.format(text, em)
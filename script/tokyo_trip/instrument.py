@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Build Instrumentation
+=====================
+วัดเวลาและหน่วยความจำของแต่ละขั้นตอนใน build:
+- wall time (time.perf_counter)
+- CPU time (time.process_time)
+- tracemalloc peak ต่อ span
+
+ใช้งาน:
+    profiler = BuildProfiler(enabled=True)
+    with profiler.span('markdown.tables'):
+        ...
+
+    @profiled('get_content_data')      # method ของ object ที่มี self.profiler
+    def get_content_data(self): ...
+
+    profiler.write_report(build_dir / 'report-day-to-day.json', generator='day-to-day')
+    profiler.print_summary()
+
+เมื่อ enabled=False ทุก span เป็น no-op (ค่าเริ่มต้นของทุก generator)
+"""
+
+import json
+import time
+import datetime
+import functools
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class _SpanFrame:
+    """ข้อมูลของ span ที่กำลังทำงานอยู่ (อยู่ใน stack)"""
+    __slots__ = ('name', 'file', 'wall_start', 'cpu_start', 'mem_start', 'peak_abs')
+
+    def __init__(self, name, file, mem_start):
+        self.name = name
+        self.file = file
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.mem_start = mem_start
+        self.peak_abs = mem_start
+
+
+class BuildProfiler:
+    """
+    เก็บสถิติ span แบบซ้อนกันได้ - span ลูกจะได้ file ของ span แม่โดยอัตโนมัติ
+    สถิติถูกรวมตาม (file, name): calls, wall, cpu, peak
+    """
+
+    def __init__(self, enabled=False, trace_memory=True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self._stack = []
+        self._stats = {}
+        self._started_tracemalloc = False
+        self.started_at = None
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+    @contextmanager
+    def span(self, name, file=None):
+        """Context manager วัด wall/CPU/peak memory ของ block"""
+        if not self.enabled:
+            yield
+            return
+
+        self._ensure_started()
+        if file is None and self._stack:
+            file = self._stack[-1].file
+
+        frame = _SpanFrame(name, file, self._enter_memory())
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame.wall_start
+            cpu = time.process_time() - frame.cpu_start
+            peak = self._exit_memory(frame)
+            self._record(frame.name, frame.file, wall, cpu, peak)
+
+    def _ensure_started(self):
+        if self.started_at is None:
+            self.started_at = datetime.datetime.now()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def _enter_memory(self):
+        """บันทึก peak ของ span แม่ก่อน reset แล้วเริ่มนับ peak ใหม่สำหรับ span นี้"""
+        if not tracemalloc.is_tracing():
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_abs = max(parent.peak_abs, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _exit_memory(self, frame):
+        """คืนค่า peak (bytes) ของ span เทียบกับหน่วยความจำตอนเริ่ม span"""
+        if not tracemalloc.is_tracing():
+            return 0
+        _, peak = tracemalloc.get_traced_memory()
+        frame.peak_abs = max(frame.peak_abs, peak)
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_abs = max(parent.peak_abs, frame.peak_abs)
+        tracemalloc.reset_peak()
+        return max(0, frame.peak_abs - frame.mem_start)
+
+    def _record(self, name, file, wall, cpu, peak):
+        stat = self._stats.get((file, name))
+        if stat is None:
+            stat = self._stats[(file, name)] = {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0}
+        stat['calls'] += 1
+        stat['wall'] += wall
+        stat['cpu'] += cpu
+        stat['peak'] = max(stat['peak'], peak)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def stop(self):
+        """หยุด tracemalloc ถ้า profiler เป็นคนเริ่ม"""
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
+
+    def spans_by_name(self):
+        """รวมสถิติทุกไฟล์ตามชื่อ span"""
+        totals = {}
+        for (_, name), stat in self._stats.items():
+            total = totals.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0})
+            total['calls'] += stat['calls']
+            total['wall'] += stat['wall']
+            total['cpu'] += stat['cpu']
+            total['peak'] = max(total['peak'], stat['peak'])
+        return totals
+
+    def report(self, generator=None):
+        """สร้าง dict สำหรับ report-<generator>.json"""
+        def as_row(name, stat, file=None):
+            row = {'name': name}
+            if file is not None:
+                row['file'] = file
+            row.update({
+                'calls': stat['calls'],
+                'wall_ms': round(stat['wall'] * 1000, 3),
+                'cpu_ms': round(stat['cpu'] * 1000, 3),
+                'peak_kb': round(stat['peak'] / 1024, 1),
+            })
+            return row
+
+        spans = [as_row(name, stat) for name, stat in self.spans_by_name().items()]
+        spans.sort(key=lambda row: row['wall_ms'], reverse=True)
+
+        files = {}
+        for (file, name), stat in sorted(self._stats.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+            if file is not None:
+                files.setdefault(file, []).append(as_row(name, stat))
+
+        return {
+            'generator': generator,
+            'started_at': self.started_at.isoformat(timespec='seconds') if self.started_at else None,
+            'trace_memory': self.trace_memory,
+            'spans': spans,
+            'files': files,
+        }
+
+    def write_report(self, path, generator=None):
+        """เขียน report เป็น JSON (เช่น build/report-trip.json)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(generator), f, ensure_ascii=False, indent=2)
+        return path
+
+    def finish(self, report_path, generator=None):
+        """จบการวัดผล: เขียน report (หนึ่งไฟล์ต่อ generator) + สรุปบน stdout (ไม่ทำอะไรถ้า disabled)"""
+        if not self.enabled:
+            return None
+        self.stop()
+        path = self.write_report(report_path, generator)
+        self.print_summary()
+        print(f"   - Report: {path}")
+        return path
+
+    def print_summary(self, limit=12):
+        """สรุป span ที่ใช้เวลามากที่สุดบน stdout"""
+        spans = self.report()['spans']
+        if not spans:
+            return
+
+        print("\n⏱️ Build profile (top spans by wall time):")
+        print(f"   {'span':<34} {'calls':>6} {'wall ms':>10} {'cpu ms':>10} {'peak KB':>10}")
+        for row in spans[:limit]:
+            print(f"   {row['name']:<34} {row['calls']:>6} {row['wall_ms']:>10.2f} "
+                  f"{row['cpu_ms']:>10.2f} {row['peak_kb']:>10.1f}")
+
+
+def profiled(name):
+    """Decorator สำหรับ method ของ object ที่มี attribute `profiler`"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.span(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
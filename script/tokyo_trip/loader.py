@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Content Loader
+==============
+อ่านไฟล์ content ทั้ง tree แบบขนาน (thread pool จำกัดจำนวน) สำหรับ content ขนาดใหญ่ / network storage
+
+- list directory ครั้งเดียวด้วย os.scandir แล้วใช้ซ้ำ (ไม่ glob th แล้ว glob en ใหม่)
+- อ่าน bytes + decode UTF-8 ใน worker thread (I/O ปล่อย GIL ระหว่างรอ storage)
+- เก็บ latency ต่อไฟล์ (log debug ทีละไฟล์ + สรุปบน stdout)
+- MappedText: ไฟล์อ้างอิงขนาดใหญ่ (guide-book.txt) อ่านผ่าน mmap - หา landmark บน bytes
+  แล้ว decode เฉพาะช่วงที่ render จริง (หน่วยความจำไม่โตตามขนาดไฟล์)
+
+ใช้งาน:
+    loader = ContentLoader(content_dir)
+    content_data = loader.load_content(secondary_only=True)    # {'003-day1': {'th': ..., 'en': ...}}
+    loader.print_summary()
+
+    with MappedText(path) as guide:
+        for match in guide.finditer(heading_pattern):      # bytes pattern
+            body = guide.decode(match.end(), next_start)
+"""
+
+import os
+import mmap
+import time
+import codecs
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from tokyo_trip.log import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+DECODE_CHUNK_SIZE = 256 * 1024
+
+_ASCII_WHITESPACE = frozenset(b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')
+
+
+class ContentLoader:
+    """Loader ของ content directory (เช่น content/th, content/en) ที่อ่านไฟล์พร้อมกัน"""
+
+    def __init__(self, content_dir, max_workers=DEFAULT_MAX_WORKERS):
+        self.content_dir = Path(content_dir)
+        self.max_workers = max_workers
+        self.latencies = {}
+        self.bytes_read = 0
+        self.elapsed = 0.0
+        self._listing = None
+
+    # ------------------------------------------------------------------
+    # Directory listing
+    # ------------------------------------------------------------------
+    def listing(self, refresh=False):
+        """{ชื่อ subdirectory: [Path ของไฟล์ เรียงตามชื่อ]} จาก scandir รอบเดียว"""
+        if self._listing is None or refresh:
+            listing = {}
+            if self.content_dir.is_dir():
+                with os.scandir(self.content_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        with os.scandir(entry.path) as files:
+                            listing[entry.name] = sorted(
+                                Path(f.path) for f in files if f.is_file() and not f.name.startswith('.')
+                            )
+            self._listing = listing
+        return self._listing
+
+    def files(self, subdir, suffix='.md'):
+        return [path for path in self.listing().get(subdir, []) if path.suffix == suffix]
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _read(self, path):
+        """อ่าน + decode หนึ่งไฟล์ (รันใน worker thread) -> (text, จำนวน bytes)"""
+        start = time.perf_counter()
+        data = b''
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            text = data.decode('utf-8')
+            if '\r' in text:
+                # เหมือน open(..., 'r') (universal newlines)
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+        except FileNotFoundError:
+            print(f"⚠️ File not found: {path}")
+            text = ""
+        except Exception as e:
+            print(f"❌ Error reading {path}: {e}")
+            text = ""
+        self.latencies[path] = time.perf_counter() - start
+        return text, len(data)
+
+    def read_all(self, paths):
+        """อ่านหลายไฟล์พร้อมกัน -> {path: text} (ไฟล์ที่อ่านไม่ได้ = '')"""
+        paths = list(paths)
+        if not paths:
+            return {}
+
+        start = time.perf_counter()
+        workers = max(1, min(self.max_workers, len(paths)))
+        if workers == 1:
+            results = [self._read(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='content-loader') as pool:
+                results = list(pool.map(self._read, paths))
+        self.elapsed += time.perf_counter() - start
+        self.bytes_read += sum(size for _, size in results)
+
+        if log.debug_enabled:
+            for path in paths:
+                log.debug("📄 Loaded", file=path.name, ms=round(self.latencies[path] * 1000, 2))
+        return {path: text for path, (text, _) in zip(paths, results)}
+
+    def load_content(self, primary='th', secondary='en', secondary_only=False, extra=None):
+        """
+        อ่าน content ทั้งสองภาษาในรอบเดียว -> {file_key: {primary: ..., secondary: ...}}
+        - secondary_only: เก็บไฟล์ที่มีแต่ภาษารอง (primary = '')
+        - extra: {file_key: ชื่อไฟล์ใน primary dir} เช่น {'guide-book': 'guide-book.txt'}
+        ลำดับ key: ไฟล์ primary (เรียงตามชื่อ) -> extra -> ไฟล์ที่มีแต่ภาษารอง
+        """
+        # list ใหม่ทุกครั้งที่ load (watch mode) แต่ใช้ listing เดียวกันทั้ง primary / secondary / extra
+        self.listing(refresh=True)
+        self.latencies = {}
+        self.bytes_read = 0
+        self.elapsed = 0.0
+
+        primary_files = self.files(primary)
+        primary_keys = {path.stem for path in primary_files}
+        available = set(self.listing().get(primary, []))
+        extra_paths = {}
+        for key, name in (extra or {}).items():
+            path = self.content_dir / primary / name
+            if path in available:
+                extra_paths[key] = path
+        secondary_files = [path for path in self.files(secondary)
+                           if secondary_only or path.stem in primary_keys]
+
+        texts = self.read_all(primary_files + list(extra_paths.values()) + secondary_files)
+
+        content_data = {}
+        for path in primary_files:
+            content_data[path.stem] = {primary: texts[path], secondary: ''}
+        for key, path in extra_paths.items():
+            content_data[key] = {primary: texts[path], secondary: ''}
+        for path in secondary_files:
+            entry = content_data.get(path.stem)
+            if entry is not None:
+                entry[secondary] = texts[path]
+            else:
+                content_data[path.stem] = {primary: '', secondary: texts[path]}
+        return content_data
+
+    def print_summary(self):
+        """สรุปจำนวนไฟล์ / ขนาด / เวลา และไฟล์ที่ช้าที่สุด"""
+        if not self.latencies:
+            return
+        slowest = max(self.latencies, key=self.latencies.get)
+        print(f"   - Loaded {len(self.latencies)} files ({self.bytes_read / 1024:.1f} KB) "
+              f"in {self.elapsed * 1000:.1f} ms; slowest: {slowest.name} "
+              f"({self.latencies[slowest] * 1000:.2f} ms)")
+
+
+class MappedText:
+    """
+    ไฟล์ UTF-8 ที่ map เข้าหน่วยความจำ (read-only) - ไม่ decode ทั้งไฟล์เป็น str
+    ตำแหน่งทั้งหมดเป็น byte offset; decode() ได้เฉพาะช่วงที่เริ่ม/จบตรงขอบตัวอักษร (เช่น ต้นบรรทัด)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.decoded_bytes = 0
+        self._file = None
+        self._map = b''
+
+    def __enter__(self):
+        self._file = open(self.path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = b''
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self):
+        return len(self._map)
+
+    def finditer(self, pattern):
+        """รัน bytes regex บน mapping โดยตรง (re รองรับ buffer protocol)"""
+        return pattern.finditer(self._map)
+
+    def decode(self, start=0, end=None, strip=False):
+        """
+        Copy + decode เฉพาะช่วง [start, end) (newline แบบเดียวกับ text-mode open)
+        strip=True: ตัด whitespace หัวท้ายบน bytes ก่อน copy (ไม่ต้อง copy str อีกรอบ)
+        """
+        end = len(self._map) if end is None else end
+        if strip:
+            while start < end and self._map[start] in _ASCII_WHITESPACE:
+                start += 1
+            while end > start and self._map[end - 1] in _ASCII_WHITESPACE:
+                end -= 1
+        self.decoded_bytes += end - start
+        if end - start <= DECODE_CHUNK_SIZE:
+            text = self._map[start:end].decode('utf-8')
+        else:
+            # ช่วงใหญ่: decode ทีละ chunk ผ่าน memoryview (ไม่ copy bytes ทั้งช่วง)
+            # decoder ของ bytes.decode() จองหน่วยความจำหลายเท่าของ input - ทีละ chunk peak ต่ำกว่ามาก
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            with memoryview(self._map) as view:
+                parts = [decoder.decode(view[offset:min(offset + DECODE_CHUNK_SIZE, end)])
+                         for offset in range(start, end, DECODE_CHUNK_SIZE)]
+            parts.append(decoder.decode(b'', final=True))
+            text = ''.join(parts)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        # whitespace ที่ไม่ใช่ ASCII (เช่น U+3000) ยังต้องตัดแบบ str - ถ้าไม่มีอะไรให้ตัด strip() คืน object เดิม
+        return text.strip() if strip else text
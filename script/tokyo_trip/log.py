@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Structured Logging
+==================
+Logging facade บาง ๆ บน stdlib logging สำหรับ hot path ของ generators
+- มี level (debug/info/warning/error) และ structured fields (key=value)
+- เงียบเป็นค่าเริ่มต้น: debug/info ไม่แสดงจนกว่าจะเรียก configure_logging()
+- ตอนปิดอยู่ ค่าใช้จ่ายแค่การเช็ค boolean - ใน loop ให้ hoist `log.debug_enabled` ไว้ก่อน
+
+ใช้งาน:
+    log = get_logger(__name__)
+    log.debug("⏰ timeline block", kind='range', items=12)
+
+    debug = log.debug_enabled
+    for placeholder in placeholders:
+        if debug:
+            log.debug("✅ restored", placeholder=placeholder)
+"""
+
+import json
+import logging
+
+ROOT_LOGGER_NAME = 'tokyo_trip'
+
+logging.getLogger(ROOT_LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+class TripLogger:
+    """Facade ของ logging.Logger ที่รับ structured fields เป็น keyword arguments"""
+    __slots__ = ('_logger',)
+
+    def __init__(self, logger):
+        self._logger = logger
+
+    @property
+    def debug_enabled(self):
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def info_enabled(self):
+        return self._logger.isEnabledFor(logging.INFO)
+
+    def _log(self, level, event, fields):
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, event, extra={'fields': fields})
+
+    def debug(self, event, **fields):
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event, **fields):
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event, **fields):
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event, **fields):
+        self._log(logging.ERROR, event, fields)
+
+
+def get_logger(name=ROOT_LOGGER_NAME):
+    """คืน TripLogger ภายใต้ namespace tokyo_trip"""
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + '.'):
+        name = f'{ROOT_LOGGER_NAME}.{name}'
+    return TripLogger(logging.getLogger(name))
+
+
+class _TextFormatter(logging.Formatter):
+    """   <event> key=value key=value"""
+
+    def format(self, record):
+        fields = getattr(record, 'fields', None) or {}
+        parts = [f"   {record.getMessage()}"]
+        parts.extend(f"{key}={value}" for key, value in fields.items())
+        return ' '.join(parts)
+
+
+class _JsonFormatter(logging.Formatter):
+    """หนึ่ง JSON object ต่อบรรทัด"""
+
+    def format(self, record):
+        payload = {
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'event': record.getMessage(),
+        }
+        payload.update(getattr(record, 'fields', None) or {})
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def configure_logging(verbosity=0, json_output=False, stream=None):
+    """
+    ตั้งค่า output ของ logger tokyo_trip (เรียกจาก CLI/main เท่านั้น)
+    verbosity: 0 = warning ขึ้นไป, 1 = info, 2+ = debug
+    """
+    level = logging.WARNING
+    if verbosity == 1:
+        level = logging.INFO
+    elif verbosity >= 2:
+        level = logging.DEBUG
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(_JsonFormatter() if json_output else _TextFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Regex Backtracking Guard
+========================
+ป้องกัน regex ที่ backtrack หนักจน build ค้างเมื่อ markdown ผิดรูป (เช่น paste ตารางมาครึ่งเดียว)
+
+- Runtime: RegexGuard จับเวลาทุก pattern กับทุก input แล้ว log.warning เมื่อเกิน budget
+  (budget = min_budget_ms + ns_per_char * ความยาว input - ของจริงใช้ไม่ถึง 1% ของ budget)
+- Check time: check_patterns() รัน FUZZ_CORPUS ที่ขนาด n, 2n, 4n แล้วดู growth ของเวลา
+  ถ้าเวลาโตเร็วกว่า linear (exponent > max_exponent) = superlinear -> flag
+
+ใช้งาน:
+    guard = RegexGuard()
+    found = guard.findall('markdown.tables', table_pattern, text)
+    text = guard.sub('markdown.tables', table_pattern, table_repl, text)
+
+    python -m tokyo_trip regex-check      # fuzz ทุก pattern ใน BLOCK_PATTERNS (exit 1 ถ้าเจอ superlinear)
+"""
+
+import math
+import time
+
+from tokyo_trip.log import get_logger
+
+log = get_logger(__name__)
+
+# Input ผิดรูปที่มักทำให้ regex backtrack: บรรทัดยาวไม่มี newline, delimiter ไม่ปิด, indent ซ้อน
+# name -> function(n) ที่สร้าง input ขนาดประมาณ n
+FUZZ_CORPUS = {
+    'pipes_no_newline': lambda n: '|' * n,
+    'table_row_no_newline': lambda n: '|' + 'a|' * (n // 2),
+    'table_rows': lambda n: '| a | b |\n' * (n // 10),
+    'table_separator_no_close': lambda n: '| a |\n|' + '-' * n,
+    'box_unclosed_bold': lambda n: '> **' + '*' * n,
+    'box_prompt_lines': lambda n: '> **Note:** x\n' + '> ' * (n // 2),
+    'timeline_indent_run': lambda n: '- **10:00**: x\n' + '  ' * (n // 2),
+    'timeline_indented_lines': lambda n: '- **10:00**: x\n' + '    a  b\n' * (n // 9),
+    'timeline_unclosed_bold': lambda n: '- **' + 'a' * n + '*',
+    'timeline_no_colon': lambda n: '- **10:00** ' + 'a' * n,
+    'h3_long_line': lambda n: '<h3>x</h3>\n' + 'a' * n,
+    'h3_many_lines': lambda n: '<h3>x</h3>\n' + 'ab\n' * (n // 3),
+    'h3_unclosed': lambda n: '<h3>' + 'x' * n,
+    'li_unclosed': lambda n: '<li>' * (n // 4),
+    'bold_unclosed': lambda n: '**' + '*' * n,
+    'bold_pairs': lambda n: '** a ' * (n // 5),
+}
+
+
+class RegexGuard:
+    """
+    จับเวลา findall/sub ของแต่ละ pattern และเตือนเมื่อใช้เวลาเกิน budget
+    สถิติเก็บตามชื่อ: calls, chars, seconds, worst (ms, chars)
+    """
+
+    def __init__(self, min_budget_ms=25.0, ns_per_char=500):
+        self.min_budget_ms = min_budget_ms
+        self.ns_per_char = ns_per_char
+        self.stats = {}
+        self.flagged = []
+
+    def budget_ms(self, length):
+        return self.min_budget_ms + self.ns_per_char * length / 1e6
+
+    def _record(self, name, length, elapsed):
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = {'calls': 0, 'chars': 0, 'seconds': 0.0, 'worst_ms': 0.0, 'worst_chars': 0}
+        stat['calls'] += 1
+        stat['chars'] += length
+        stat['seconds'] += elapsed
+
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms > stat['worst_ms']:
+            stat['worst_ms'] = elapsed_ms
+            stat['worst_chars'] = length
+
+        budget = self.budget_ms(length)
+        if elapsed_ms > budget:
+            self.flagged.append((name, length, elapsed_ms))
+            log.warning("🐌 Regex over budget", pattern=name, chars=length,
+                        ms=round(elapsed_ms, 2), budget_ms=round(budget, 2))
+
+    def findall(self, name, pattern, text):
+        start = time.perf_counter()
+        result = pattern.findall(text)
+        self._record(name, len(text), time.perf_counter() - start)
+        return result
+
+    def sub(self, name, pattern, repl, text):
+        start = time.perf_counter()
+        result = pattern.sub(repl, text)
+        self._record(name, len(text), time.perf_counter() - start)
+        return result
+
+    def call(self, name, func, text, *args):
+        """จับเวลา function ที่รัน regex ภายใน (เช่น format_inline) แบบเดียวกับ sub"""
+        start = time.perf_counter()
+        result = func(text, *args)
+        self._record(name, len(text), time.perf_counter() - start)
+        return result
+
+
+def _time_pattern(pattern, text, repeat):
+    """
+    เวลาที่ดีที่สุดจาก repeat รอบของ findall + sub (ตัด noise จาก scheduler)
+    pattern เป็น function(text) ก็ได้ - สำหรับ pattern ที่ caller จำกัดช่วง input ไว้ (เช่น wrap_list_items)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if hasattr(pattern, 'findall'):
+            pattern.findall(text)
+            pattern.sub('', text)
+        else:
+            pattern(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def growth_exponent(pattern, make_input, sizes=(2000, 4000, 8000), repeat=3):
+    """
+    ประมาณ k ใน time ~ n^k จากขนาดที่ใหญ่ที่สุดสองขนาด
+    k ~ 1 = linear, k ~ 2 = quadratic (backtracking ต่อตำแหน่ง)
+    Returns: (exponent, seconds ที่ขนาดใหญ่สุด)
+    """
+    timings = [_time_pattern(pattern, make_input(n), repeat) for n in sizes]
+    small, large = timings[-2], timings[-1]
+    ratio = sizes[-1] / sizes[-2]
+    if small <= 0:
+        return 0.0, large
+    return math.log(max(large, 1e-9) / small, ratio), large
+
+
+def check_patterns(patterns, corpus=None, sizes=(2000, 4000, 8000), max_exponent=1.5, min_seconds=0.002):
+    """
+    Fuzz ทุก pattern ด้วยทุก input ใน corpus
+    patterns: {name: compiled pattern หรือ function(text)}
+    Returns: list ของ (pattern name, input name, exponent, seconds) ที่ superlinear
+    (input ที่เร็วกว่า min_seconds ไม่นับ - เวลาระดับ microsecond วัด growth ไม่ได้)
+    """
+    corpus = corpus or FUZZ_CORPUS
+    problems = []
+    for name, pattern in patterns.items():
+        for input_name, make_input in corpus.items():
+            exponent, seconds = growth_exponent(pattern, make_input, sizes)
+            if exponent > max_exponent and seconds > min_seconds:
+                problems.append((name, input_name, exponent, seconds))
+    return problems
+
+
+def run_regex_check(sizes=(2000, 4000, 8000)):
+    """CLI: fuzz patterns ของ markdown pipeline - คืน exit code (0 = ผ่าน)"""
+    from tokyo_trip.inline import INLINE_PATTERNS
+    from tokyo_trip.trip_generator import BLOCK_PATTERNS, wrap_list_items
+
+    patterns = dict(BLOCK_PATTERNS)
+    patterns.update(INLINE_PATTERNS)
+    patterns['lists.wrap'] = wrap_list_items
+    print(f"🔍 Fuzzing {len(patterns)} patterns x {len(FUZZ_CORPUS)} inputs (sizes {sizes})...")
+
+    problems = check_patterns(patterns, sizes=sizes)
+    if not problems:
+        print("   ✅ All patterns scale linearly")
+        return 0
+
+    for name, input_name, exponent, seconds in problems:
+        print(f"   ❌ {name} on {input_name}: ~n^{exponent:.1f} ({seconds * 1000:.1f} ms at n={sizes[-1]})")
+    return 1
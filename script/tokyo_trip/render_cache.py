@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Block Render Cache
+==================
+Cache HTML ของแต่ละ complex block (table, box, timeline) ตามเนื้อหา markdown ของ block
+
+แก้ timeline entry เดียวในไฟล์ day ขนาด 24 KB -> render ใหม่แค่ block ที่ข้อความเปลี่ยน
+block อื่นในหน้าเดียวกันดึงจาก cache แล้ว splice กลับผ่าน placeholder เหมือนเดิม
+
+key = (kind, markdown ของ block) - dict ของ Python hash string ให้อยู่แล้ว และเทียบข้อความจริงเมื่อ hash ชน
+จึงไม่มีโอกาส cache ผิด block (ต่างจาก digest แบบตัดสั้น)
+
+ใช้งาน:
+    cache = BlockCache()
+    cache.begin_build()
+    html = cache.render('table', table_md, self._process_table_block)
+    cache.end_build()          # ทิ้ง block ที่ไม่ถูกใช้แล้วใน build นี้ (ข้อความเก่าก่อนแก้)
+"""
+
+
+class BlockCache:
+    """In-memory cache: (kind, markdown) -> HTML ใช้ข้าม build ใน process เดียว (watch mode)"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._entries = {}
+        self._live = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def begin_build(self):
+        """เริ่ม build ใหม่ - reset สถิติและรายการ block ที่ถูกใช้"""
+        self._live = set()
+        self.hits = 0
+        self.misses = 0
+
+    def end_build(self):
+        """ทิ้ง entry ที่ไม่ถูกใช้ใน build ล่าสุด ไม่ให้ cache โตไม่หยุดใน watch mode"""
+        if self._live:
+            stale = [key for key in self._entries if key not in self._live]
+            for key in stale:
+                del self._entries[key]
+
+    def render(self, kind, markdown, renderer, *args):
+        """
+        คืน HTML จาก cache หรือเรียก renderer(markdown, *args) ถ้ายังไม่มี
+        kind ต้องแยกตาม args ที่ทำให้ผลต่างกัน (เช่น 'timeline.range' กับ 'timeline.time')
+        """
+        if not self.enabled:
+            return renderer(markdown, *args)
+
+        key = (kind, markdown)
+        self._live.add(key)
+        html = self._entries.get(key)
+        if html is None:
+            self.misses += 1
+            html = self._entries[key] = renderer(markdown, *args)
+        else:
+            self.hits += 1
+        return html
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming HTML Rewriter
+=======================
+Post-build rewrite stage: แก้ไฟล์ HTML ที่ build แล้ว (แทน CSS/JS, แก้ attribute) ในรอบเดียว
+บน tokenizer แบบ streaming (html.parser) - ไม่ต้องโหลดทั้งไฟล์แล้ว re.sub ทั้งเอกสารทีละ pattern
+
+- อ่าน input ทีละ chunk -> tokenizer -> เขียน output ทันที (หน่วยความจำ = chunk + element ที่ยาวที่สุด
+  ที่ tokenizer ต้องรอจนครบ เช่น <script> หนึ่งก้อน)
+- token ที่ไม่มี rule ตรง ถูกเขียนกลับตามต้นฉบับ (start tag ใช้ข้อความดิบ, entity/charref ไม่ถูก decode)
+- rule ทุกตัวทำงานใน pass เดียวกัน: ReplaceContent (แทนเนื้อหาใน element), SetAttributes (แก้ attribute)
+- ใช้กับ artifact ที่ generator ไหนสร้างก็ได้ (trip / day-to-day / guidebook / batch)
+
+ใช้งาน:
+    rules = [
+        ReplaceContent('style', css, bare=True),
+        ReplaceContent('script', js, bare=True),      # ไม่แตะ <script type="application/json" id=...>
+        SetAttributes('button', {'data-lang': 'th', 'class': 'active'}, match={'data-lang': 'th'}, replace=True),
+    ]
+    rewrite_file(latest_build(build_dir), output_path, rules)
+
+ข้อจำกัด: end tag ถูกเขียนเป็น </tag> ตัวพิมพ์เล็ก และ entity ที่ไม่มี ; (เช่น &amp) ได้ ; เพิ่ม
+(html.parser ไม่ส่งข้อความดิบของสองอย่างนี้มา) - output ของ generators ไม่มีทั้งสองกรณี
+"""
+
+import os
+import re
+from pathlib import Path
+from html.parser import HTMLParser
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# timestamp ในชื่อไฟล์ build: Tokyo-Trip-March-2026-v3.1-20261019-124932.html
+BUILD_TIMESTAMP_PATTERN = re.compile(r"-(\d{8}-\d{4,6})\.html$")
+
+
+class Rule:
+    """
+    Rule พื้นฐาน: tag + attribute ที่ต้องตรง (match=None = ทุก element ของ tag นั้น)
+    bare=True: เฉพาะ element ที่ไม่มี attribute เลย (เช่น <script> ของ generator แต่ไม่ใช่ data island)
+    """
+
+    def __init__(self, tag, match=None, limit=None, bare=False):
+        self.tag = tag.lower()
+        self.match = match
+        self.limit = limit
+        self.bare = bare
+        self.applied = 0
+
+    def matches(self, tag, attrs):
+        if tag != self.tag or (self.limit is not None and self.applied >= self.limit):
+            return False
+        if self.bare and attrs:
+            return False
+        if self.match:
+            values = dict(attrs)
+            return all(values.get(name) == value for name, value in self.match.items())
+        return True
+
+
+class ReplaceContent(Rule):
+    """แทนเนื้อหาทั้งหมดระหว่าง start tag กับ end tag ของ element (เช่น <style>, <script>)"""
+
+    def __init__(self, tag, content, match=None, limit=None, bare=False):
+        super().__init__(tag, match, limit, bare)
+        self.content = content
+
+
+class SetAttributes(Rule):
+    """
+    ตั้งค่า attribute ของ start tag (value=None = ลบ attribute)
+    replace=True: ทิ้ง attribute เดิมทั้งหมด เหลือเฉพาะที่กำหนด
+    """
+
+    def __init__(self, tag, attrs, match=None, replace=False, limit=None):
+        super().__init__(tag, match, limit)
+        self.attrs = attrs
+        self.replace = replace
+
+    def apply(self, attrs):
+        result = {} if self.replace else dict(attrs)
+        for name, value in self.attrs.items():
+            if value is None:
+                result.pop(name, None)
+            else:
+                result[name] = value
+        return list(result.items())
+
+
+def _format_starttag(tag, attrs, self_closing=False):
+    parts = [f'<{tag}']
+    for name, value in attrs:
+        if value is None:
+            parts.append(f' {name}')
+        else:
+            value = value.replace('&', '&amp;').replace('"', '&quot;')
+            parts.append(f' {name}="{value}"')
+    parts.append(' />' if self_closing else '>')
+    return ''.join(parts)
+
+
+class HtmlRewriter(HTMLParser):
+    """Tokenizer ที่เขียน token กลับลง stream ทันที พร้อมใช้ rule ระหว่างทาง"""
+
+    def __init__(self, stream, rules):
+        super().__init__(convert_charrefs=False)
+        self.stream = stream
+        self.rules = list(rules)
+        self._content_rules = [rule for rule in self.rules if isinstance(rule, ReplaceContent)]
+        self._attribute_rules = [rule for rule in self.rules if isinstance(rule, SetAttributes)]
+        # element ที่เนื้อหากำลังถูกแทน: (tag, ความลึกของ tag ซ้อนชื่อเดียวกัน)
+        self._skip_tag = None
+        self._skip_depth = 0
+
+    def _write(self, text):
+        if self._skip_tag is None:
+            self.stream.write(text)
+
+    def _rewrite_starttag(self, tag, attrs, self_closing):
+        changed = False
+        for rule in self._attribute_rules:
+            if rule.matches(tag, attrs):
+                attrs = rule.apply(attrs)
+                rule.applied += 1
+                changed = True
+        if changed:
+            return _format_starttag(tag, attrs, self_closing), attrs
+        return self.get_starttag_text(), attrs
+
+    # ------------------------------------------------------------------
+    # Tokenizer callbacks
+    # ------------------------------------------------------------------
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        text, attrs = self._rewrite_starttag(tag, attrs, False)
+        self.stream.write(text)
+        for rule in self._content_rules:
+            if rule.matches(tag, attrs):
+                rule.applied += 1
+                self.stream.write(rule.content)
+                self._skip_tag = tag
+                self._skip_depth = 0
+                break
+
+    def handle_startendtag(self, tag, attrs):
+        if self._skip_tag is None:
+            self.stream.write(self._rewrite_starttag(tag, attrs, True)[0])
+
+    def handle_endtag(self, tag):
+        if self._skip_tag is not None:
+            if tag != self._skip_tag:
+                return
+            if self._skip_depth:
+                self._skip_depth -= 1
+                return
+            self._skip_tag = None
+        self.stream.write(f'</{tag}>')
+
+    def handle_data(self, data):
+        self._write(data)
+
+    def handle_entityref(self, name):
+        self._write(f'&{name};')
+
+    def handle_charref(self, name):
+        self._write(f'&#{name};')
+
+    def handle_comment(self, data):
+        self._write(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self._write(f'<!{decl}>')
+
+    def unknown_decl(self, data):
+        self._write(f'<![{data}]>')
+
+    def handle_pi(self, data):
+        self._write(f'<?{data}>')
+
+
+def rewrite_stream(source, stream, rules, chunk_size=DEFAULT_CHUNK_SIZE):
+    """อ่าน source (text file object) ทีละ chunk แล้วเขียนผลลง stream -> จำนวนตัวอักษรที่อ่าน"""
+    rewriter = HtmlRewriter(stream, rules)
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        rewriter.feed(chunk)
+    rewriter.close()
+    return total
+
+
+def rewrite_file(input_path, output_path, rules, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Rewrite ไฟล์ HTML (output_path เป็นไฟล์เดียวกับ input ได้ - เขียนลงไฟล์ชั่วคราวแล้ว replace)
+    Returns: {rule: จำนวนครั้งที่ใช้} ตามลำดับ rules
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f'.{output_path.name}.tmp')
+    try:
+        with open(input_path, 'r', encoding='utf-8', newline='') as source, \
+                open(temp_path, 'w', encoding='utf-8', newline='') as stream:
+            rewrite_stream(source, stream, rules, chunk_size)
+        os.replace(temp_path, output_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    return {rule: rule.applied for rule in rules}
+
+
+def latest_build(build_dir, prefix=''):
+    """
+    ไฟล์ build ล่าสุดจาก timestamp ในชื่อไฟล์ (scandir รอบเดียว ไม่ stat ทุกไฟล์)
+    ไฟล์ชื่อเดียวกันทั้ง timestamp (เช่น -watch.html) ไม่นับ
+    """
+    latest = None
+    latest_key = None
+    with os.scandir(build_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            match = BUILD_TIMESTAMP_PATTERN.search(entry.name)
+            if not match:
+                continue
+            key = (match.group(1).ljust(15, '0'), entry.name)
+            if latest_key is None or key > latest_key:
+                latest, latest_key = entry.path, key
+    if latest is None:
+        raise FileNotFoundError(f"No timestamped HTML builds in {build_dir}")
+    return Path(latest)
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Route / Fare Graph
+==================
+สร้างกราฟการเดินทางจากตารางใน 011-transportation.md: สถานี = node, เส้นทาง = edge (ค่าโดยสาร + เวลา)
+
+- edge มาจากตารางที่มีคอลัมน์ "เส้นทาง" (A → B) และ "ค่าใช้จ่าย" เช่น | 6 มี.ค. | Narita → Shinagawa | N'EX | ¥6,140 |
+- เวลาเดินทางของแต่ละ edge: timeline entry ของวันที่ตรงกับวันที่ในตาราง ที่พูดถึงปลายทาง/วิธีการเดินทาง
+  ใช้ "ระยะเวลา:" / "เวลาเดินทาง:" ใน bullet ย่อยของ entry ถ้ามี ไม่มี = ช่วงเวลาของ entry
+  (เช่น "- **17:00-18:30**: 🚄 ... Narita Express (N'EX) ..." -> 90 นาที) - หาไม่เจอ = ไม่ทราบเวลา
+- cheapest / fastest path: Dijkstra บน edge แบบมีทิศทาง (ตามทิศที่เขียนในตาราง)
+  edge ที่ไม่ทราบเวลาไม่ถูกใช้ใน fastest path
+- ตรวจแถว "รวม" ของทุกตารางในไฟล์: ยอดที่เขียนไว้ต้องเท่ากับผลรวมของแถวอื่นในคอลัมน์เดียวกัน
+
+trip generator สร้างกราฟครั้งเดียวต่อ build ผ่าน BlockCache (build ซ้ำใน watch mode ที่ content
+ไม่เปลี่ยนใช้กราฟเดิม) แล้วรายงานผลตรวจยอดรวมใน build log
+
+ใช้งาน:
+    python -m tokyo_trip routes                    # สรุปกราฟ + ตรวจยอดรวม
+    python -m tokyo_trip routes Narita Shinjuku    # + เส้นทางที่ถูกที่สุด / เร็วที่สุด
+
+    graph = build_route_graph(content_data)
+    fare, legs = graph.cheapest_path('Narita', 'Ueno')
+"""
+
+import re
+import heapq
+
+TRANSPORT_KEY = '011-transportation'
+
+ROUTE_ARROW_PATTERN = re.compile(r'\s*(?:→|->|↔)\s*')
+# เซลล์ที่เป็นจำนวนเงินล้วน: "¥6,140", "**¥34,460**", "20,360" (ไม่นับช่วงราคา "¥2,000-4,000")
+AMOUNT_CELL_PATTERN = re.compile(r'^\**\s*[¥฿]?\s*(\d[\d,]*)\s*\**$')
+TOTAL_LABEL_PATTERN = re.compile(r'รวม|total', re.IGNORECASE)
+# "ระยะเวลา: 1 ชั่วโมง 5 นาที", "เวลาเดินทาง: ประมาณ 70 นาที"
+DURATION_DETAIL_PATTERN = re.compile(r'(?:ระยะเวลา|เวลาเดินทาง):\s*(?:ประมาณ\s*)?(?:(\d+)\s*ชั่วโมง)?\s*(?:(\d+)\s*นาที)?')
+
+
+def parse_amount(cell):
+    """'¥6,140' -> 6140 (ไม่ใช่จำนวนเงินล้วน = None)"""
+    match = AMOUNT_CELL_PATTERN.match(cell.strip())
+    return int(match.group(1).replace(',', '')) if match else None
+
+
+class Leg:
+    """หนึ่ง edge ของกราฟ: origin -> destination ด้วย mode"""
+
+    def __init__(self, origin, destination, mode, fare, date=None, minutes=None, minutes_source=None):
+        self.origin = origin
+        self.destination = destination
+        self.mode = mode
+        self.fare = fare
+        self.date = date
+        self.minutes = minutes
+        self.minutes_source = minutes_source
+
+    def weight(self, name):
+        return self.fare if name == 'fare' else self.minutes
+
+    def __repr__(self):
+        return f"Leg({self.origin!r} -> {self.destination!r}, {self.mode!r}, ¥{self.fare}, {self.minutes} min)"
+
+
+class RouteGraph:
+    """กราฟสถานี/เส้นทาง + ผลตรวจยอดรวมของตาราง"""
+
+    def __init__(self):
+        self.legs = []
+        self.edges = {}
+        self.totals = []
+
+    @property
+    def nodes(self):
+        return sorted({leg.origin for leg in self.legs} | {leg.destination for leg in self.legs})
+
+    def add_leg(self, leg):
+        self.legs.append(leg)
+        self.edges.setdefault(leg.origin, []).append(leg)
+
+    def find_node(self, name):
+        """ชื่อสถานีแบบไม่สนตัวพิมพ์ / ขึ้นต้นตรงกัน ('narita' -> 'Narita')"""
+        name = name.strip().lower()
+        nodes = self.nodes
+        for node in nodes:
+            if node.lower() == name:
+                return node
+        matches = [node for node in nodes if node.lower().startswith(name)]
+        return matches[0] if len(matches) == 1 else None
+
+    def shortest_path(self, origin, target, weight='fare'):
+        """Dijkstra -> (ผลรวม weight, [Leg, ...]) หรือ None ถ้าไปไม่ถึง (weight = 'fare' หรือ 'minutes')"""
+        origin, target = self.find_node(origin), self.find_node(target)
+        if origin is None or target is None:
+            return None
+        queue = [(0, 0, origin)]
+        best = {origin: 0}
+        previous = {}
+        counter = 0
+        while queue:
+            cost, _, node = heapq.heappop(queue)
+            if node == target:
+                legs = []
+                while node != origin:
+                    leg = previous[node]
+                    legs.append(leg)
+                    node = leg.origin
+                return cost, legs[::-1]
+            if cost > best.get(node, cost):
+                continue
+            for leg in self.edges.get(node, ()):
+                value = leg.weight(weight)
+                if value is None:
+                    continue
+                new_cost = cost + value
+                if new_cost < best.get(leg.destination, new_cost + 1):
+                    best[leg.destination] = new_cost
+                    previous[leg.destination] = leg
+                    counter += 1
+                    heapq.heappush(queue, (new_cost, counter, leg.destination))
+        return None
+
+    def cheapest_path(self, origin, target):
+        return self.shortest_path(origin, target, 'fare')
+
+    def fastest_path(self, origin, target):
+        return self.shortest_path(origin, target, 'minutes')
+
+    @property
+    def total_mismatches(self):
+        return [check for check in self.totals if check['declared'] != check['summed']]
+
+
+def check_table_totals(table, section=''):
+    """
+    ตรวจแถว "รวม" ของ table {'headers', 'rows'}: ทุกคอลัมน์ที่แถวรวมมีจำนวนเงิน
+    ต้องเท่ากับผลรวมของแถวอื่นในคอลัมน์นั้น -> list ของ {'section', 'column', 'declared', 'summed', 'rows'}
+    """
+    checks = []
+    total_rows = [row for row in table['rows'] if row and TOTAL_LABEL_PATTERN.search(row[0])]
+    item_rows = [row for row in table['rows'] if row and not TOTAL_LABEL_PATTERN.search(row[0])]
+    for total_row in total_rows:
+        for column, cell in enumerate(total_row[1:], 1):
+            declared = parse_amount(cell)
+            if declared is None:
+                continue
+            amounts = [parse_amount(row[column]) for row in item_rows if column < len(row)]
+            amounts = [amount for amount in amounts if amount is not None]
+            checks.append({
+                'section': section,
+                'column': table['headers'][column] if column < len(table['headers']) else str(column),
+                'declared': declared,
+                'summed': sum(amounts),
+                'rows': len(amounts),
+            })
+    return checks
+
+
+def _detail_minutes(entry):
+    """เวลาเดินทางที่เขียนไว้ใน bullet ย่อย ("ระยะเวลา: 1 ชั่วโมง 5 นาที") -> นาที หรือ None"""
+    for detail in entry['details']:
+        match = DURATION_DETAIL_PATTERN.search(detail)
+        if match and (match.group(1) or match.group(2)):
+            return int(match.group(1) or 0) * 60 + int(match.group(2) or 0)
+    return None
+
+
+def _match_minutes(leg, entries):
+    """
+    เวลาเดินทางของ leg จาก timeline entries ของวันนั้น: entry ที่พูดถึงปลายทาง/วิธีการมากที่สุด
+    ใช้ "ระยะเวลา:" ใน bullet ย่อยถ้ามี ไม่มี = ช่วงเวลาของ entry -> (นาที, 'HH:MM label') หรือ (None, None)
+    """
+    destination = leg.destination.lower()
+    origin = leg.origin.lower()
+    modes = [token.lower() for token in re.split(r'\s*\+\s*|\s+', leg.mode) if len(token) > 2]
+    best, best_score = None, 0
+    for entry in entries:
+        label = entry['label'].lower()
+        details = ' '.join(entry['details']).lower()
+        score = 2 * (destination in label) + 2 * any(mode in label for mode in modes)
+        # bullet ย่อยแบบ "เส้นทาง: Shinjuku → Narita Airport" ระบุ leg ได้ชัดที่สุด
+        score += 3 * any(origin in detail.lower() and destination in detail.lower() for detail in entry['details'])
+        score += destination in details or any(mode in details for mode in modes)
+        if score > best_score:
+            best, best_score = entry, score
+    if best is None:
+        return None, None
+    minutes = _detail_minutes(best)
+    if minutes is None:
+        minutes = best['end'] - best['start']
+    return minutes, f"{best['start'] // 60:02d}:{best['start'] % 60:02d} {best['label']}"
+
+
+def route_graph_source(content_data, lang='th'):
+    """markdown ทั้งหมดที่กราฟขึ้นอยู่กับ (ตารางเดินทาง + ไฟล์วัน) - ใช้เป็น key ของ BlockCache"""
+    from tokyo_trip.trip_data import DAY_KEY_PATTERN
+
+    return '\n'.join(content_data[key].get(lang, '') for key in sorted(content_data)
+                     if key == TRANSPORT_KEY or DAY_KEY_PATTERN.match(key))
+
+
+def build_route_graph(content_data, day_parser=None, lang='th'):
+    """
+    สร้าง RouteGraph จาก content_data ({file_key: {'th': ...}}) - ตาราง legs จาก 011-transportation,
+    เวลาเดินทางจาก timeline ของไฟล์วัน (day_parser = DayToDayTokyoGenerator)
+    """
+    from tokyo_trip.trip_data import DAY_KEY_PATTERN, parse_sections
+
+    if day_parser is None:
+        from tokyo_trip.day_to_day import DayToDayTokyoGenerator
+        day_parser = DayToDayTokyoGenerator()
+
+    # timeline ต่อวันที่ (ปีของทริปจากไฟล์วัน)
+    timelines = {}
+    trip_year = None
+    for key in sorted(content_data):
+        md = content_data[key].get(lang, '')
+        if not DAY_KEY_PATTERN.match(key) or not md:
+            continue
+        date = day_parser.resolve_day_date(md)
+        if date:
+            trip_year = trip_year or date.year
+            timelines[date] = day_parser.parse_timeline_entries(day_parser._extract_timeline_section(md))
+
+    graph = RouteGraph()
+    transport_md = content_data.get(TRANSPORT_KEY, {}).get(lang, '')
+    for section in parse_sections(re.sub(r'^# .*', '', transport_md, count=1, flags=re.MULTILINE)):
+        for table in section['tables']:
+            graph.totals.extend(check_table_totals(table, section['heading']))
+            headers = table['headers']
+            if 'เส้นทาง' not in headers or 'ค่าใช้จ่าย' not in headers:
+                continue
+            for row in table['rows']:
+                cells = dict(zip(headers, row))
+                stations = ROUTE_ARROW_PATTERN.split(cells.get('เส้นทาง', ''))
+                fare = parse_amount(cells.get('ค่าใช้จ่าย', ''))
+                if len(stations) != 2 or not all(stations) or fare is None:
+                    continue
+                dates = day_parser._parse_thai_dates(cells.get('วันที่', ''), trip_year)
+                leg = Leg(stations[0], stations[1], cells.get('วิธีการ', ''), fare, dates[0] if dates else None)
+                if leg.date in timelines:
+                    leg.minutes, leg.minutes_source = _match_minutes(leg, timelines[leg.date])
+                graph.add_leg(leg)
+    return graph
+
+
+def _format_path(result, unit):
+    total, legs = result
+    route = ' → '.join([legs[0].origin] + [leg.destination for leg in legs])
+    value = f"¥{total:,}" if unit == 'fare' else f"{total} นาที"
+    return f"{value}: {route} ({', '.join(leg.mode for leg in legs)})"
+
+
+def print_route_report(graph):
+    """สรุปกราฟ + ผลตรวจยอดรวมลง build log"""
+    unknown = sum(1 for leg in graph.legs if leg.minutes is None)
+    print(f"🗺️ Route graph: {len(graph.nodes)} stations, {len(graph.legs)} legs, "
+          f"¥{sum(leg.fare for leg in graph.legs):,} in legs"
+          f"{f', {unknown} without travel time' if unknown else ''}")
+    for check in graph.totals:
+        if check['declared'] == check['summed']:
+            print(f"   ✅ {check['section']} / {check['column']}: รวม {check['declared']:,} "
+                  f"= {check['rows']} rows")
+        else:
+            print(f"   ❌ {check['section']} / {check['column']}: รวม {check['declared']:,} "
+                  f"แต่ {check['rows']} rows รวมได้ {check['summed']:,} "
+                  f"(ต่าง {check['declared'] - check['summed']:+,})")
+
+
+def run_routes(origin=None, target=None):
+    """CLI: สรุปกราฟ + ยอดรวม (+ cheapest/fastest path ถ้าระบุต้นทาง/ปลายทาง) -> exit code"""
+    from tokyo_trip.day_to_day import DayToDayTokyoGenerator
+
+    day_parser = DayToDayTokyoGenerator()
+    content_data = day_parser.loader.load_content('th', 'en')
+    graph = build_route_graph(content_data, day_parser)
+    print_route_report(graph)
+    for leg in graph.legs:
+        minutes = f"{leg.minutes} นาที ({leg.minutes_source})" if leg.minutes is not None else "ไม่ทราบเวลา"
+        print(f"   - {leg.date or '?'} {leg.origin} → {leg.destination} [{leg.mode}] ¥{leg.fare:,}, {minutes}")
+
+    if origin and target:
+        for name, label in (('fare', '💴 Cheapest'), ('minutes', '⚡ Fastest')):
+            result = graph.shortest_path(origin, target, name)
+            if result is None:
+                print(f"{label}: ไม่มีเส้นทางจาก {origin} ไป {target}")
+            else:
+                print(f"{label}: {_format_path(result, name)}")
+    return 1 if graph.total_mismatches else 0
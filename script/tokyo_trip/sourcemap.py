@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Source Maps
+===========
+ติดตามว่า HTML แต่ละ block มาจากบรรทัดไหนของ markdown ต้นฉบับ (สำหรับ debug build)
+
+markdown_to_html แปลง text หลายรอบ (section markers, headers, placeholders) ทำให้เลขบรรทัดเลื่อน
+LineOrigins เก็บช่วงบรรทัดต้นฉบับ (first, last) ของทุกบรรทัดใน text ปัจจุบัน และอัปเดตทุกครั้งที่ sub:
+- บรรทัดที่ไม่โดนแก้ -> ช่วงเดิม
+- บรรทัดที่เกิดจาก replacement -> รวมช่วงของทุกบรรทัดที่ match กินไป
+
+ใช้งาน:
+    origins = LineOrigins(markdown_text, first_line=3)
+    def repl(match):
+        first, last = origins.match_range(match)     # เรียกได้ระหว่าง origins.sub เท่านั้น
+        ...
+    text = origins.sub(pattern, repl, text)
+
+    html = add_source_attr(block_html, 'th/009-day7.md:42-58')   # <ul data-src="..." class="timeline">
+"""
+
+import re
+import bisect
+
+_FIRST_TAG_PATTERN = re.compile(r'^(\s*<[A-Za-z][\w-]*)')
+
+
+def format_source(source, first, last):
+    """'th/009-day7.md', 42, 58 -> 'th/009-day7.md:42-58'"""
+    if first == last:
+        return f"{source}:{first}"
+    return f"{source}:{first}-{last}"
+
+
+def add_source_attr(html, src):
+    """ใส่ data-src ให้ tag แรกของ block HTML (ไม่มี tag = คืนค่าเดิม)"""
+    return _FIRST_TAG_PATTERN.sub(lambda m: f'{m.group(1)} data-src="{src}"', html, count=1)
+
+
+class LineOrigins:
+    """ช่วงบรรทัดต้นฉบับของแต่ละบรรทัดใน text ปัจจุบัน"""
+
+    def __init__(self, text, first_line=1):
+        self.ranges = [(first_line + i, first_line + i) for i in range(text.count('\n') + 1)]
+        self._line_starts = None
+
+    def _index_lines(self, text):
+        starts = [0]
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self._line_starts = starts
+
+    def _line_at(self, pos):
+        return bisect.bisect_right(self._line_starts, pos) - 1
+
+    def match_range(self, match):
+        """ช่วงบรรทัดต้นฉบับ (first, last) ที่ match ครอบคลุม - ใช้ใน repl ระหว่าง sub"""
+        first_line = self._line_at(match.start())
+        last_line = self._line_at(max(match.start(), match.end() - 1))
+        return self._merge(first_line, last_line)
+
+    def _merge(self, first_line, last_line):
+        ranges = self.ranges[first_line:last_line + 1]
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+    def sub(self, pattern, repl, text):
+        """เหมือน pattern.sub(repl, text) แต่อัปเดตช่วงบรรทัดของ text ใหม่ไปด้วย"""
+        self._index_lines(text)
+        pieces = []        # (ข้อความ, origin): origin = index บรรทัดเริ่มต้นใน text เดิม หรือ (first, last) ของ replacement
+        last_end = 0
+        matched = False
+        for match in pattern.finditer(text):
+            matched = True
+            if match.start() > last_end:
+                pieces.append((text[last_end:match.start()], self._line_at(last_end)))
+            replacement = repl(match) if callable(repl) else match.expand(repl)
+            if replacement:
+                pieces.append((replacement, self.match_range(match)))
+            last_end = match.end()
+        if not matched:
+            return text
+        if last_end < len(text):
+            pieces.append((text[last_end:], self._line_at(last_end)))
+
+        new_ranges = []
+        current = None
+
+        def merge(rng):
+            nonlocal current
+            current = rng if current is None else (min(current[0], rng[0]), max(current[1], rng[1]))
+
+        for piece, origin in pieces:
+            parts = piece.split('\n')
+            last_part = len(parts) - 1
+            for index, part in enumerate(parts):
+                # ส่วนที่ว่างท้าย piece ยังไม่มีตัวอักษรของบรรทัดนั้น - ไม่ต้อง merge
+                if part or index < last_part:
+                    merge(self.ranges[origin + index] if isinstance(origin, int) else origin)
+                if index < last_part:
+                    new_ranges.append(current)
+                    current = None
+
+        if current is None:
+            current = new_ranges[-1] if new_ranges else self.ranges[-1]
+        new_ranges.append(current)
+
+        self.ranges = new_ranges
+        self._line_starts = None
+        return ''.join(piece for piece, _ in pieces)
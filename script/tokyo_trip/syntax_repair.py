@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+Syntax Repair
+=============
+ซ่อม syntax error ของไฟล์ Python ที่ถูกตัด/ต่อผิด (เช่น generator เก่าใน script/old/) ด้วย tokenize
+แทน fixer แบบ regex ทีละบรรทัดหลายรุ่นที่เคยมี (syntax_fixer, super_syntax_fixer, surgical_fixer, ...)
+
+วนซ้ำ: compile() หา error แรก -> เลือกวิธีซ่อมตามชนิด error + token ของบรรทัดนั้น -> compile() ใหม่
+- unterminated string literal  -> ปิด string ท้ายบรรทัดด้วย quote เดียวกัน
+- '(' was never closed / closing parenthesis does not match ... on line N
+                               -> bracket stack ของบรรทัด: ถ้าบรรทัดถัดไปเป็นท่อนปิดที่หลุดมา (`, line)`)
+                                  ต่อกลับเข้าไป ไม่เช่นนั้นปิด bracket ที่ค้างท้ายบรรทัด
+- unmatched ')'                -> ลบบรรทัดที่เหลือแค่ท่อนปิด / ลบตัวปิดที่เกิน
+- expected an indented block   -> indent body ใต้ header (ข้ามบรรทัดที่อยู่ใน string หลายบรรทัด)
+- unexpected indent            -> dedent block ให้เท่าบรรทัดก่อนหน้า
+error ชนิดอื่น หรือซ่อมแล้ว error เดิมไม่หาย -> หยุด และรายงานว่าซ่อมไม่ได้ (ไม่เดา)
+
+ใช้งาน:
+    python -m tokyo_trip repair-syntax old/              # dry run: ตาราง + จำนวนบรรทัดที่เปลี่ยน
+    python -m tokyo_trip repair-syntax old/ --diff       # + unified diff
+    python -m tokyo_trip repair-syntax old/ --write      # เขียนทับ (สำรองเป็น <file>.backup)
+"""
+
+import io
+import os
+import re
+import time
+import difflib
+import tokenize
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+MAX_REPAIRS = 200
+
+OPEN_BRACKETS = {'(': ')', '[': ']', '{': '}'}
+CLOSE_BRACKETS = {')', ']', '}'}
+
+NEVER_CLOSED_PATTERN = re.compile(r"^'([(\[{])' was never closed")
+# bracket ที่เปิดค้างจากบรรทัดอื่น ถูกปิดผิดชนิดทีหลัง (error ชี้ไปที่ตัวปิด ไม่ใช่บรรทัดที่ต้องซ่อม)
+MISMATCHED_PATTERN = re.compile(r"^closing parenthesis '.' does not match opening parenthesis '([(\[{])' on line (\d+)")
+BLOCK_START_PATTERN = re.compile(r'^(?:def |class |async def |@|if __name__\b)')
+PHYSICAL_LINE_PATTERN = re.compile(r'[^\n]*\n|[^\n]+$')
+STRING_PREFIX_PATTERN = re.compile(r'[rRbBuUfF]{0,2}("""|\'\'\'|"|\')')
+
+
+class RepairError(Exception):
+    """ซ่อม error นี้ไม่ได้ (ชนิดที่ไม่รู้จัก หรือซ่อมแล้วไม่คืบหน้า)"""
+
+
+def _indent_of(line):
+    return len(line) - len(line.lstrip(' \t'))
+
+
+def _line_tokens(text):
+    """Token ของข้อความ (บรรทัดเดียวหรือหลายบรรทัด) - หยุดเงียบ ๆ เมื่อ tokenize ไปต่อไม่ได้"""
+    tokens = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            tokens.append(token)
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        pass
+    return tokens
+
+
+def _bracket_stack(text, stack=None):
+    """Bracket ที่ยังเปิดค้างหลัง tokenize text (ต่อจาก stack เดิมได้) - None ถ้ามีตัวปิดที่ไม่ match"""
+    stack = list(stack or [])
+    for token in _line_tokens(text):
+        if token.type != tokenize.OP:
+            continue
+        if token.string in OPEN_BRACKETS:
+            stack.append(token.string)
+        elif token.string in CLOSE_BRACKETS:
+            if not stack or OPEN_BRACKETS[stack[-1]] != token.string:
+                return None
+            stack.pop()
+    return stack
+
+
+def _string_continuation_rows(lines, start):
+    """เลขบรรทัด (0-based) ที่อยู่กลาง/ท้าย string หลายบรรทัด นับจากบรรทัด start - ห้ามแก้ indent"""
+    rows = set()
+    for token in _line_tokens(''.join(lines[start:])):
+        if token.type == tokenize.STRING and token.end[0] > token.start[0]:
+            rows.update(range(start + token.start[0], start + token.end[0]))
+    return rows
+
+
+def _is_orphan_closer(line, stack):
+    """บรรทัดที่เป็นท่อนท้ายของ call ที่หลุดมา (เช่น `, line)`) และปิด stack ได้พอดี"""
+    stripped = line.strip()
+    if not stripped or not (stripped[0] == ',' or stripped[0] in CLOSE_BRACKETS):
+        return False
+    return _bracket_stack(stripped.rstrip(':'), stack) == []
+
+
+# ----------------------------------------------------------------------
+# Repairs: (lines, error) -> คำอธิบายการซ่อม (แก้ lines ใน list โดยตรง)
+# lines เก็บ '\n' ท้ายบรรทัด (เหมือน readlines)
+# ----------------------------------------------------------------------
+def _close_string(lines, error):
+    index = error.lineno - 1
+    line = lines[index].rstrip('\r\n')
+    match = STRING_PREFIX_PATTERN.search(line, max(0, (error.offset or 1) - 1))
+    if not match:
+        raise RepairError("cannot locate string start")
+    quote = match.group(1)
+    lines[index] = line.rstrip() + quote + '\n'
+    return f"closed string literal with {quote}"
+
+
+def _close_brackets(lines, row, opener):
+    index = row - 1
+    line = lines[index].rstrip('\r\n')
+    stack = _bracket_stack(line)
+    if not stack or stack[0] != opener:
+        # bracket เปิดตั้งแต่บรรทัดก่อน - ใช้แค่ตัวที่เปิดในบรรทัดนี้ไม่ได้
+        stack = [opener] + (stack or [])
+
+    following = index + 1
+    while following < len(lines) and not lines[following].strip():
+        following += 1
+    if following < len(lines) and _is_orphan_closer(lines[following], stack):
+        orphan = lines[following].strip()
+        lines[index] = line.rstrip() + orphan + '\n'
+        del lines[index + 1:following + 1]
+        return f"joined orphan '{orphan}' from line {following + 1}"
+
+    closers = ''.join(OPEN_BRACKETS[bracket] for bracket in reversed(stack))
+    lines[index] = line.rstrip() + closers + '\n'
+    return f"closed {closers}"
+
+
+def _remove_unmatched(lines, error):
+    index = error.lineno - 1
+    line = lines[index]
+    stripped = line.strip()
+    if stripped and (stripped[0] == ',' or stripped[0] in CLOSE_BRACKETS):
+        del lines[index]
+        return f"removed orphan line '{stripped}'"
+    column = (error.offset or 0) - 1
+    if 0 <= column < len(line) and line[column] in CLOSE_BRACKETS:
+        lines[index] = line[:column] + line[column + 1:]
+        return f"removed unmatched '{line[column]}'"
+    raise RepairError("cannot locate unmatched bracket")
+
+
+def _indent_block(lines, error, header_row):
+    header_index = header_row - 1
+    header_indent = _indent_of(lines[header_index])
+    skip_rows = _string_continuation_rows(lines, header_index + 1)
+    indented = 0
+    for index in range(header_index + 1, len(lines)):
+        line = lines[index]
+        if index in skip_rows or not line.strip():
+            continue
+        indent = _indent_of(line)
+        if indent < header_indent or (indent == header_indent and indented and
+                                      BLOCK_START_PATTERN.match(line.lstrip())):
+            break
+        lines[index] = '    ' + line
+        indented += 1
+    if not indented:
+        raise RepairError("no block to indent")
+    return f"indented {indented} lines under line {header_row}"
+
+
+def _dedent_block(lines, error):
+    index = error.lineno - 1
+    previous = index - 1
+    while previous >= 0 and not lines[previous].strip():
+        previous -= 1
+    target = _indent_of(lines[previous]) if previous >= 0 else 0
+    delta = _indent_of(lines[index]) - target
+    if delta <= 0:
+        raise RepairError("nothing to dedent")
+    skip_rows = _string_continuation_rows(lines, index)
+    start_indent = _indent_of(lines[index])
+    dedented = 0
+    for row in range(index, len(lines)):
+        line = lines[row]
+        if row in skip_rows or not line.strip():
+            continue
+        if _indent_of(line) < start_indent:
+            break
+        lines[row] = line[delta:]
+        dedented += 1
+    return f"dedented {dedented} lines by {delta}"
+
+
+def _repair_once(lines, error):
+    """ซ่อมหนึ่งครั้ง -> (บรรทัดที่ถูกแก้, คำอธิบาย)"""
+    message = error.msg
+    if message.startswith('unterminated string literal'):
+        return error.lineno, _close_string(lines, error)
+    match = NEVER_CLOSED_PATTERN.match(message)
+    if match:
+        return error.lineno, _close_brackets(lines, error.lineno, match.group(1))
+    match = MISMATCHED_PATTERN.match(message)
+    if match:
+        row = int(match.group(2))
+        return row, _close_brackets(lines, row, match.group(1))
+    if message.startswith('unmatched '):
+        return error.lineno, _remove_unmatched(lines, error)
+    match = re.match(r'expected an indented block after .* on line (\d+)', message)
+    if match:
+        return error.lineno, _indent_block(lines, error, int(match.group(1)))
+    if message == 'unexpected indent':
+        return error.lineno, _dedent_block(lines, error)
+    raise RepairError(message)
+
+
+def repair_source(source, filename='<source>'):
+    """
+    ซ่อม source จนกว่า compile() ผ่าน
+    Returns: (source ใหม่, [(บรรทัด, คำอธิบาย)], SyntaxError ที่เหลือหรือ None)
+    """
+    # แยกตาม \n เท่านั้น (splitlines ตัดที่ \x0c / \u2028 ด้วย ทำให้เลขบรรทัดไม่ตรงกับ compile())
+    lines = PHYSICAL_LINE_PATTERN.findall(source)
+    if lines and not lines[-1].endswith('\n'):
+        lines[-1] += '\n'
+    repairs = []
+    last_error = None
+    for _ in range(MAX_REPAIRS):
+        try:
+            compile(''.join(lines), filename, 'exec', dont_inherit=True)
+            last_error = None
+            break
+        except SyntaxError as error:
+            key = (error.lineno, error.msg)
+            if error.lineno is None or key == last_error:
+                last_error = key
+                break
+            last_error = key
+            try:
+                repairs.append(_repair_once(lines, error))
+            except RepairError:
+                break
+
+    repaired = ''.join(lines)
+    if not source.endswith('\n') and repaired.endswith('\n'):
+        repaired = repaired[:-1]
+    remaining = None
+    if last_error is not None:
+        try:
+            compile(repaired, filename, 'exec', dont_inherit=True)
+        except SyntaxError as error:
+            remaining = error
+    return repaired, repairs, remaining
+
+
+def repair_file(path, write=False, with_diff=False):
+    """ซ่อมหนึ่งไฟล์ (รันใน worker) -> dict ผลลัพธ์ (picklable)"""
+    path = Path(path)
+    start = time.perf_counter()
+    result = {'file': str(path), 'status': 'ok', 'repairs': [], 'error': None,
+              'added': 0, 'removed': 0, 'diff': '', 'ms': 0.0}
+    try:
+        source = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        result.update(status='unreadable', error=str(e))
+        return result
+
+    repaired, repairs, remaining = repair_source(source, str(path))
+    result['repairs'] = repairs
+    if remaining is not None:
+        result['status'] = 'failed'
+        result['error'] = f"line {remaining.lineno}: {remaining.msg}"
+    elif repairs:
+        result['status'] = 'repaired'
+
+    if repaired != source:
+        diff = list(difflib.unified_diff(source.splitlines(keepends=True), repaired.splitlines(keepends=True),
+                                         f"a/{path.name}", f"b/{path.name}"))
+        result['added'] = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
+        result['removed'] = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        if with_diff:
+            result['diff'] = ''.join(diff)
+        if write and remaining is None:
+            backup_path = path.with_name(path.name + '.backup')
+            backup_path.write_text(source, encoding='utf-8')
+            path.write_text(repaired, encoding='utf-8')
+    result['ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def find_python_files(paths):
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob('*.py') if p.is_file()))
+        elif path.suffix == '.py':
+            files.append(path)
+        else:
+            print(f"⚠️ Not a Python file or directory: {path}")
+    return files
+
+
+def run_repair(paths, write=False, show_diff=False, workers=None):
+    """ซ่อมทุกไฟล์ .py ใน paths แบบขนาน แล้วพิมพ์รายงาน -> exit code (1 = มีไฟล์ที่ซ่อมไม่ได้)"""
+    files = find_python_files(paths)
+    if not files:
+        print("❌ No Python files found.")
+        return 1
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    print(f"🔧 Checking {len(files)} files with {workers} worker(s){' (write)' if write else ' (dry run)'}...")
+    start = time.perf_counter()
+    if workers == 1:
+        results = [repair_file(path, write, show_diff) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(repair_file, path, write, show_diff) for path in files]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    icons = {'ok': '✅', 'repaired': '🔧', 'failed': '❌', 'unreadable': '⚠️'}
+    width = max(len(Path(result['file']).name) for result in results)
+    for result in results:
+        if result['status'] == 'ok':
+            continue
+        name = Path(result['file']).name
+        print(f"\n{icons[result['status']]} {name:<{width}}  {result['ms']:7.1f} ms  "
+              f"+{result['added']}/-{result['removed']} lines")
+        for lineno, description in result['repairs']:
+            print(f"   - line {lineno}: {description}")
+        if result['error']:
+            print(f"   - unrepaired: {result['error']}")
+        if result['diff']:
+            print(result['diff'].rstrip())
+
+    counts = {status: sum(1 for result in results if result['status'] == status) for status in icons}
+    print(f"\n📊 {len(results)} files in {elapsed * 1000:.1f} ms: "
+          f"{counts['ok']} ok, {counts['repaired']} repaired, {counts['failed'] + counts['unreadable']} failed"
+          f"{' (written, backups: *.backup)' if write and counts['repaired'] else ''}")
+    return 1 if counts['failed'] or counts['unreadable'] else 0
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Timeline Consistency Check
+==========================
+ตรวจ timeline ของทุกวัน (ผลของ DayToDayTokyoGenerator.parse_timeline_entries) หาเวลาที่ขัดกัน
+
+- overlap:  entry เริ่มก่อน entry ก่อนหน้าจบ (รวม bullet ย่อยที่มีเวลา เช่น "**18:45 – 19:30:**"
+            ใต้ entry 19:00 -> entry นั้นเริ่มจริง 18:45 ทับกับเช็คอินที่ 18:30)
+- gap:      ช่วงว่างระหว่าง entry ตั้งแต่ GAP_THRESHOLD_MINUTES ขึ้นไป
+- order:    entry ในไฟล์ที่เวลาเริ่มก่อน entry บรรทัดก่อนหน้า (ลำดับในไฟล์สลับกับลำดับเวลา)
+- midnight: ช่วงเวลาที่ระบุชัดเจน (HH:MM-HH:MM หรือเวลาใน bullet ย่อย) เลยเที่ยงคืนเข้าวันถัดไป
+
+ทุกวันใช้ interval sweep รอบเดียว: เรียง entry ตามเวลาเริ่ม แล้วเดินไปพร้อมเวลาจบที่ไกลที่สุดที่ผ่านมา
+(entry ที่ทับกันหลายตัวจึงถูกจับได้แม้ไม่ติดกัน)
+เวลาที่เอามาเทียบ/ลบกันแปลงเป็น JST ก่อน (jst_start/jst_end ของ entry) -> ฝั่งไทยของเที่ยวบินไม่ถูกนับเป็น
+ช่วงว่าง/ทับซ้อนปลอม ส่วนข้อความใน report/badge ยังแสดงเวลาท้องถิ่นตามที่เขียนในไฟล์
+
+ใช้งาน:
+    issues = analyze_timelines({day_num: generator.parse_timeline_entries(md), ...})
+    print_timeline_report(issues)
+    badges_html = timeline_badges_html(issues.get(day_num, []))
+"""
+
+import re
+
+# ช่วงว่างที่ยาวเท่านี้ขึ้นไปถือว่าน่าจะลืมใส่กิจกรรม
+GAP_THRESHOLD_MINUTES = 60
+
+DAY_MINUTES = 24 * 60
+
+# เวลาที่ต้นบรรทัดของ bullet ย่อย: "18:45 – 19:30: ..." หรือ "21:00: ..."
+SUBITEM_TIME_PATTERN = re.compile(r'^\s*(\d{1,2}):(\d{2})(?:\s*[-–]\s*(\d{1,2}):(\d{2}))?')
+
+# kind -> (emoji, ชื่อบน badge)
+ISSUE_KINDS = {
+    'overlap': ('⚠️', 'เวลาทับซ้อน'),
+    'gap': ('⏳', 'ช่วงว่าง'),
+    'order': ('🔀', 'ลำดับสลับ'),
+    'midnight': ('🌙', 'ข้ามเที่ยงคืน'),
+}
+
+
+def format_minutes(minutes):
+    """นาทีนับจากเที่ยงคืน -> 'HH:MM' (เลยเที่ยงคืน = '+1 HH:MM')"""
+    prefix = f"+{minutes // DAY_MINUTES} " if minutes >= DAY_MINUTES else ''
+    return f"{prefix}{minutes % DAY_MINUTES // 60:02d}:{minutes % 60:02d}"
+
+
+def _subitem_span(entry):
+    """(start, end) ที่ครอบทุกเวลาใน bullet ย่อยของ entry (ไม่มี = None)"""
+    start = end = None
+    for detail in entry['details']:
+        match = SUBITEM_TIME_PATTERN.match(detail)
+        if not match:
+            continue
+        sub_start = int(match.group(1)) * 60 + int(match.group(2))
+        # เวลาย่อยที่น้อยกว่าเวลาของ entry เกินครึ่งวัน = หลังเที่ยงคืน
+        if sub_start < entry['start'] - DAY_MINUTES // 2:
+            sub_start += DAY_MINUTES
+        sub_end = sub_start
+        if match.group(3):
+            sub_end = int(match.group(3)) * 60 + int(match.group(4))
+            if sub_end < sub_start:
+                sub_end += DAY_MINUTES
+        start = sub_start if start is None else min(start, sub_start)
+        end = sub_end if end is None else max(end, sub_end)
+    return (start, end) if start is not None else None
+
+
+def _issue(kind, start, end, message):
+    return {'kind': kind, 'start': start, 'end': end, 'minutes': end - start, 'message': message}
+
+
+def analyze_day(entries, gap_threshold=GAP_THRESHOLD_MINUTES):
+    """
+    ตรวจ timeline ของหนึ่งวัน -> list ของ issue {'kind', 'start', 'end', 'minutes', 'message'}
+    start/end/minutes ของ issue เป็นเวลา JST, เวลาใน message เป็นเวลาท้องถิ่นตามที่เขียน
+    """
+    issues = []
+
+    # ลำดับในไฟล์ (ก่อนเรียง)
+    in_file = sorted(entries, key=lambda item: item.get('order', 0))
+    for previous, entry in zip(in_file, in_file[1:]):
+        entry_start = entry.get('jst_start', entry['start'])
+        previous_start = previous.get('jst_start', previous['start'])
+        if entry_start < previous_start:
+            issues.append(_issue('order', entry_start, previous_start,
+                                 f"{format_minutes(entry['start'])} {entry['label']} "
+                                 f"อยู่หลัง {format_minutes(previous['start'])} ในไฟล์"))
+
+    # interval sweep: เวลาเป็นคู่ (นาที JST, นาทีเวลาท้องถิ่น) - เทียบด้วย JST, แสดงผลด้วยเวลาท้องถิ่น
+    intervals = []
+    for entry in entries:
+        shift = entry.get('jst_start', entry['start']) - entry['start']
+        start = (entry['start'] + shift, entry['start'])
+        end = (entry.get('jst_end', entry['end']), entry['end'])
+        explicit_end = end if entry.get('explicit_end') else start
+        span = _subitem_span(entry)
+        if span:
+            # เวลาใน bullet ย่อยอยู่ในเขตเวลาเดียวกับเวลาเริ่มของ entry
+            start = min(start, (span[0] + shift, span[0]))
+            end = max(end, (span[1] + shift, span[1]))
+            explicit_end = max(explicit_end, (span[1] + shift, span[1]))
+        intervals.append((start, end, explicit_end, entry))
+    intervals.sort(key=lambda item: (item[0][0], item[3].get('order', 0)))
+
+    reach = None        # เวลาจบที่ไกลที่สุดของ entry ที่ผ่านมา
+    reach_entry = None
+    for start, end, explicit_end, entry in intervals:
+        if reach is not None:
+            if start[0] < reach[0]:
+                issues.append(_issue('overlap', start[0], reach[0],
+                                     f"{format_minutes(start[1])} {entry['label']} เริ่มก่อน "
+                                     f"{reach_entry['label']} จบ ({format_minutes(reach[1])})"))
+            elif start[0] - reach[0] >= gap_threshold:
+                issues.append(_issue('gap', reach[0], start[0],
+                                     f"ว่าง {start[0] - reach[0]} นาที หลัง {reach_entry['label']} "
+                                     f"({format_minutes(reach[1])}-{format_minutes(start[1])})"))
+        # เที่ยงคืนตามนาฬิกาท้องถิ่น
+        if explicit_end[1] > DAY_MINUTES:
+            issues.append(_issue('midnight', start[0], explicit_end[0],
+                                 f"{entry['label']} จบ {format_minutes(explicit_end[1])} (วันถัดไป)"))
+        if reach is None or end[0] > reach[0]:
+            reach, reach_entry = end, entry
+
+    issues.sort(key=lambda issue: (issue['start'], issue['kind']))
+    return issues
+
+
+def analyze_timelines(timelines, gap_threshold=GAP_THRESHOLD_MINUTES):
+    """ตรวจทุกวันในรอบเดียว: {day_num: entries} -> {day_num: [issue, ...]} (เฉพาะวันที่มี issue)"""
+    results = {}
+    for day_num in sorted(timelines):
+        issues = analyze_day(timelines[day_num], gap_threshold)
+        if issues:
+            results[day_num] = issues
+    return results
+
+
+def print_timeline_report(results):
+    """สรุปลง build log: จำนวนต่อประเภท + รายการของแต่ละวัน"""
+    counts = {kind: 0 for kind in ISSUE_KINDS}
+    for issues in results.values():
+        for issue in issues:
+            counts[issue['kind']] += 1
+    summary = ', '.join(f"{count} {kind}" for kind, count in counts.items())
+    print(f"🔍 Timeline check: {summary}")
+    for day_num, issues in results.items():
+        for issue in issues:
+            print(f"   {ISSUE_KINDS[issue['kind']][0]} Day {day_num}: {issue['message']}")
+
+
+def timeline_badges_html(issues):
+    """badge ต่อประเภทสำหรับหัว day card (title = รายละเอียด) - ไม่มี issue = ''"""
+    if not issues:
+        return ''
+    badges = []
+    for kind, (emoji, name) in ISSUE_KINDS.items():
+        messages = [issue['message'] for issue in issues if issue['kind'] == kind]
+        if messages:
+            title = '&#10;'.join(message.replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;')
+                                 for message in messages)
+            badges.append(f'<span class="timeline-badge timeline-badge-{kind}" title="{title}">'
+                          f'{emoji} {name} {len(messages)}</span>')
+    return f'<div class="timeline-badges">{"".join(badges)}</div>'
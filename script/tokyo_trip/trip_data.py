@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Trip Data (JSON)
+================
+Export model ของทริปที่ parse แล้วเป็น JSON สำหรับเครื่องมืออื่น (expense tracker, map overlay)
+แทนการ screen-scrape HTML ที่ build ออกมา
+
+ไฟล์ที่เขียนคู่กับ HTML ของ trip build:
+- <output>.trip.json        - {format, version, generated, schema, days: [...], sections: [...]}
+- <output>.trip.index.json  - byte offset/length ของแต่ละ day/section ใน .trip.json
+- trip.schema.json          - JSON Schema (draft 2020-12) ของ .trip.json (เปลี่ยนเมื่อ TRIP_DATA_VERSION เปลี่ยน)
+
+- day: เลขวัน, วันที่ (ISO), หัวข้อ, timeline (นาที JST นับจากเที่ยงคืน + เวลาท้องถิ่น/เขตเวลาตามที่เขียน +
+  รายละเอียด), sections
+- section: หัวข้อ ## + markdown ของ section + tables (headers + rows) + boxes (> **Type:** ...)
+- เขียนแบบ streaming ทีละ day/section (json iterencode) - ไม่ประกอบทั้งไฟล์เป็น string ก้อนเดียว
+- แต่ละ day/section ใน .trip.json เป็น JSON object สมบูรณ์ในตัว -> อ่านเฉพาะวันที่ต้องการได้
+  จาก offset ใน index (seek + read length bytes) โดยไม่ต้อง parse ทั้งไฟล์
+
+ใช้งาน:
+    data_path, index_path = write_trip_data(content_data, build_dir / "Tokyo-Trip-...html")
+    day = load_day(data_path, 3)          # dict ของวันที่ 3 (อ่านแค่ช่วง bytes ของวันนั้น)
+"""
+
+import re
+import json
+import datetime
+from pathlib import Path
+
+# เพิ่มเมื่อโครงสร้าง JSON เปลี่ยนแบบ consumer เดิมอ่านไม่ได้
+TRIP_DATA_VERSION = 2
+
+SCHEMA_FILENAME = "trip.schema.json"
+
+# เขตเวลาของ timeline entry (ตรงกับ UTC_OFFSET_MINUTES ใน day_to_day)
+TIMELINE_TIMEZONES = ['Asia/Tokyo', 'Asia/Bangkok']
+
+DAY_KEY_PATTERN = re.compile(r'^\d+-day(\d+)')
+H2_PATTERN = re.compile(r'^## (.*)$', re.MULTILINE)
+BOX_TITLE_PATTERN = re.compile(r'^> \*\*(\w+):\*\*\s*(.*)')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\|\s*[-:]+\s*(\|\s*[-:]+\s*)*\|?\s*$')
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+_SECTION_SCHEMA = {
+    'type': 'object',
+    'required': ['heading', 'markdown', 'tables', 'boxes'],
+    'properties': {
+        'heading': {'type': 'string', 'description': 'หัวข้อ ## ("" = เนื้อหาก่อน ## แรก)'},
+        'markdown': {'type': 'string'},
+        'tables': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'required': ['headers', 'rows'],
+                'properties': {
+                    'headers': {'type': 'array', 'items': {'type': 'string'}},
+                    'rows': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'string'}}},
+                },
+            },
+        },
+        'boxes': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'required': ['type', 'title', 'markdown'],
+                'properties': {
+                    'type': {'type': 'string', 'description': 'เช่น info, note'},
+                    'title': {'type': 'string'},
+                    'markdown': {'type': 'string'},
+                },
+            },
+        },
+    },
+}
+
+_DOCUMENT_PROPERTIES = {
+    'id': {'type': 'string', 'description': 'section id ใน HTML (เช่น day1, overview)'},
+    'source': {'type': 'string', 'description': 'ไฟล์ต้นฉบับ เช่น th/003-day1.md'},
+    'title': {'type': 'string'},
+    'sections': {'type': 'array', 'items': {'$ref': '#/$defs/section'}},
+}
+
+TRIP_SCHEMA = {
+    '$schema': 'https://json-schema.org/draft/2020-12/schema',
+    '$id': SCHEMA_FILENAME,
+    'title': 'Tokyo trip data',
+    'type': 'object',
+    'required': ['format', 'version', 'generated', 'days', 'sections'],
+    'properties': {
+        'format': {'const': 'tokyo-trip'},
+        'version': {'const': TRIP_DATA_VERSION},
+        'generated': {'type': 'string', 'format': 'date-time'},
+        'schema': {'type': 'string'},
+        'days': {'type': 'array', 'items': {'$ref': '#/$defs/day'}},
+        'sections': {'type': 'array', 'items': {'$ref': '#/$defs/document'}},
+    },
+    '$defs': {
+        'section': _SECTION_SCHEMA,
+        'document': {
+            'type': 'object',
+            'required': list(_DOCUMENT_PROPERTIES),
+            'properties': _DOCUMENT_PROPERTIES,
+        },
+        'day': {
+            'type': 'object',
+            'required': ['day', 'date'] + list(_DOCUMENT_PROPERTIES) + ['timeline'],
+            'properties': {
+                'day': {'type': 'integer', 'minimum': 1},
+                'date': {'type': ['string', 'null'], 'format': 'date'},
+                **_DOCUMENT_PROPERTIES,
+                'timeline': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'required': ['start', 'end', 'time', 'timezone', 'end_timezone', 'label', 'details'],
+                        'properties': {
+                            'start': {'type': 'integer', 'minimum': 0,
+                                      'description': 'นาทีนับจากเที่ยงคืนของวันนั้น เวลา JST (end - start = ระยะเวลาจริง)'},
+                            'end': {'type': 'integer', 'minimum': 0,
+                                    'description': 'นาทีนับจากเที่ยงคืน เวลา JST (> 1440 = ข้ามเที่ยงคืน)'},
+                            'time': {'type': 'string',
+                                     'description': 'HH:MM หรือ HH:MM-HH:MM เวลาท้องถิ่นตามที่เขียน (timezone/end_timezone)'},
+                            'timezone': {'type': 'string', 'enum': TIMELINE_TIMEZONES,
+                                         'description': 'เขตเวลาของเวลาเริ่มใน time'},
+                            'end_timezone': {'type': 'string', 'enum': TIMELINE_TIMEZONES,
+                                             'description': 'เขตเวลาของเวลาจบใน time (ต่างจาก timezone = เที่ยวบินข้ามโซน)'},
+                            'label': {'type': 'string'},
+                            'details': {'type': 'array', 'items': {'type': 'string'}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+def _format_minutes(minutes):
+    return f"{minutes // 60 % 24:02d}:{minutes % 60:02d}"
+
+
+def parse_table(table_md):
+    """Markdown table -> {'headers': [...], 'rows': [[...], ...]} (ไม่ใช่ table = None)"""
+    lines = [line.strip() for line in table_md.strip().split('\n') if line.strip()]
+    if len(lines) < 2 or not TABLE_SEPARATOR_PATTERN.match(lines[1]):
+        return None
+    return {
+        'headers': [cell.strip() for cell in lines[0].strip('|').split('|')],
+        'rows': [[cell.strip() for cell in line.strip('|').split('|')] for line in lines[2:]],
+    }
+
+
+def parse_box(box_md):
+    """Info/note box (> **Type:** title ...) -> {'type', 'title', 'markdown'} (ผิดรูป = None)"""
+    lines = box_md.strip().split('\n')
+    title_match = BOX_TITLE_PATTERN.match(lines[0])
+    if not title_match:
+        return None
+    content_lines = [line[2:] if line.startswith('> ') else line[1:]
+                     for line in lines[1:] if line.startswith('>')]
+    return {
+        'type': title_match.group(1).lower(),
+        'title': title_match.group(2).strip(),
+        'markdown': '\n'.join(content_lines).strip(),
+    }
+
+
+def parse_sections(md_body):
+    """แยก body (ไม่รวม H1) ตามหัวข้อ ## -> list ของ section พร้อม tables/boxes ที่อยู่ใน section"""
+    from tokyo_trip.trip_generator import BLOCK_PATTERNS
+
+    headings = list(H2_PATTERN.finditer(md_body))
+    spans = [('', 0, headings[0].start() if headings else len(md_body))]
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(md_body)
+        spans.append((heading.group(1).strip(), heading.end(), end))
+
+    sections = []
+    for heading, start, end in spans:
+        markdown = md_body[start:end].strip()
+        if not heading and not markdown:
+            continue
+        # pattern ของ markdown_to_html ต้องการ newline ท้าย block
+        text = markdown + '\n'
+        tables = [parse_table(match.group(0)) for match in BLOCK_PATTERNS['markdown.tables'].finditer(text)]
+        boxes = [parse_box(match.group(0)) for match in BLOCK_PATTERNS['markdown.boxes'].finditer(text)]
+        sections.append({
+            'heading': heading,
+            'markdown': markdown,
+            'tables': [table for table in tables if table],
+            'boxes': [box for box in boxes if box],
+        })
+    return sections
+
+
+def build_document(file_key, md_content, day_parser=None, lang='th'):
+    """
+    หนึ่งไฟล์ content -> dict (day ถ้าเป็นไฟล์ NNN-dayN และส่ง day_parser มา)
+    day_parser: DayToDayTokyoGenerator (ใช้ parser วันที่/timeline ตัวเดียวกับ day-to-day planner)
+    """
+    title_match = re.search(r'^# (.*)', md_content, re.MULTILINE)
+    body = re.sub(r'^# .*', '', md_content, count=1, flags=re.MULTILINE)
+    document = {
+        'id': re.sub(r'^\d+-', '', file_key),
+        'source': f"{lang}/{file_key}.md",
+        'title': title_match.group(1).strip() if title_match else '',
+        'sections': parse_sections(body),
+    }
+
+    day_match = DAY_KEY_PATTERN.match(file_key)
+    if not day_match or day_parser is None:
+        return document
+
+    date = day_parser.resolve_day_date(md_content)
+    timeline = []
+    for entry in day_parser.parse_timeline_entries(day_parser._extract_timeline_section(md_content)):
+        timeline.append({
+            'start': entry['jst_start'],
+            'end': entry['jst_end'],
+            'time': f"{_format_minutes(entry['start'])}-{_format_minutes(entry['end'])}",
+            'timezone': entry['timezone'],
+            'end_timezone': entry['end_timezone'],
+            'label': entry['label'],
+            'details': entry['details'],
+        })
+    return {
+        'day': int(day_match.group(1)),
+        'date': date.isoformat() if date else None,
+        **document,
+        'timeline': timeline,
+    }
+
+
+class _CountingWriter:
+    """เขียน str เป็น UTF-8 ลงไฟล์ binary พร้อมนับ byte offset"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.offset = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.stream.write(data)
+        self.offset += len(data)
+
+    def write_object(self, obj):
+        """เขียน object เดียวแบบ streaming -> (offset, length) ในไฟล์"""
+        start = self.offset
+        for chunk in _ENCODER.iterencode(obj):
+            self.write(chunk)
+        return start, self.offset - start
+
+
+def write_trip_data(content_data, output_path, lang='th'):
+    """
+    เขียน <output>.trip.json + <output>.trip.index.json + trip.schema.json (ข้าง output_path)
+    content_data: {file_key: {'th': ..., 'en': ...}} จาก ContentLoader
+    Returns: (data_path, index_path)
+    """
+    from tokyo_trip.day_to_day import DayToDayTokyoGenerator
+
+    output_path = Path(output_path)
+    data_path = output_path.with_suffix('.trip.json')
+    index_path = output_path.with_suffix('.trip.index.json')
+    schema_path = output_path.with_name(SCHEMA_FILENAME)
+    day_parser = DayToDayTokyoGenerator()
+
+    keys = [key for key in sorted(content_data) if content_data[key].get(lang)]
+    day_keys = [key for key in keys if DAY_KEY_PATTERN.match(key)]
+    other_keys = [key for key in keys if not DAY_KEY_PATTERN.match(key)]
+
+    index = {'version': TRIP_DATA_VERSION, 'file': data_path.name, 'days': [], 'sections': []}
+    with open(data_path, 'wb') as stream:
+        writer = _CountingWriter(stream)
+        header = {
+            'format': 'tokyo-trip',
+            'version': TRIP_DATA_VERSION,
+            'generated': datetime.datetime.now().isoformat(timespec='seconds'),
+            'schema': SCHEMA_FILENAME,
+        }
+        writer.write(_ENCODER.encode(header)[:-1])
+
+        for name, group in (('days', day_keys), ('sections', other_keys)):
+            writer.write(f', "{name}": [')
+            for i, key in enumerate(group):
+                if i:
+                    writer.write(', ')
+                # แต่ละ document ถูก parse ตอนจะเขียนเท่านั้น
+                document = build_document(key, content_data[key][lang], day_parser, lang)
+                offset, length = writer.write_object(document)
+                entry = {'id': document['id'], 'offset': offset, 'length': length}
+                if 'day' in document:
+                    entry = {'day': document['day'], 'date': document['date'], **entry}
+                index[name].append(entry)
+            writer.write(']')
+        writer.write('}\n')
+
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    with open(schema_path, 'w', encoding='utf-8') as f:
+        json.dump(TRIP_SCHEMA, f, ensure_ascii=False, indent=2)
+    return data_path, index_path
+
+
+def _read_slice(data_path, entry):
+    with open(data_path, 'rb') as f:
+        f.seek(entry['offset'])
+        return json.loads(f.read(entry['length']).decode('utf-8'))
+
+
+def load_index(data_path):
+    """อ่าน index ของ .trip.json (ไฟล์ .trip.index.json ข้างกัน)"""
+    data_path = Path(data_path)
+    index_path = data_path.with_name(data_path.name[:-len('.trip.json')] + '.trip.index.json')
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != TRIP_DATA_VERSION:
+        raise ValueError(f"Unsupported trip data version: {index.get('version')} (expected {TRIP_DATA_VERSION})")
+    return index
+
+
+def load_day(data_path, day_number, index=None):
+    """อ่านเฉพาะวันที่ day_number จาก .trip.json ผ่าน offset ใน index"""
+    index = index or load_index(data_path)
+    for entry in index['days']:
+        if entry['day'] == day_number:
+            return _read_slice(data_path, entry)
+    raise KeyError(f"Day {day_number} not in {index['file']}")
+
+
+def load_section(data_path, section_id, index=None):
+    """อ่านเฉพาะ section (เช่น 'transportation') จาก .trip.json ผ่าน offset ใน index"""
+    index = index or load_index(data_path)
+    for entry in index['sections']:
+        if entry['id'] == section_id:
+            return _read_slice(data_path, entry)
+    raise KeyError(f"Section '{section_id}' not in {index['file']}")
@@ -0,0 +1,1174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tokyo Trip Generator - v3.1 (Multi-Timeline & Section Fix)
+==========================================================
+สร้าง HTML ไฟล์สำหรับทริปโตเกียว โดยอ่านเนื้อหาจาก content/*.md 
+และใส่ลงใน skeleton template ที่มี CSS/JS สมบูรณ์
+
+✨ Version 3.1 Features:
+- แก้ไขปัญหา "Double Processing" ด้วย Placeholder Strategy
+- ใช้ skeleton_template.html เป็นโครงสร้างหลัก
+- รองรับ Multiple Timeline Formats (Time-based, Highlight, Step-based)
+- แก้ไข Section Markers (--- และ ```) ให้หายไป
+- Markdown Parser ที่แม่นยำสำหรับ Timeline, Tables, Info/Note Boxes
+- รองรับ Multi-language (TH/EN) อย่างสมบูรณ์
+
+Author: Claude AI Assistant (Fixed & Enhanced)
+Date: 7 July 2025
+Version: 3.1.0-multi-timeline-section-fix
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import datetime
+from pathlib import Path
+
+from tokyo_trip.instrument import BuildProfiler, profiled
+from tokyo_trip.log import get_logger, configure_logging
+from tokyo_trip.regex_guard import RegexGuard
+from tokyo_trip.sourcemap import LineOrigins, add_source_attr, format_source
+from tokyo_trip.render_cache import BlockCache
+from tokyo_trip.fragments import Fragments
+from tokyo_trip.inline import format_inline
+from tokyo_trip.loader import ContentLoader
+from tokyo_trip.trip_data import write_trip_data
+from tokyo_trip.anchors import check_anchors
+from tokyo_trip.routes import build_route_graph, route_graph_source, print_route_report
+
+# id / reference ของ timeline toggle ใน HTML ที่ render แล้ว -> เติม scope (ภาษา + section) ตอนประกอบ section
+TIMELINE_ID_PATTERN = re.compile(r'''(id="|toggleTimelineDetail\(')timeline-''')
+
+log = get_logger(__name__)
+
+# ชื่อไฟล์ output: <prefix>-<timestamp>.html (batch build ใช้ชื่อ trip root แทน)
+OUTPUT_PREFIX = "Tokyo-Trip-March-2026-v3.1"
+
+# ชื่อไฟล์คงที่สำหรับ watch mode (ไม่สร้างไฟล์ timestamp ใหม่ทุกครั้งที่ save)
+WATCH_OUTPUT_FILENAME = f"{OUTPUT_PREFIX}-watch.html"
+
+TIME_PERIOD_WORDS = 'Morning|Evening|Afternoon|Night|All Day|มื้อเช้า|มื้อกลางวัน|มื้อเย็น|ตอนเช้า|ตอนบ่าย|ตอนเย็น|ตอนค่ำ|ทั้งวัน'
+
+# Section markers (--- และ ```) -> ลบออก / เว้นบรรทัด
+SECTION_MARKER_PATTERNS = [
+    (re.compile(r'^```\s*$', re.MULTILINE), ''),
+    (re.compile(r'^---\s*$', re.MULTILINE), '\n'),
+]
+
+# Headers (order matters: longer first to avoid conflicts)
+HEADER_PATTERNS = [
+    (re.compile(r'^#### (.*)$', re.MULTILINE), r'<h4>\1</h4>'),
+    (re.compile(r'^### (.*)$', re.MULTILINE), r'<h3>\1</h3>'),
+    (re.compile(r'^## (.*)$', re.MULTILINE), r'<h2>\1</h2>'),
+    (re.compile(r'^# (.*)$', re.MULTILINE), r'<h1>\1</h1>'),
+]
+
+# Complex block patterns ของ markdown_to_html (เรียงตามลำดับการ process)
+# ⚠️ ห้ามใช้ `.*X.*\n` หรือ `.*?X` ตรงหัวบรรทัด - บรรทัดยาวที่ไม่มี newline จะ backtrack แบบ O(n^2)
+#    ให้ใช้ `[^X\n]*X` หรือ lookahead แทน แล้วรัน `python -m tokyo_trip regex-check` ทุกครั้งที่แก้
+BLOCK_PATTERNS = {
+    # Tables: | a | b | (บรรทัดที่ขึ้นต้นด้วย | และมี | อีกอย่างน้อยหนึ่งตัว)
+    'markdown.tables': re.compile(r'((?:^\|[^|\n]*\|.*\n(?:\|.*\|-.*\|.*\n)?(?:\|[^|\n]*\|.*\n)*)+)', re.MULTILINE),
+    # Info/Note Boxes: > **Title:** ...
+    'markdown.boxes': re.compile(r'((?:^> \*\*(?=.*?\*\*).*\n(?:^> .*\n?)*)+)', re.MULTILINE),
+    # 1. Time-range timelines: - **HH:MM-HH:MM**: content
+    'markdown.timeline.range': re.compile(r'((?:^- \*\*\d+:\d+\s*-\s*\d+:\d+\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 2. Time with location: - **HH:MM (Location)**: content
+    'markdown.timeline.location': re.compile(r'((?:^- \*\*\d+:\d+\s*\([^)]+\)\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 3. Complex time patterns: - **Morning**, **Evening**, etc.
+    'markdown.timeline.text': re.compile(rf'((?:^- \*\*(?:{TIME_PERIOD_WORDS})\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 4. Original time-based timelines: - **HH:MM**: content
+    'markdown.timeline.time': re.compile(r'((?:^- \*\*\d+:\d+\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 5. Highlight timelines: - **text**: content (excluding time patterns)
+    'markdown.timeline.highlight': re.compile(rf'((?:^- \*\*(?!\d+:\d+)(?!{TIME_PERIOD_WORDS})[^*]+\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 6. Step-based timelines: - **Step N**: content
+    'markdown.timeline.step': re.compile(r'((?:^- \*\*(?:Step|ขั้นตอน|ไฮไลต์|รายละเอียด)[^*]*\*\*:.*\n(?:  .*\n?)*)+)', re.MULTILINE),
+    # 7. H3-based timelines: <h3> + content below (headers ถูก process ก่อนแล้ว, ไม่กิน placeholder)
+    'markdown.timeline.h3': re.compile(r'((?:^<h3>[^<]+</h3>\n(?:(?!^<h3>)(?!__PLACEHOLDER_)[^\n]*\n?)*)+)', re.MULTILINE),
+}
+
+LIST_WRAP_PATTERN = re.compile(r'(<li>.*?</li>\s*)+', re.DOTALL)
+
+
+def wrap_list_items(text, guard=None):
+    """
+    Wrap consecutive <li> items in <ul>
+    match จบได้ไม่เกิน </li> ตัวสุดท้าย (+ whitespace) - ตัดหางทิ้งก่อน เพื่อไม่ให้ <li> ที่ไม่ปิด
+    สแกนจนสุดไฟล์ซ้ำทุกตัว (O(n^2))
+    """
+    end = text.rfind('</li>')
+    if end == -1:
+        return text
+    end += len('</li>')
+    while end < len(text) and text[end].isspace():
+        end += 1
+
+    def wrap(match):
+        return f'<ul>\n{match.group(0)}</ul>\n'
+
+    head = text[:end]
+    if guard is not None:
+        head = guard.sub('lists.wrap', LIST_WRAP_PATTERN, wrap, head)
+    else:
+        head = LIST_WRAP_PATTERN.sub(wrap, head)
+    return head + text[end:]
+
+class TokyoTripGeneratorV3:
+    """
+    Generator ที่แก้ไขปัญหา Double Processing ด้วย Placeholder Strategy
+    รองรับ Multiple Timeline Formats และแก้ไข Section Markers
+    """
+    def __init__(self, content_dir=None, build_dir=None, output_prefix=OUTPUT_PREFIX):
+        """
+        content_dir: trip root ที่มี th/ และ en/ (ค่าเริ่มต้น <project>/content)
+        build_dir: ที่เก็บ output (ค่าเริ่มต้น <project>/build)
+        """
+        # Setup paths
+        self.package_dir = Path(__file__).parent
+        self.script_dir = self.package_dir.parent
+        self.project_dir = self.script_dir.parent
+        self.content_dir = Path(content_dir) if content_dir else self.project_dir / "content"
+        self.th_dir = self.content_dir / "th"
+        self.en_dir = self.content_dir / "en"
+        self.build_dir = Path(build_dir) if build_dir else self.project_dir / "build"
+        self.template_path = self.script_dir / "template" / "skeleton_template.html"
+        self.output_prefix = output_prefix
+        self.loader = ContentLoader(self.content_dir)
+        # skeleton template ที่อ่านไว้แล้ว (batch build ส่งให้ทุก trip) - None = อ่านจาก template_path
+        self.template_html = None
+
+        # Per-stage timing/memory instrumentation (disabled = no-op)
+        self.profiler = BuildProfiler()
+        # จับเวลาทุก block pattern - เตือนเมื่อ markdown ผิดรูปทำให้ regex backtrack หนัก
+        self.regex_guard = RegexGuard()
+        # Debug build: ใส่ data-src="th/009-day7.md:42-58" ให้ทุก complex block + sidecar .srcmap.json
+        self.source_maps = False
+        self.source_map = []
+        # HTML ของ complex block ตามเนื้อหา markdown - build ซ้ำ (watch) render ใหม่แค่ block ที่แก้
+        self.block_cache = BlockCache()
+        # model ที่ parse แล้วเป็น JSON คู่กับ HTML (<output>.trip.json + index + schema) สำหรับเครื่องมืออื่น
+        self.emit_data = True
+
+    def _prepare_build(self):
+        """สร้าง build directory และแสดง banner (เรียกตอน generate เท่านั้น ไม่ทำตอน import/สร้าง object)"""
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+
+        print("🚀 Tokyo Trip Generator v3.1 - Multi-Timeline & Section Fix")
+        print(f"   - Project Dir: {self.project_dir}")
+        print(f"   - Content Dir: {self.content_dir}")
+        print(f"   - Build Dir:   {self.build_dir}")
+
+    def read_file(self, file_path):
+        """อ่านไฟล์ด้วย UTF-8 encoding"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            print(f"⚠️ File not found: {file_path}")
+            return ""
+        except Exception as e:
+            print(f"❌ Error reading {file_path}: {e}")
+            return ""
+
+    def get_skeleton_template(self):
+        """อ่าน skeleton template HTML จากไฟล์ (หรือใช้ template_html ที่ตั้งไว้)"""
+        if self.template_html is not None:
+            print("📄 Using preloaded skeleton template")
+            return self.template_html
+        print(f"📄 Reading skeleton template from: {self.template_path}")
+        return self.read_file(self.template_path)
+
+    @profiled('get_content_data')
+    def get_content_data(self):
+        """อ่านไฟล์ content ทั้งหมดและจัดโครงสร้างข้อมูล"""
+        print("📂 Reading content files...")
+        if not self.th_dir.exists():
+            print(f"❌ Thai content directory not found: {self.th_dir}")
+            return {}
+
+        # อ่านภาษาไทย (หลัก) + ภาษาอังกฤษ (ถ้ามี) พร้อมกัน - รวมไฟล์ EN ที่ไม่มี TH ด้วย
+        content_data = self.loader.load_content('th', 'en', secondary_only=True)
+        self.loader.print_summary()
+
+        print(f"   - Found {len(content_data)} content entries.")
+        return content_data
+
+
+    def markdown_to_html(self, markdown_text, source=None, first_line=1):
+        """
+        🔥 THE MAGIC FUNCTION - FIXED HEADER PROCESSING ORDER! 
+        🆕 ย้าย header processing ไปก่อน complex blocks เพื่อป้องกันการรบกวน
+        🆕 source (เช่น 'th/009-day7.md') + first_line: ติดตามบรรทัดต้นฉบับของทุก complex block (source maps)
+        """
+        if not markdown_text or not markdown_text.strip():
+            return ""
+
+        placeholders = {}
+        placeholder_counter = 0
+        origins = LineOrigins(markdown_text, first_line) if source else None
+
+        def sub(name, pattern, repl, text):
+            if origins is not None:
+                return origins.sub(pattern, repl, text)
+            return guard.sub(name, pattern, repl, text)
+
+        def add_placeholder(html_content, match=None, kind=None):
+            nonlocal placeholder_counter
+            if origins is not None and match is not None:
+                src = format_source(source, *origins.match_range(match))
+                html_content = add_source_attr(html_content, src)
+                self.source_map.append({'src': src, 'kind': kind})
+            placeholder = f"__PLACEHOLDER_{placeholder_counter}__"
+            placeholders[placeholder] = html_content
+            placeholder_counter += 1
+            return placeholder
+
+        text = markdown_text
+        span = self.profiler.span
+        guard = self.regex_guard
+        render = self.block_cache.render
+        debug = log.debug_enabled
+
+        # 🎯 STEP 1: Handle section markers and clean up content
+        with span('markdown.section_markers'):
+            if debug:
+                log.debug("🔧 Processing section markers")
+            
+            # Remove or convert section markers (--- และ ```)
+            for pattern, repl in SECTION_MARKER_PATTERNS:
+                text = sub('markdown.section_markers', pattern, repl, text)
+        
+        # 🆕 STEP 1.5: Process headers FIRST (before complex blocks)
+        with span('markdown.headers'):
+            if debug:
+                log.debug("🔧 Processing headers first")
+            
+                # Debug: Check for placeholders before header processing
+                before_headers = re.findall(r'__PLACEHOLDER_\d+__', text)
+                if before_headers:
+                    log.debug("🔍 Placeholders before header processing", count=len(before_headers))
+            
+            # Headers (order matters: longer first to avoid conflicts)
+            for pattern, repl in HEADER_PATTERNS:
+                text = sub('markdown.headers', pattern, repl, text)
+            
+            # Debug: Check for placeholders after header processing
+            if debug:
+                after_headers = re.findall(r'__PLACEHOLDER_\d+__', text)
+                if len(after_headers) != len(before_headers):
+                    log.debug("⚠️ Placeholder count changed during header processing",
+                              before=len(before_headers), after=len(after_headers))
+                    lost_placeholders = set(before_headers) - set(after_headers)
+                    if lost_placeholders:
+                        log.debug("❌ Lost placeholders", placeholders=sorted(lost_placeholders))
+        
+        # 🎯 STEP 2: Process and replace complex blocks with placeholders
+        if debug:
+            log.debug("🔧 Processing complex blocks with placeholder strategy")
+        
+        # Tables (highest priority - most complex structure)
+        with span('markdown.tables'):
+            table_pattern = BLOCK_PATTERNS['markdown.tables']
+            tables_found = guard.findall('markdown.tables', table_pattern, text)
+            if tables_found:
+                if debug:
+                    log.debug("📊 Found tables", count=len(tables_found))
+                def table_repl(match):
+                    return add_placeholder(render('table', match.group(0), self._process_table_block), match, 'table')
+                text = sub('markdown.tables', table_pattern, table_repl, text)
+
+        # Info/Note Boxes
+        with span('markdown.boxes'):
+            box_pattern = BLOCK_PATTERNS['markdown.boxes']
+            boxes_found = guard.findall('markdown.boxes', box_pattern, text)
+            if boxes_found:
+                if debug:
+                    log.debug("📦 Found info/note boxes", count=len(boxes_found))
+                def box_repl(match):
+                    return add_placeholder(render('box', match.group(0), self._process_infobox_block), match, 'box')
+                text = sub('markdown.boxes', box_pattern, box_repl, text)
+
+        # 🌟 Enhanced Timeline Patterns (multiple formats - ดู BLOCK_PATTERNS)
+        timeline_range_pattern = BLOCK_PATTERNS['markdown.timeline.range']
+        timeline_location_pattern = BLOCK_PATTERNS['markdown.timeline.location']
+        timeline_text_pattern = BLOCK_PATTERNS['markdown.timeline.text']
+        timeline_time_pattern = BLOCK_PATTERNS['markdown.timeline.time']
+        timeline_highlight_pattern = BLOCK_PATTERNS['markdown.timeline.highlight']
+        timeline_step_pattern = BLOCK_PATTERNS['markdown.timeline.step']
+        timeline_h3_pattern = BLOCK_PATTERNS['markdown.timeline.h3']
+
+        # 🚀 Process in priority order (most specific first)
+        
+        # 1. Time ranges (highest priority)
+        with span('markdown.timeline.range'):
+            range_timelines_found = guard.findall('markdown.timeline.range', timeline_range_pattern, text)
+            if range_timelines_found:
+                if debug:
+                    log.debug("⏰ Found timeline blocks", kind='range', count=len(range_timelines_found))
+                def range_timeline_repl(match):
+                    return add_placeholder(render('timeline.range', match.group(1), self._process_timeline_block, 'range'), match, 'timeline.range')
+                text = sub('markdown.timeline.range', timeline_range_pattern, range_timeline_repl, text)
+        
+        # 2. Time with location
+        with span('markdown.timeline.location'):
+            location_timelines_found = guard.findall('markdown.timeline.location', timeline_location_pattern, text)
+            if location_timelines_found:
+                if debug:
+                    log.debug("📍 Found timeline blocks", kind='location', count=len(location_timelines_found))
+                def location_timeline_repl(match):
+                    return add_placeholder(render('timeline.location', match.group(1), self._process_timeline_block, 'location'), match, 'timeline.location')
+                text = sub('markdown.timeline.location', timeline_location_pattern, location_timeline_repl, text)
+        
+        # 3. Text-based time periods
+        with span('markdown.timeline.text'):
+            text_timelines_found = guard.findall('markdown.timeline.text', timeline_text_pattern, text)
+            if text_timelines_found:
+                if debug:
+                    log.debug("🌅 Found timeline blocks", kind='text', count=len(text_timelines_found))
+                def text_timeline_repl(match):
+                    return add_placeholder(render('timeline.text', match.group(1), self._process_timeline_block, 'text'), match, 'timeline.text')
+                text = sub('markdown.timeline.text', timeline_text_pattern, text_timeline_repl, text)
+        
+        # 4. Standard time-based timelines
+        with span('markdown.timeline.time'):
+            timelines_found = guard.findall('markdown.timeline.time', timeline_time_pattern, text)
+            if timelines_found:
+                if debug:
+                    log.debug("⏰ Found timeline blocks", kind='time', count=len(timelines_found))
+                def timeline_repl(match):
+                    return add_placeholder(render('timeline.time', match.group(1), self._process_timeline_block, 'time'), match, 'timeline.time')
+                text = sub('markdown.timeline.time', timeline_time_pattern, timeline_repl, text)
+        
+        # 5. Process highlight timelines
+        with span('markdown.timeline.highlight'):
+            highlight_timelines_found = guard.findall('markdown.timeline.highlight', timeline_highlight_pattern, text)
+            if highlight_timelines_found:
+                if debug:
+                    log.debug("🌟 Found timeline blocks", kind='highlight', count=len(highlight_timelines_found))
+                def highlight_timeline_repl(match):
+                    return add_placeholder(render('timeline.highlight', match.group(1), self._process_timeline_block, 'highlight'), match, 'timeline.highlight')
+                text = sub('markdown.timeline.highlight', timeline_highlight_pattern, highlight_timeline_repl, text)
+        
+        # 6. Process step-based timelines
+        with span('markdown.timeline.step'):
+            step_timelines_found = guard.findall('markdown.timeline.step', timeline_step_pattern, text)
+            if step_timelines_found:
+                if debug:
+                    log.debug("📋 Found timeline blocks", kind='step', count=len(step_timelines_found))
+                def step_timeline_repl(match):
+                    return add_placeholder(render('timeline.step', match.group(1), self._process_timeline_block, 'step'), match, 'timeline.step')
+                text = sub('markdown.timeline.step', timeline_step_pattern, step_timeline_repl, text)
+        
+        # 7. Process H3-based timelines (now looking for <h3> tags)
+        with span('markdown.timeline.h3'):
+            h3_timelines_found = guard.findall('markdown.timeline.h3', timeline_h3_pattern, text)
+            if h3_timelines_found:
+                if debug:
+                    log.debug("🏨 Found timeline blocks", kind='h3', count=len(h3_timelines_found))
+                def h3_timeline_repl(match):
+                    return add_placeholder(render('timeline.h3', match.group(1), self._process_h3_timeline_block_html), match, 'timeline.h3')
+                text = sub('markdown.timeline.h3', timeline_h3_pattern, h3_timeline_repl, text)
+
+        # 🎯 STEP 3: Process the remaining simple markdown (headers already processed)
+        with span('markdown.simple'):
+            if debug:
+                log.debug("🔧 Processing simple markdown")
+        
+                # Debug: Check placeholders before simple markdown processing
+                before_simple = re.findall(r'__PLACEHOLDER_\d+__', text)
+                if before_simple:
+                    log.debug("🔍 Placeholders before simple markdown processing", count=len(before_simple))
+        
+            html = text
+        
+            # 🆕 Skip header processing since it's already done
+            # Headers are already processed in STEP 1.5
+        
+            # Text formatting
+            html = guard.call('inline', format_inline, html)
+        
+            # Simple lists (now safe because complex timelines are placeholder-protected)
+            html = self._convert_simple_lists(html)
+        
+            # Debug: Check placeholders before paragraph processing
+            if debug:
+                before_paragraphs = re.findall(r'__PLACEHOLDER_\d+__', html)
+                if before_paragraphs:
+                    log.debug("🔍 Placeholders before paragraph processing", count=len(before_paragraphs))
+        
+            # Paragraphs (last)
+            html = self._convert_paragraphs(html)
+        
+            # Debug: Check placeholders after paragraph processing
+            if debug:
+                after_paragraphs = re.findall(r'__PLACEHOLDER_\d+__', html)
+                if len(after_paragraphs) != len(before_paragraphs):
+                    log.debug("⚠️ Placeholder count changed during paragraph processing",
+                              before=len(before_paragraphs), after=len(after_paragraphs))
+                    lost_placeholders = set(before_paragraphs) - set(after_paragraphs)
+                    if lost_placeholders:
+                        log.debug("❌ Lost placeholders in paragraph processing", placeholders=sorted(lost_placeholders))
+
+        # 🎯 STEP 4: Restore the complex blocks from placeholders
+        with span('markdown.restore'):
+            if debug:
+                log.debug("🔧 Restoring complex blocks from placeholders", count=len(placeholders))
+        
+            for placeholder, content in placeholders.items():
+                if placeholder in html:
+                    html = html.replace(placeholder, content)
+                    if debug:
+                        log.debug("✅ Restored", placeholder=placeholder)
+                else:
+                    # Debug: Show where this placeholder might have gone
+                    log.warning("⚠️ Placeholder not found in HTML", placeholder=placeholder,
+                                in_original=placeholder in markdown_text)
+
+            # Final check for any remaining placeholders
+            if '__PLACEHOLDER_' in html:
+                remaining_placeholders = re.findall(r'__PLACEHOLDER_\d+__', html)
+                log.warning("❌ Placeholders not restored", count=len(remaining_placeholders),
+                            placeholders=remaining_placeholders)
+
+        return html.strip()
+    
+
+    def _process_h3_timeline_block_html(self, h3_block):
+        """
+        🆕 NEW METHOD: Process H3-based blocks that are already converted to HTML
+        <h3>Title</h3>\n content... → timeline item with details
+        """
+        debug = log.debug_enabled
+        if debug:
+            log.debug("🏨 Processing H3-based timeline block (HTML)")
+        
+        timeline_items = []
+        
+        # Split by <h3> to get individual items
+        h3_items = re.split(r'^<h3>', h3_block, flags=re.MULTILINE)[1:]  # Skip first empty item
+        
+        for item in h3_items:
+            lines = item.strip().split('\n')
+            if not lines:
+                continue
+                
+            # First line contains the title with </h3> tag
+            title_line = lines[0].strip()
+            title_match = re.match(r'([^<]+)</h3>', title_line)
+            title = title_match.group(1).strip() if title_match else title_line
+            
+            # Rest is content (details)
+            content_lines = lines[1:] if len(lines) > 1 else []
+            
+            # Create timeline entry
+            entry = {
+                'time': title,  # H3 title becomes timeline label
+                'main_content': '',  # No separate main content for H3 format
+                'details': content_lines # Pass raw lines to be processed
+            }
+            
+            timeline_items.append(self._build_timeline_item(entry, 'h3'))
+        
+        # Generate final timeline HTML
+        final_timeline = f'<ul class="timeline">\n' + '\n'.join(timeline_items) + '\n</ul>'
+        if debug:
+            log.debug("✅ Generated H3 timeline", items=len(timeline_items))
+        return final_timeline
+
+    def _process_timeline_block(self, timeline_md, timeline_type='time'):
+        """
+        🕐 Processes a block of timeline Markdown into a complete HTML <ul class="timeline">.
+        This follows the EXACT structure from template.html.old for perfect CSS compatibility.
+        
+        🆕 v3.1: รองรับ Multiple Timeline Formats!
+        - time: ⏰ เวลา (HH:MM)
+        - highlight: 🌟 ไฮไลต์ประจำวัน
+        - step: 📋 ขั้นตอน/รายละเอียด
+        """
+        debug = log.debug_enabled
+        if debug:
+            log.debug("⏰ Processing timeline block", kind=timeline_type)
+        
+        timeline_items = []
+        
+        # Parse timeline entries: Handle both time-based and text-based
+        lines = timeline_md.strip().split('\n')
+        current_entry = None
+        
+        for line in lines:
+            # Check if this is a new timeline entry (flexible pattern)
+            timeline_match = re.match(r'^- \*\*([^*]+)\*\*:\s*(.*)', line)
+            if timeline_match:
+                # Save previous entry if exists
+                if current_entry:
+                    timeline_items.append(self._build_timeline_item(current_entry, timeline_type))
+                
+                # Start new entry
+                current_entry = {
+                    'time': timeline_match.group(1),  # Could be time or text
+                    'main_content': timeline_match.group(2).strip(),
+                    'details': []
+                }
+            elif line.startswith('  ') and current_entry:
+                # This is a detail line (indented with 2+ spaces)
+                detail = line.strip()
+                if detail:
+                    current_entry['details'].append(detail)
+        
+        # Don't forget the last entry!
+        if current_entry:
+            timeline_items.append(self._build_timeline_item(current_entry, timeline_type))
+        
+        # Generate final timeline HTML exactly like template.html.old
+        final_timeline = f'<ul class="timeline">\n' + '\n'.join(timeline_items) + '\n</ul>'
+        if debug:
+            log.debug("✅ Generated timeline", kind=timeline_type, items=len(timeline_items))
+        return final_timeline
+        
+    def _process_h3_timeline_block(self, h3_block):
+        """
+        🏨 Processes H3-based blocks into timeline format
+        ### Title \n content... → timeline item with details
+        """
+        debug = log.debug_enabled
+        if debug:
+            log.debug("🏨 Processing H3-based timeline block")
+        
+        timeline_items = []
+        
+        # Split by ### to get individual items
+        h3_items = re.split(r'^### ', h3_block, flags=re.MULTILINE)[1:]  # Skip first empty item
+        
+        for item in h3_items:
+            lines = item.strip().split('\n')
+            if not lines:
+                continue
+                
+            # First line is the title
+            title = lines[0].strip()
+            
+            # Rest is content (details)
+            content_lines = lines[1:] if len(lines) > 1 else []
+            
+            # Create timeline entry
+            entry = {
+                'time': title,  # H3 title becomes timeline label
+                'main_content': '',  # No separate main content for H3 format
+                'details': content_lines # Pass raw lines to be processed by _process_timeline_details
+            }
+            
+            timeline_items.append(self._build_timeline_item(entry, 'h3'))
+        
+        # Generate final timeline HTML
+        final_timeline = f'<ul class="timeline">\n' + '\n'.join(timeline_items) + '\n</ul>'
+        if debug:
+            log.debug("✅ Generated H3 timeline", items=len(timeline_items))
+        return final_timeline
+        
+
+    def _build_timeline_item(self, entry, timeline_type='time'):
+        """
+        🆕 ENHANCED: Build individual timeline <li> item with support for new formats
+        """
+        time = entry['time']
+        main_content = entry['main_content']
+        details = entry['details']
+        
+        # Timeline ID จากเนื้อหารวมรายละเอียด (หัวข้อซ้ำ เช่น "ข้อมูลพื้นฐาน" ได้ id ต่างกัน)
+        # คงที่ข้าม build/process - block cache ใช้ HTML เดิมได้; scope ภาษา + section เติมตอนประกอบ section
+        digest = hashlib.md5('\n'.join([time, main_content, *details]).encode('utf-8')).hexdigest()[:8]
+        timeline_id = f"timeline-{timeline_type}-{digest}"
+        
+        # 🆕 Enhanced format handling for different timeline types
+        if timeline_type == 'range':
+            # Time range format: 09:30-12:00
+            item_html = f'<div class="timeline-main"><strong>{time}:</strong> {main_content}</div>'
+        elif timeline_type == 'location':
+            # Time with location: 09:30 (Tokyo Station)
+            item_html = f'<div class="timeline-main"><strong>{time}:</strong> {main_content}</div>'
+        elif timeline_type == 'text':
+            # Text-based time: Morning, Evening, etc.
+            item_html = f'<div class="timeline-main"><strong>{time}:</strong> {main_content}</div>'
+        elif timeline_type == 'time' and re.match(r'\d+:\d+', time):
+            # Standard time format: 09:00
+            item_html = f'<div class="timeline-main"><strong>{time}:</strong> {main_content}</div>'
+        elif timeline_type == 'h3':
+            # H3 format: just the title (no colon)
+            item_html = f'<div class="timeline-main"><strong>{time}</strong></div>'
+        else:
+            # Text format: ไฮไลต์ประจำวัน, ขั้นตอนที่ 1, etc.
+            item_html = f'<div class="timeline-main"><strong>{time}:</strong> {main_content}</div>'
+        
+        # Add button and detail div if there are details
+        if details:
+            # Process details (could be markdown-like)
+            details_html = self._process_timeline_details(details)
+            
+            item_html += f'''
+                <button class="timeline-toggle" onclick="toggleTimelineDetail('{timeline_id}')">
+                    <span class="th">รายละเอียด ▼</span>
+                    <span class="en">Details ▼</span>
+                </button>
+                <div class="timeline-detail" id="{timeline_id}" style="display: none;">
+                    {details_html}
+                </div>'''
+        
+        return f'                <li>\n                    {item_html}\n                </li>'
+
+    def _process_timeline_details(self, details):
+        """
+        Process timeline detail lines into proper HTML like template.html.old
+        🆕 v3.1 FIXED: Handles both old (emoji-based) and new (H3-based) detail formats.
+        - Emoji lines or **Bold** lines -> <h4>
+        - "- item" -> <ul><li>...</li></ul>
+        - Other lines -> <p> with inline formatting
+        """
+        html_parts = []
+        in_list = False
+
+        def close_list_if_open():
+            nonlocal in_list
+            if in_list:
+                html_parts.append('</ul>')
+                in_list = False
+
+        for detail_line in details:
+            stripped_line = detail_line.strip()
+            if not stripped_line:
+                continue
+
+            # Check for headers (Emoji or **Bold** lines)
+            # Added '📅' for check-in/out lines
+            emoji_header_pattern = r'^[🚊🎟️🎂📋🗺️🍽️🎪🛍️🏨🎯🚇🏃‍♂️💰🎌🎭🎨🎵🎮🏟️🎢🎡🎠🎈🎉🎊🎁🎀🎄🎃🍰🧁🍭🍬🍫🍩🍪🥧🍺🍻🥂🍾🍷🍸🍹🍴🥄🔸📍⭐🌟💫⚡🔥❄️🌸🌺🌻🌷🌹🏔️🗻🏕️🏞️🚲🚗🚕🚌🚎🏍️✈️🚁⛴️🚤⛵🎫💳💴💵💶💷🧾📅]'
+            bold_header_pattern = r'^\s*\*\*([^*]+)\*\*.*'
+            
+            if re.match(emoji_header_pattern, stripped_line) or re.match(bold_header_pattern, stripped_line):
+                close_list_if_open()
+                html_parts.append(f'<h4>{format_inline(stripped_line)}</h4>')
+            
+            # Check for list items
+            elif stripped_line.startswith('- '):
+                if not in_list:
+                    html_parts.append('<ul>')
+                    in_list = True
+                item_content = stripped_line[2:].strip()
+                html_parts.append(f'<li>{format_inline(item_content)}</li>')
+            
+            # Otherwise, it's a paragraph
+            else:
+                close_list_if_open()
+                html_parts.append(f'<p>{format_inline(stripped_line)}</p>')
+
+        # Close any open list at the end
+        close_list_if_open()
+        
+        return '\n                    '.join(html_parts)
+
+    def _process_table_block(self, table_md):
+        """
+        📊 Processes a Markdown table into HTML table with responsive wrapper
+        """
+        debug = log.debug_enabled
+        if debug:
+            log.debug("📊 Processing table block")
+        
+        lines = [line.strip() for line in table_md.strip().split('\n') if line.strip()]
+        if len(lines) < 2:
+            return table_md  # Not a valid table
+            
+        # Check if second line is separator
+        if not re.match(r'^\|\s*[-:]+\s*(\|\s*[-:]+\s*)*\|?\s*$', lines[1]):
+            return table_md  # Not a valid table
+        
+        # Extract headers
+        headers = [h.strip() for h in lines[0].strip('|').split('|')]
+        
+        # Extract rows
+        rows = []
+        for line in lines[2:]:
+            cells = [c.strip() for c in line.strip('|').split('|')]
+            rows.append(cells)
+        
+        # Generate HTML with responsive wrapper
+        html = Fragments('<div class="table-container">\n<table class="table">\n')
+        html.append('<thead><tr>' + ''.join(f'<th>{h}</th>' for h in headers) + '</tr></thead>\n')
+        html.append('<tbody>\n')
+        for row in rows:
+            html.append('<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>\n')
+        html.append('</tbody>\n</table>\n</div>')
+        
+        if debug:
+            log.debug("✅ Generated table", columns=len(headers), rows=len(rows))
+        return html.build()
+
+    def _process_infobox_block(self, box_md):
+        """
+        📦 Processes info/note box Markdown into collapsible HTML
+        """
+        debug = log.debug_enabled
+        if debug:
+            log.debug("📦 Processing info/note box")
+        
+        # Extract title and content
+        lines = box_md.strip().split('\n')
+        first_line = lines[0]
+        
+        # Extract box type and title from first line
+        title_match = re.match(r'^> \*\*(\w+):\*\*\s*(.*)', first_line)
+        if not title_match:
+            return box_md  # Invalid format
+        
+        box_type = title_match.group(1).lower()
+        title = title_match.group(2).strip()
+        
+        # Extract content (remove > prefix)
+        content_lines = []
+        for line in lines[1:]:
+            if line.startswith('> '):
+                content_lines.append(line[2:])
+            elif line.startswith('>'):
+                content_lines.append(line[1:])
+        
+        content_md = '\n'.join(content_lines).strip()
+        content_html = self._simple_markdown_to_html(content_md)
+        
+        # Determine box class based on type
+        box_class = "note-box" if "note" in box_type else "info-box"
+        toggle_class = "note-toggle" if "note" in box_type else "info-toggle"
+        detail_class = "note-detail" if "note" in box_type else "info-detail"
+        
+        html = f'''<div class="{box_class}">
+    <div class="{toggle_class}">
+        <span class="th">{title}</span>
+        <span class="en">{title}</span>
+    </div>
+    <div class="{detail_class}">
+        {content_html}
+    </div>
+</div>'''
+        
+        if debug:
+            log.debug("✅ Generated box", kind=box_type, title=title)
+        return html
+
+    def _simple_markdown_to_html(self, md):
+        """Simple markdown conversion for nested content (no complex blocks)"""
+        html = format_inline(md)
+        
+        # Simple paragraphs
+        paragraphs = html.split('\n\n')
+        processed = []
+        for p in paragraphs:
+            p = p.strip()
+            if p and not p.startswith('<'):
+                processed.append(f'<p>{p}</p>')
+            else:
+                processed.append(p)
+        
+        return '\n'.join(processed)
+
+    def _convert_simple_lists(self, text):
+        """
+        Convert simple lists (now safe from timeline interference)
+        This only processes basic "- item" lists, not timeline "- **time**: content"
+        🆕 v3.1: Enhanced pattern matching for better protection
+        """
+        # Skip lines that look like timeline entries
+        lines = text.split('\n')
+        processed_lines = []
+        
+        for line in lines:
+            # Skip placeholders
+            if '__PLACEHOLDER_' in line:
+                processed_lines.append(line)
+            # Skip ALL timeline patterns (time, highlight, step-based)
+            elif re.match(r'^\s*- \*\*[^*]+\*\*:', line):
+                processed_lines.append(line)
+            # Process simple list items
+            elif re.match(r'^\s*-\s+(?!\*\*)', line):
+                content = re.sub(r'^\s*-\s+', '', line)
+                processed_lines.append(f'<li>{content}</li>')
+            else:
+                processed_lines.append(line)
+        
+        text = '\n'.join(processed_lines)
+        
+        # Wrap consecutive <li> items in <ul>
+        text = wrap_list_items(text, self.regex_guard)
+        
+        return text
+
+    def _convert_paragraphs(self, text):
+        """
+        🆕 FIXED: Convert paragraphs with proper line break handling
+        แยกบรรทัดให้ถูกต้อง แทนที่จะรวมทุกอย่างใน <p> เดียว
+        """
+        # Split by double newlines to get paragraph blocks
+        blocks = text.split('\n\n')
+        result = []
+        
+        for block in blocks:
+            stripped_block = block.strip()
+            
+            # Skip if already HTML, header, placeholder, or empty
+            if (not stripped_block or 
+                stripped_block.startswith(('<', '#')) or 
+                '__PLACEHOLDER_' in stripped_block):
+                result.append(block)
+                continue
+            
+            # 🆕 FIXED: Process line by line within each block
+            lines = stripped_block.split('\n')
+            processed_lines = []
+            
+            for line in lines:
+                stripped_line = line.strip()
+                if not stripped_line:
+                    continue
+                    
+                # Skip lines that are already HTML or placeholders
+                if stripped_line.startswith('<') or '__PLACEHOLDER_' in stripped_line:
+                    processed_lines.append(line)
+                else:
+                    # 🆕 Check for special patterns that should be separate lines
+                    if re.match(r'\*\*[^*]+:\*\*', stripped_line):
+                        # **Label:** content - make it a separate formatted line
+                        formatted = re.sub(r'\*\*([^*]+):\*\*\s*(.*)', r'<p><strong>\1:</strong> \2</p>', stripped_line)
+                        processed_lines.append(formatted)
+                    elif stripped_line.startswith('- '):
+                        # List item - keep as is (will be processed by _convert_simple_lists)
+                        processed_lines.append(line)
+                    else:
+                        # Regular line - wrap in <p>
+                        processed_lines.append(f'<p>{stripped_line}</p>')
+            
+            if processed_lines:
+                result.append('\n'.join(processed_lines))
+            else:
+                result.append(block)
+        
+        return '\n\n'.join(result)
+        
+
+
+    def build_nav_section(self, content_data):
+        """สร้าง Navigation Cards แบบ Dynamic - 🆕 FIXED VERSION"""
+        print("🏗️ Building dynamic navigation section...")
+        nav_cards_html = Fragments()
+        
+        # หา day files (001-day1, 002-day2, etc.)
+        day_keys = sorted([k for k in content_data if re.match(r'^\d+-day\d+', k)])
+        
+        for key in day_keys:
+            content = content_data[key]
+            th_md = content.get('th', '')
+            en_md = content.get('en', th_md)
+            
+            # Extract H1 title for both languages
+            th_title_match = re.search(r'^# (.*)', th_md, re.MULTILINE)
+            en_title_match = re.search(r'^# (.*)', en_md, re.MULTILINE)
+            th_title = th_title_match.group(1).strip() if th_title_match else "Day N/A"
+            en_title = en_title_match.group(1).strip() if en_title_match else th_title
+
+            # Extract date (วันที่/Date pattern)
+            th_date_match = re.search(r'\*\*วันที่:\*\*\s*([^\n]+)', th_md)
+            en_date_match = re.search(r'\*\*Date:\*\*\s*([^\n]+)', en_md)
+            th_date = th_date_match.group(1).strip() if th_date_match else ""
+            en_date = en_date_match.group(1).strip() if en_date_match else th_date
+
+            # 🆕 FIXED: Extract and format description with line breaks and bold text
+            th_desc_html = self._extract_and_format_description(th_md)
+            en_desc_html = self._extract_and_format_description(en_md) if en_md != th_md else th_desc_html
+
+            section_id = self.get_section_id(key)
+            
+            # Special birthday badge for day 4
+            birthday_badge = '<div class="birthday-badge">🎂</div>' if 'day4' in key.lower() else ''
+
+            nav_cards_html.append(f'''
+            <a href="#{section_id}" class="nav-card">
+                {birthday_badge}
+                <h3><span class="th">{th_title}</span><span class="en">{en_title}</span></h3>
+                <div class="date"><span class="th">{th_date}</span><span class="en">{en_date}</span></div>
+                <div class="desc">
+                    <span class="th">{th_desc_html}</span>
+                    <span class="en">{en_desc_html}</span>
+                </div>
+            </a>''')
+
+        return f'''<div class="nav-section">
+            <h2><span class="th">ภาพรวมการเดินทาง</span><span class="en">Trip Overview</span></h2>
+            <div class="nav-grid">{nav_cards_html.build()}</div>
+        </div>'''        
+
+    def _extract_and_format_description(self, md_content):
+        """
+        🆕 NEW METHOD: Extract and format description for nav cards
+        - Convert **bold** to <strong>
+        - Convert - list items to <br>• format or remove
+        - Add line breaks between logical sections
+        """
+        if not md_content:
+            return "รายละเอียดการเดินทาง"
+        
+        # Try to find description patterns
+        description_lines = []
+        
+        # Look for **วันที่:**, **สถานที่:**, **ไฮไลต์:** patterns
+        lines = md_content.split('\n')
+        in_description_section = False
+        
+        for line in lines:
+            stripped = line.strip()
+            
+            # Skip headers and empty lines
+            if not stripped or stripped.startswith('#'):
+                continue
+                
+            # Check for description pattern lines
+            if re.match(r'\*\*[^*]+:\*\*', stripped):
+                # Convert **Label:** content to <strong>Label:</strong> content
+                formatted_line = re.sub(r'\*\*([^*]+):\*\*\s*(.*)', r'<strong>\1:</strong> \2', stripped)
+                description_lines.append(formatted_line)
+                in_description_section = True
+            elif stripped.startswith('- ') and len(description_lines) < 4:  # Limit list items
+                # Convert - item to bullet point
+                item_text = stripped[2:].strip()
+                # Process **bold** in list items
+                item_text = format_inline(item_text, em=False)
+                description_lines.append(f'• {item_text}')
+            elif in_description_section and len(stripped) > 20 and len(description_lines) < 3:
+                # Regular description line
+                formatted_line = format_inline(stripped, em=False)
+                description_lines.append(formatted_line)
+        
+        # If no structured description found, extract first meaningful paragraph
+        if not description_lines:
+            for line in lines:
+                stripped = line.strip()
+                if len(stripped) > 30 and not stripped.startswith(('#', '*', '-', '>')):
+                    formatted_line = format_inline(stripped, em=False)
+                    description_lines.append(formatted_line)
+                    break
+        
+        # Join with line breaks (limit to 3 lines for nav card)
+        result = '<br>'.join(description_lines[:3])
+        return result if result else "รายละเอียดการเดินทาง"
+
+    def build_content_sections(self, content_data):
+        """สร้าง Content Sections ทั้งหมด"""
+        print("🏗️ Building content sections...")
+        sections_html = Fragments()
+        
+        for file_key in sorted(content_data.keys()):
+            content = content_data[file_key]
+            section_id = self.get_section_id(file_key)
+
+            # Extract H1 title to use in the section header
+            th_h1_match = re.search(r'^# (.*)', content['th'], re.MULTILINE)
+            en_h1_match = re.search(r'^# (.*)', content['en'], re.MULTILINE) if content['en'] else None
+            
+            th_h1 = th_h1_match.group(1).strip() if th_h1_match else section_id.replace('-', ' ').title()
+            en_h1 = en_h1_match.group(1).strip() if en_h1_match else th_h1
+
+            # Remove H1 from content before parsing the rest
+            th_raw = re.sub(r'^# .*', '', content['th'], count=1, flags=re.MULTILINE)
+            en_raw = re.sub(r'^# .*', '', content['en'], count=1, flags=re.MULTILINE) if content['en'] else th_raw
+            th_body = th_raw.strip()
+            en_body = en_raw.strip() if content['en'] else th_body
+
+            # Source maps: บรรทัดแรกของ body = 1 + จำนวนบรรทัดว่างที่ strip() ตัดออก (บรรทัด H1 ยังนับอยู่)
+            th_source = en_source = None
+            if self.source_maps:
+                th_source = (f"th/{file_key}.md", self._first_body_line(th_raw))
+                en_source = (f"en/{file_key}.md", self._first_body_line(en_raw)) if content['en'] else th_source
+
+            # Convert to HTML using the fixed markdown processor
+            print(f"   🔧 Processing content for section: {section_id}")
+            with self.profiler.span('markdown_to_html', file=file_key):
+                th_html = self.markdown_to_html(th_body, *(th_source or ()))
+                en_html = self.markdown_to_html(en_body, *(en_source or ())) if en_body != th_body else th_html
+
+            # สำเนา th/en (รวม en ที่ใช้ HTML ของ th) ได้ timeline id คนละชุด
+            th_html = self._scope_timeline_ids(th_html, f"th-{section_id}")
+            en_html = self._scope_timeline_ids(en_html, f"en-{section_id}")
+
+            sections_html.append(f'''
+            <div class="content-section" id="{section_id}">
+                <h1><span class="th">{th_h1}</span><span class="en">{en_h1}</span></h1>
+                <div class="th">{th_html}</div>
+                <div class="en" style="display:none;">{en_html}</div>
+            </div>''')
+            
+        print(f"   ✅ Generated {len(content_data)} content sections")
+        return sections_html.build()
+
+    def _scope_timeline_ids(self, html, scope):
+        """'timeline-h3-1a2b3c4d' -> '{scope}-timeline-h3-1a2b3c4d' ทั้ง id และ toggleTimelineDetail(...)"""
+        return TIMELINE_ID_PATTERN.sub(lambda match: f"{match.group(1)}{scope}-timeline-", html)
+
+    def _first_body_line(self, raw_body):
+        """เลขบรรทัด (1-based) ของตัวอักษรแรกหลัง strip()"""
+        return raw_body[:len(raw_body) - len(raw_body.lstrip())].count('\n') + 1
+
+    def get_section_id(self, file_key):
+        """สร้าง section ID จากชื่อไฟล์ (เช่น '001-overview' -> 'overview')"""
+        return re.sub(r'^\d+-', '', file_key)
+
+    def write_source_map(self, output_path):
+        """
+        เขียน sidecar source map (<output>.srcmap.json) - complex block ตามลำดับที่ถูก process
+        แต่ละ block หาใน HTML ได้จาก attribute data-src ที่มีค่าเดียวกัน
+        """
+        source_map_path = output_path.with_suffix('.srcmap.json')
+        payload = {
+            'version': 1,
+            'file': output_path.name,
+            'content_dir': str(self.content_dir),
+            'blocks': self.source_map,
+        }
+        with open(source_map_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        return source_map_path
+
+    def generate(self, output_filename=None):
+        """
+        สร้างไฟล์ HTML ตัวเต็ม (output_filename=None -> ชื่อไฟล์ตาม timestamp)
+        Returns: Path ของไฟล์ที่เขียน หรือ None ถ้า build ไม่สำเร็จ
+        """
+        self._prepare_build()
+        print("\n🚀 Starting HTML generation process...")
+        self.source_map = []
+        self.block_cache.begin_build()
+
+        # Read skeleton template
+        template_html = self.get_skeleton_template()
+        if not template_html:
+            print("❌ Cannot proceed without skeleton template.")
+            return
+
+        # Read all content files
+        content_data = self.get_content_data()
+        if not content_data:
+            print("❌ No content found. Aborting.")
+            return
+
+        # Build components
+        with self.profiler.span('build_nav_section'):
+            nav_section = self.build_nav_section(content_data)
+        with self.profiler.span('build_content_sections'):
+            content_sections = self.build_content_sections(content_data)
+        with self.profiler.span('route_graph'):
+            route_graph = self.block_cache.render('route_graph', route_graph_source(content_data),
+                                                  lambda _, data: build_route_graph(data), content_data)
+        self.block_cache.end_build()
+        if route_graph.legs or route_graph.totals:
+            print_route_report(route_graph)
+
+        # Replace placeholders in template
+        with self.profiler.span('template_assembly'):
+            final_html = Fragments.from_template(template_html, {
+                '{{NAV_SECTION_PLACEHOLDER}}': nav_section,
+                '{{CONTENT_SECTIONS_PLACEHOLDER}}': content_sections,
+            })
+
+        # Generate output filename with timestamp
+        if output_filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            output_filename = f"{self.output_prefix}-{timestamp}.html"
+        output_path = self.build_dir / output_filename
+
+        # Write final HTML file
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                final_html.write_to(f)
+            file_size = output_path.stat().st_size
+            print("\n🎉 HTML generation complete!")
+            print(f"   - File: {output_filename}")
+            print(f"   - Path: {output_path}")
+            print(f"   - Size: {file_size / 1024:.2f} KB")
+            print(f"   - Block cache: {self.block_cache.hits} hits, {self.block_cache.misses} rendered")
+            anchors = check_anchors(output_path)
+            print(f"   - Anchors: {'✅' if anchors.ok else '❌'} {anchors.summary()}"
+                  f"{'' if anchors.ok else ' - python -m tokyo_trip check-anchors'}")
+            if self.source_maps:
+                source_map_path = self.write_source_map(output_path)
+                print(f"   - Source map: {source_map_path.name} ({len(self.source_map)} blocks)")
+            if self.emit_data:
+                with self.profiler.span('write_trip_data'):
+                    data_path, index_path = write_trip_data(content_data, output_path)
+                print(f"   - Trip data: {data_path.name} ({data_path.stat().st_size / 1024:.1f} KB) + {index_path.name}")
+            print("\n🔥 Fixed Issues in v3.1:")
+            print("   ✅ Double Processing eliminated with Placeholder Strategy")
+            print("   ✅ Timeline structure preserved correctly") 
+            print("   ✅ Table and Info boxes protected from interference")
+            print("   ✅ Section markers (--- และ ```) cleaned up properly")
+            print("   ✅ Multiple Timeline Formats supported:")
+            print("       - ⏰ Time-based: - **HH:MM**: content")
+            print("       - 🌟 Highlight: - **ไฮไลต์**: content") 
+            print("       - 📋 Step: - **ขั้นตอน**: content")
+            print("   ✅ Enhanced emoji detection for timeline details")
+            print("   ✅ Improved regex patterns for better accuracy")
+            
+        except Exception as e:
+            print(f"❌ Error writing final HTML file: {e}")
+            output_path = None
+
+        self.profiler.finish(self.build_dir / "report-trip.json", generator="trip")
+        return output_path
+
+def main(profile=False, trace_memory=True, verbosity=0, log_json=False, source_maps=False):
+    """Main function to run the generator."""
+    configure_logging(verbosity, log_json)
+    print("🎌 Tokyo Trip Generator v3.1 - Multi-Timeline & Section Fix")
+    print("=" * 70)
+    print("🆕 New Features:")
+    print("   - Multiple Timeline Format Support")
+    print("   - Section Marker Cleanup (--- และ ```)")
+    print("   - Enhanced Emoji Detection")
+    print("   - Better Error Handling")
+    print("   - Improved Regex Patterns")
+    print("=" * 70)
+    generator = TokyoTripGeneratorV3()
+    generator.profiler.enabled = profile
+    generator.profiler.trace_memory = trace_memory
+    generator.source_maps = source_maps
+    generator.generate()
+
+def watch(interval=0.5, verbosity=0, log_json=False, source_maps=False):
+    """
+    Watch mode: build ใหม่ทุกครั้งที่ไฟล์ใน content/ หรือ template เปลี่ยน (Ctrl+C เพื่อหยุด)
+    ใช้ generator ตัวเดิมตลอด - block cache อุ่นอยู่ แก้ timeline entry เดียว render ใหม่แค่ block นั้น
+    """
+    configure_logging(verbosity, log_json)
+    generator = TokyoTripGeneratorV3()
+    generator.source_maps = source_maps
+    output_filename = WATCH_OUTPUT_FILENAME
+
+    def snapshot():
+        files = list(generator.content_dir.glob("*/*.md")) + [generator.template_path]
+        return {path: path.stat().st_mtime_ns for path in files if path.exists()}
+
+    generator.generate(output_filename)
+    state = snapshot()
+    print(f"\n👀 Watching {len(state)} files (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            if current == state:
+                continue
+            changed = sorted(path.name for path in current.keys() | state.keys()
+                             if current.get(path) != state.get(path))
+            state = current
+            start = time.perf_counter()
+            generator.generate(output_filename)
+            print(f"\n🔁 Rebuilt in {(time.perf_counter() - start) * 1000:.1f} ms ({', '.join(changed)})")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
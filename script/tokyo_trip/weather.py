@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Day Range Index (012-weather)
+=============================
+หัวข้อการแต่งตัวใน 012-weather.md ครอบคลุมเป็นช่วงวัน เช่น "### 📅 วันที่ 3-5: Kawaguchiko (ภูเขา)"
+สร้าง interval index ครั้งเดียวตอน build: ช่วงเรียงตามวันเริ่ม -> หา section ของแต่ละวันด้วย
+binary search (O(log n) ต่อวัน ไม่ต้อง scan ไฟล์ weather ใหม่ทุก day card)
+
+ช่วงที่ซ้อนกันถือว่าช่วงที่เริ่มทีหลังชนะ (วันที่อยู่ในทั้งสองช่วงได้ section ที่ใกล้กว่า) - รวมถึงช่วงที่อยู่ข้างใน
+ช่วงอื่น เช่น 1-8 กับ 3-4: วัน 3-4 ได้ 3-4, วัน 1-2 และ 5-8 ได้ 1-8
+
+ใช้งาน:
+    index = build_clothing_index(generator._split_h3_sections(weather_md))
+    heading, body = index.lookup(4)    # -> ('📅 วันที่ 3-5: Kawaguchiko (ภูเขา)', '**เสื้อผ้าแนะนำ:** ...')
+"""
+
+import re
+import bisect
+
+# "📅 วันที่ 3-5: Kawaguchiko (ภูเขา)", "📅 วันที่ 6: Gala Yuzawa (เล่นหิมะ)"
+DAY_RANGE_HEADING_PATTERN = re.compile(r'^📅\s*วันที่\s*(\d+)(?:\s*-\s*(\d+))?\s*:')
+
+
+class DayRangeIndex:
+    """
+    ช่วงวัน [start, end] -> value
+    ตอน lookup ครั้งแรกหลัง add: แตกช่วงทั้งหมดเป็น segment ที่ไม่ซ้อนกัน (ช่วงที่เริ่มทีหลังชนะ,
+    เริ่มวันเดียวกัน = ช่วงที่เพิ่มทีหลังชนะ) แล้ว lookup ด้วย bisect บนวันเริ่มของ segment
+    """
+
+    def __init__(self):
+        self._ranges = []
+        self._starts = None
+        self._segments = None
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def add(self, start, end, value):
+        """เพิ่มช่วง (ลำดับการเพิ่มไม่สำคัญ ยกเว้นช่วงที่เริ่มวันเดียวกัน)"""
+        self._ranges.append((start, end, len(self._ranges), value))
+        self._starts = self._segments = None
+
+    def _build(self):
+        """[(start, end, value), ...] ที่ไม่ซ้อนกัน เรียงตาม start"""
+        boundaries = sorted({start for start, _, _, _ in self._ranges} | {end + 1 for _, end, _, _ in self._ranges})
+        segments = []
+        for seg_start, next_start in zip(boundaries, boundaries[1:]):
+            covering = [item for item in self._ranges if item[0] <= seg_start and next_start - 1 <= item[1]]
+            if not covering:
+                continue
+            value = max(covering, key=lambda item: (item[0], item[2]))[3]
+            if segments and segments[-1][1] == seg_start - 1 and segments[-1][2] is value:
+                segments[-1] = (segments[-1][0], next_start - 1, value)
+            else:
+                segments.append((seg_start, next_start - 1, value))
+        self._segments = segments
+        self._starts = [start for start, _, _ in segments]
+
+    def lookup(self, day):
+        """value ของช่วงที่ครอบวัน day (ไม่มี = None)"""
+        if self._segments is None:
+            self._build()
+        position = bisect.bisect_right(self._starts, day) - 1
+        if position < 0:
+            return None
+        start, end, value = self._segments[position]
+        return value if start <= day <= end else None
+
+    @property
+    def days(self):
+        """(วันแรก, วันสุดท้าย) ที่ index ครอบคลุม (ว่าง = None)"""
+        if not self._ranges:
+            return None
+        return min(start for start, _, _, _ in self._ranges), max(end for _, end, _, _ in self._ranges)
+
+
+def build_clothing_index(sections):
+    """list ของ (heading, body) จาก ### sections -> DayRangeIndex ของหัวข้อ "📅 วันที่ N-M:" """
+    index = DayRangeIndex()
+    for heading, body in sections:
+        match = DAY_RANGE_HEADING_PATTERN.match(heading)
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+            index.add(min(start, end), max(start, end), (heading, body))
+    return index